@@ -0,0 +1,181 @@
+"""
+Animasi Keyframe Transformasi 2D.
+
+Parameter transformasi (translasi, rotasi, skala, shear) diinterpolasi antar
+keyframe dalam bentuk terdekomposisi, bukan elemen matriks, sehingga rotasi
+tetap rotasi sepanjang animasi (interpolasi elemen matriks membuat bentuk
+mengecil/ter-shear di tengah rotasi). Seluruh frame untuk satu bentuk dihitung
+sekaligus menjadi array (frames, N, 2), siap diberikan ke frame animasi Plotly.
+"""
+
+import numpy as np
+from typing import Dict, List, Sequence, Tuple
+
+from config import ANIMATION_FPS, ANIMATION_DURATION
+
+# Parameter keyframe terdekomposisi: M = T(tx, ty) × R(angle) × Shear(shear) × S(sx, sy)
+KEYFRAME_PARAMS = ("tx", "ty", "angle", "sx", "sy", "shear")
+IDENTITY_PARAMS = {"tx": 0.0, "ty": 0.0, "angle": 0.0, "sx": 1.0, "sy": 1.0, "shear": 0.0}
+
+EASING_FUNCTIONS = {
+    "linear": lambda t: t,
+    "ease_in": lambda t: t * t,
+    "ease_out": lambda t: t * (2.0 - t),
+    "ease_in_out": lambda t: t * t * (3.0 - 2.0 * t),
+}
+
+# --- Dekomposisi ---------------------------------------------------------------
+
+def decompose_transformation(matrix: np.ndarray, pivot: Tuple[float, float] = (0.0, 0.0)) -> Dict[str, float]:
+    """
+    Mendekomposisi matriks affine 3x3 menjadi parameter keyframe.
+
+    Bagian linear L ditulis sebagai R(angle) × [[1, shear], [0, 1]] × S(sx, sy)
+    (dekomposisi QR), translasi diukur relatif terhadap pivot:
+    M·p = L·(p - pivot) + pivot + (tx, ty). Refleksi muncul sebagai sy < 0.
+
+    Args:
+        matrix: Matriks transformasi affine 3x3
+        pivot: Titik pusat rotasi/skala saat animasi
+
+    Returns:
+        Dict parameter (lihat KEYFRAME_PARAMS), sudut dalam derajat
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    (a, b, c), (d, e, f) = matrix[:2].tolist()
+    px, py = pivot
+
+    sx = float(np.hypot(a, d))
+    angle = float(np.arctan2(d, a)) if sx > 0 else 0.0
+    cos_a, sin_a = np.cos(angle), np.sin(angle)
+    # R^T × L = [[sx, shear * sy], [0, sy]]
+    sy = float(-sin_a * b + cos_a * e)
+    shear_sy = float(cos_a * b + sin_a * e)
+    return {
+        "tx": a * px + b * py + c - px,
+        "ty": d * px + e * py + f - py,
+        "angle": float(np.degrees(angle)),
+        "sx": sx,
+        "sy": sy,
+        "shear": shear_sy / sy if sy != 0 else 0.0,
+    }
+
+# --- Interpolasi ---------------------------------------------------------------
+
+def frame_times(fps: int = ANIMATION_FPS, duration_ms: int = ANIMATION_DURATION) -> np.ndarray:
+    """Waktu normalisasi [0, 1] setiap frame, termasuk frame awal dan akhir."""
+    if fps <= 0 or duration_ms <= 0:
+        raise ValueError("fps dan durasi harus positif")
+    frame_count = max(2, int(round(fps * duration_ms / 1000.0)) + 1)
+    return np.linspace(0.0, 1.0, frame_count)
+
+def interpolate_keyframes(
+    keyframes: Sequence[Dict[str, float]],
+    times: np.ndarray,
+    easing: str = "ease_in_out"
+) -> Dict[str, np.ndarray]:
+    """
+    Menginterpolasi parameter keyframe untuk seluruh array waktu sekaligus.
+
+    Complexity:
+        Time: O(F log K) untuk F waktu dan K keyframe
+        Space: O(F)
+
+    Args:
+        keyframes: Daftar dict dengan 'time' (0..1, naik) dan parameter dari
+            KEYFRAME_PARAMS; parameter yang tidak ada bernilai identitas.
+            Sudut tidak di-wrap, jadi 0 -> 360 berarti satu putaran penuh.
+        times: Array waktu normalisasi (F,)
+        easing: Nama fungsi easing per segmen (lihat EASING_FUNCTIONS)
+
+    Returns:
+        Dict nama parameter -> array (F,)
+    """
+    if not keyframes:
+        raise ValueError("Minimal satu keyframe diperlukan")
+    if easing not in EASING_FUNCTIONS:
+        raise ValueError(f"Easing tidak dikenal: {easing}")
+
+    key_times = np.array([k.get("time", 0.0) for k in keyframes], dtype=float)
+    if np.any(np.diff(key_times) < 0):
+        raise ValueError("Waktu keyframe harus terurut naik")
+    values = np.array([[k.get(name, IDENTITY_PARAMS[name]) for name in KEYFRAME_PARAMS]
+                       for k in keyframes], dtype=float)
+
+    times = np.clip(np.asarray(times, dtype=float), key_times[0], key_times[-1])
+    if len(keyframes) == 1:
+        return {name: np.full(times.shape, values[0, i]) for i, name in enumerate(KEYFRAME_PARAMS)}
+
+    # Segmen [k, k + 1] untuk setiap waktu, lalu posisi lokal yang di-easing
+    segment = np.clip(np.searchsorted(key_times, times, side="right") - 1, 0, len(keyframes) - 2)
+    start, end = key_times[segment], key_times[segment + 1]
+    span = end - start
+    local = np.divide(times - start, span, out=np.ones_like(times), where=span > 0)
+    weight = EASING_FUNCTIONS[easing](local)[:, None]
+
+    interpolated = values[segment] + (values[segment + 1] - values[segment]) * weight
+    return {name: interpolated[:, i] for i, name in enumerate(KEYFRAME_PARAMS)}
+
+def compose_frame_matrices(params: Dict[str, np.ndarray], pivot: Tuple[float, float] = (0.0, 0.0)) -> np.ndarray:
+    """
+    Menyusun stack matriks (F, 3, 3) dari parameter hasil interpolasi.
+
+    Kebalikan dari `decompose_transformation`: M = T(pivot + t) × L × T(-pivot).
+    """
+    angle = np.radians(params["angle"])
+    cos_a, sin_a = np.cos(angle), np.sin(angle)
+    sx, sy, shear = params["sx"], params["sy"], params["shear"]
+
+    matrices = np.zeros((len(angle), 3, 3))
+    # L = R × [[1, shear], [0, 1]] × S
+    matrices[:, 0, 0] = cos_a * sx
+    matrices[:, 0, 1] = (cos_a * shear - sin_a) * sy
+    matrices[:, 1, 0] = sin_a * sx
+    matrices[:, 1, 1] = (sin_a * shear + cos_a) * sy
+    matrices[:, 2, 2] = 1.0
+
+    pivot = np.asarray(pivot, dtype=float)
+    linear_pivot = matrices[:, :2, :2] @ pivot
+    matrices[:, 0, 2] = params["tx"] + pivot[0] - linear_pivot[:, 0]
+    matrices[:, 1, 2] = params["ty"] + pivot[1] - linear_pivot[:, 1]
+    return matrices
+
+# --- Frame Buffer --------------------------------------------------------------
+
+def precompute_frames(
+    points: np.ndarray,
+    keyframes: Sequence[Dict[str, float]],
+    fps: int = ANIMATION_FPS,
+    duration_ms: int = ANIMATION_DURATION,
+    pivot: Tuple[float, float] = (0.0, 0.0),
+    easing: str = "ease_in_out"
+) -> np.ndarray:
+    """
+    Menghitung posisi bentuk di setiap frame animasi sekaligus.
+
+    Complexity:
+        Time: O(F * N), satu batched matmul (F, N, 2) x (F, 2, 2)
+        Space: O(F * N)
+
+    Args:
+        points: Titik bentuk (N, 2)
+        keyframes: Keyframe (lihat `interpolate_keyframes`)
+        fps: Frame per detik
+        duration_ms: Durasi animasi dalam milidetik
+        pivot: Pusat rotasi/skala
+        easing: Nama fungsi easing
+
+    Returns:
+        Array (frames, N, 2) float64
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    params = interpolate_keyframes(keyframes, frame_times(fps, duration_ms), easing)
+    matrices = compose_frame_matrices(params, pivot)
+
+    frames = np.matmul(points, matrices[:, :2, :2].transpose(0, 2, 1))
+    frames += matrices[:, None, :2, 2]
+    return frames
+
+def transition_keyframes(matrix: np.ndarray, pivot: Tuple[float, float] = (0.0, 0.0)) -> List[Dict[str, float]]:
+    """Dua keyframe: identitas di t=0 dan `matrix` (terdekomposisi) di t=1."""
+    return [dict(IDENTITY_PARAMS, time=0.0), dict(decompose_transformation(matrix, pivot), time=1.0)]
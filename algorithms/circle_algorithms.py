@@ -2,25 +2,30 @@
 Implementasi Algoritma Penggambaran Lingkaran.
 
 Berisi implementasi dari algoritma Lingkaran Midpoint (juga dikenal sebagai
-varian dari algoritma Bresenham untuk lingkaran).
+varian dari algoritma Bresenham untuk lingkaran), beserta mode streaming
+(generator dan penggambaran langsung ke framebuffer) untuk jari-jari besar.
 """
 
-from typing import List, Tuple, Dict, Any
-from utils.helpers import performance_tracker
+import numpy as np
+from typing import List, Tuple, Iterator
+from utils.performance import performance_tracker
+from algorithms.framebuffer import DEFAULT_CHUNK_SIZE, Color, chunk_points, plot_chunk
 
 Point = Tuple[int, int]
 
-def _plot_circle_points(xc: int, yc: int, x: int, y: int, pixels: List[Point], op_counter: Dict[str, int]):
+def _plot_circle_points(xc: int, yc: int, x: int, y: int, pixels: List[Point]) -> int:
     """
     Mencerminkan titik-titik di 8 oktan lingkaran.
+
+    Returns:
+        int: Jumlah operasi yang dilakukan.
     """
     points_to_add = [
         (xc + x, yc + y), (xc - x, yc + y), (xc + x, yc - y), (xc - x, yc - y),
         (xc + y, yc + x), (xc - y, yc + x), (xc + y, yc - x), (xc - y, yc - x)
     ]
     pixels.extend(points_to_add)
-    op_counter['count'] += 16 # 8 penambahan/pengurangan * 2
-    op_counter['count'] += 1  # 1 extend call
+    return 16 + 1 # 8 penambahan/pengurangan * 2, 1 extend call
 
 @performance_tracker
 def midpoint_circle(xc: int, yc: int, r: int, **kwargs) -> List[Point]:
@@ -48,27 +53,109 @@ def midpoint_circle(xc: int, yc: int, r: int, **kwargs) -> List[Point]:
     x = 0
     y = r
     p = 1 - r  # Parameter keputusan awal
-    op_counter['count'] += 1 # 1 pengurangan
+    ops = 1 # 1 pengurangan; penghitung lokal, ditulis ke op_counter di akhir
 
     # Plot titik awal di setiap oktan
-    _plot_circle_points(xc, yc, x, y, pixels, op_counter)
+    ops += _plot_circle_points(xc, yc, x, y, pixels)
 
     while x < y:
         x += 1
-        op_counter['count'] += 1 # 1 penambahan
+        ops += 1 # 1 penambahan
 
         if p < 0:
             p += 2 * x + 1
-            op_counter['count'] += 3 # 1 perkalian, 2 penambahan
+            ops += 3 # 1 perkalian, 2 penambahan
         else:
             y -= 1
             p += 2 * (x - y) + 1
-            op_counter['count'] += 5 # 1 pengurangan, 1 perkalian, 2 penambahan, 1 pengurangan
+            ops += 5 # 1 pengurangan, 1 perkalian, 2 penambahan, 1 pengurangan
 
-        _plot_circle_points(xc, yc, x, y, pixels, op_counter)
+        ops += _plot_circle_points(xc, yc, x, y, pixels)
 
+    op_counter['count'] += ops
     return list(set(pixels)) # Hapus duplikat jika ada
 
 # Algoritma Bresenham untuk lingkaran pada dasarnya identik dengan Midpoint
 # jadi kita bisa membuat alias atau wrapper jika diperlukan.
 bresenham_circle = midpoint_circle
+
+
+# --- Versi Streaming (Generator & Framebuffer) ---------------------------------
+
+def iter_midpoint_circle(xc: int, yc: int, r: int) -> Iterator[Point]:
+    """
+    Generator piksel lingkaran Midpoint tanpa duplikat.
+
+    Himpunan piksel yang dihasilkan sama dengan `midpoint_circle`. Duplikat
+    hanya mungkin muncul di dalam satu langkah (x = 0 atau x = y) atau antara
+    dua langkah berurutan saat oktan bersilangan, sehingga cukup menyimpan
+    himpunan 8 titik dari langkah sebelumnya.
+
+    Complexity:
+        Time: O(r)
+        Space: O(1)
+    """
+    if r <= 0:
+        return
+
+    x = 0
+    y = r
+    p = 1 - r
+    previous = set()
+
+    while True:
+        current = {
+            (xc + x, yc + y), (xc - x, yc + y), (xc + x, yc - y), (xc - x, yc - y),
+            (xc + y, yc + x), (xc - y, yc + x), (xc + y, yc - x), (xc - y, yc - x)
+        }
+        for point in current - previous:
+            yield point
+        previous = current
+
+        if not x < y:
+            break
+
+        x += 1
+        if p < 0:
+            p += 2 * x + 1
+        else:
+            y -= 1
+            p += 2 * (x - y) + 1
+
+def iter_circle_chunks(xc: int, yc: int, r: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """
+    Menghasilkan piksel lingkaran sebagai chunk array int32 (k, 2), k <= chunk_size.
+    """
+    return chunk_points(iter_midpoint_circle(xc, yc, r), chunk_size)
+
+@performance_tracker
+def draw_circle_into(
+    framebuffer: np.ndarray,
+    xc: int, yc: int, r: int,
+    color: Color,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs
+) -> int:
+    """
+    Menggambar lingkaran Midpoint langsung ke framebuffer tanpa membuat list piksel.
+
+    Args:
+        framebuffer (np.ndarray): Array (H, W) atau (H, W, C) yang diubah in-place.
+        xc, yc (int): Koordinat pusat lingkaran.
+        r (int): Jari-jari lingkaran.
+        color (Color): Nilai piksel yang ditulis.
+        chunk_size (int): Jumlah maksimum piksel per chunk.
+        **kwargs: Digunakan untuk menerima 'operation_counter'.
+
+    Returns:
+        int: Jumlah piksel lingkaran yang dihasilkan algoritma.
+    """
+    op_counter = kwargs.get('operation_counter', {'count': 0})
+
+    total = 0
+    for chunk in iter_circle_chunks(xc, yc, r, chunk_size):
+        plot_chunk(framebuffer, chunk, color)
+        total += len(chunk)
+        op_counter['count'] += len(chunk) * 3 # ~(16 + 5) operasi per 8 titik
+
+    return total
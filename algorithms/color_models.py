@@ -145,3 +145,63 @@ def calculate_phong_lighting(
     final_color = np.clip(final_color, 0, 255)
 
     return tuple(final_color.astype(int))
+
+def _dot3(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Dot product per baris untuk array (..., 3), dijumlah berurutan x, y, z."""
+    return a[..., 0] * b[..., 0] + a[..., 1] * b[..., 1] + a[..., 2] * b[..., 2]
+
+def _normalize3(v: np.ndarray) -> np.ndarray:
+    """Menormalisasi setiap vektor (..., 3)."""
+    return v / np.sqrt(_dot3(v, v))[..., None]
+
+def calculate_phong_lighting_batch(
+    light_color: RGB,
+    light_position: Vector3D,
+    camera_position: Vector3D,
+    point_positions: np.ndarray,
+    point_normals: np.ndarray,
+    material: dict
+) -> np.ndarray:
+    """
+    Versi tervektorisasi dari `calculate_phong_lighting` untuk N titik sekaligus.
+
+    Posisi cahaya dan kamera (3,) di-broadcast ke semua titik (boleh juga
+    berbentuk (N, 3)). Urutan operasi floating-point sama dengan versi skalar,
+    sehingga setiap warna identik dengan hasil pemanggilan per titik.
+
+    Complexity:
+        Time: O(N)
+        Space: O(N)
+
+    Args:
+        light_color (RGB): Warna cahaya (intensitas per komponen R,G,B).
+        light_position (Vector3D): Posisi sumber cahaya, (3,) atau (N, 3).
+        camera_position (Vector3D): Posisi kamera/pengamat, (3,) atau (N, 3).
+        point_positions (np.ndarray): Posisi titik, (N, 3).
+        point_normals (np.ndarray): Vektor normal titik, (N, 3).
+        material (dict): Properti material objek berisi ka, kd, ks, shininess.
+
+    Returns:
+        np.ndarray: Array uint8 (N, 3) berisi warna (R, G, B) setiap titik.
+    """
+    positions = np.asarray(point_positions, dtype=float).reshape(-1, 3)
+    normals = _normalize3(np.asarray(point_normals, dtype=float).reshape(-1, 3))
+    light_dir = _normalize3(np.asarray(light_position, dtype=float) - positions)
+    view_dir = _normalize3(np.asarray(camera_position, dtype=float) - positions)
+    light = np.asarray(light_color, dtype=float)
+
+    # 1. Komponen Ambient
+    ambient = material['ka'] * light
+
+    # 2. Komponen Diffuse
+    n_dot_l = _dot3(normals, light_dir)
+    diffuse_intensity = np.maximum(n_dot_l, 0.0)
+    diffuse = (material['kd'] * diffuse_intensity)[:, None] * light
+
+    # 3. Komponen Specular
+    reflection_dir = (2 * n_dot_l)[:, None] * normals - light_dir
+    specular_intensity = np.maximum(_dot3(view_dir, reflection_dir), 0.0) ** material['shininess']
+    specular = (material['ks'] * specular_intensity)[:, None] * light
+
+    final_color = np.clip(ambient + diffuse + specular, 0, 255)
+    return final_color.astype(np.uint8)
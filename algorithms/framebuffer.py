@@ -0,0 +1,61 @@
+"""
+Utilitas Framebuffer untuk Rasterisasi Streaming.
+
+Berisi fungsi-fungsi bantuan untuk mengelompokkan piksel dari generator
+menjadi chunk NumPy berukuran tetap dan menggambar chunk tersebut langsung
+ke array framebuffer, tanpa pernah membuat list piksel secara utuh.
+"""
+
+import numpy as np
+from typing import Iterable, Iterator, Tuple, Union
+
+Point = Tuple[int, int]
+Color = Union[int, Tuple[int, ...]]
+
+DEFAULT_CHUNK_SIZE = 4096
+
+def chunk_points(points: Iterable[Point], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """
+    Mengelompokkan aliran titik (x, y) menjadi array int32 (k, 2) dengan k <= chunk_size.
+
+    Memori yang dipakai dibatasi oleh chunk_size, berapapun jumlah titiknya.
+
+    Args:
+        points (Iterable[Point]): Aliran titik, misalnya dari generator rasterisasi.
+        chunk_size (int): Jumlah maksimum titik per chunk.
+
+    Yields:
+        np.ndarray: Array int32 berbentuk (k, 2) berisi kolom x dan y.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size harus lebih besar dari 0")
+
+    buffer = np.empty((chunk_size, 2), dtype=np.int32)
+    n = 0
+    for point in points:
+        buffer[n] = point
+        n += 1
+        if n == chunk_size:
+            yield buffer.copy()
+            n = 0
+    if n:
+        yield buffer[:n].copy()
+
+def plot_chunk(framebuffer: np.ndarray, chunk: np.ndarray, color: Color) -> int:
+    """
+    Menggambar satu chunk piksel ke framebuffer; piksel di luar batas diabaikan.
+
+    Args:
+        framebuffer (np.ndarray): Array (H, W) atau (H, W, C) yang diubah in-place.
+        chunk (np.ndarray): Array (k, 2) berisi koordinat (x, y).
+        color (Color): Nilai piksel (skalar atau tuple per kanal).
+
+    Returns:
+        int: Jumlah piksel yang benar-benar ditulis ke framebuffer.
+    """
+    height, width = framebuffer.shape[:2]
+    x = chunk[:, 0]
+    y = chunk[:, 1]
+    inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    framebuffer[y[inside], x[inside]] = color
+    return int(np.count_nonzero(inside))
@@ -0,0 +1,199 @@
+"""
+Mesin Pencahayaan Multi-Cahaya dan Multi-Material.
+
+Memperluas model Phong di `algorithms.color_models` ke banyak sumber cahaya
+(point, directional, spot dengan atenuasi) dan banyak material sekaligus.
+Semua kombinasi (cahaya x titik) dievaluasi dalam satu operasi NumPy
+ter-broadcast, tanpa loop Python atas cahaya maupun titik.
+
+Cahaya dan material ditulis sebagai dict seperti `material` pada model Phong,
+lalu dikemas menjadi array per atribut (struct-of-arrays) sebelum dihitung.
+"""
+
+import numpy as np
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+from algorithms.color_models import RGB, Vector3D, _dot3, _normalize3
+
+Light = Dict[str, object]
+PackedArrays = Dict[str, np.ndarray]
+
+LIGHT_TYPES = ("point", "directional", "spot")
+
+# Atenuasi (konstan, linear, kuadratik); default tanpa atenuasi seperti model Phong dasar
+NO_ATTENUATION = (1.0, 0.0, 0.0)
+
+# --- Pembuat Cahaya ------------------------------------------------------------
+
+def point_light(
+    position: Vector3D,
+    color: RGB = (255, 255, 255),
+    attenuation: Tuple[float, float, float] = NO_ATTENUATION
+) -> Light:
+    """Cahaya titik di `position` yang memancar ke segala arah."""
+    return {"type": "point", "position": position, "color": color, "attenuation": attenuation}
+
+def directional_light(direction: Vector3D, color: RGB = (255, 255, 255)) -> Light:
+    """Cahaya searah (misal matahari) yang merambat ke arah `direction`, tanpa atenuasi."""
+    return {"type": "directional", "direction": direction, "color": color}
+
+def spot_light(
+    position: Vector3D,
+    direction: Vector3D,
+    color: RGB = (255, 255, 255),
+    inner_angle: float = 15.0,
+    outer_angle: float = 25.0,
+    attenuation: Tuple[float, float, float] = NO_ATTENUATION
+) -> Light:
+    """
+    Lampu sorot di `position` yang mengarah ke `direction`.
+
+    Intensitas penuh di dalam kerucut `inner_angle` (derajat), turun linear
+    terhadap cosinus sudut hingga nol di `outer_angle`.
+    """
+    return {
+        "type": "spot",
+        "position": position,
+        "direction": direction,
+        "color": color,
+        "inner_angle": inner_angle,
+        "outer_angle": outer_angle,
+        "attenuation": attenuation,
+    }
+
+# --- Pengemasan Struct-of-Arrays -----------------------------------------------
+
+def pack_lights(lights: Sequence[Light]) -> PackedArrays:
+    """
+    Mengemas daftar cahaya menjadi array per atribut dengan panjang L.
+
+    Returns:
+        PackedArrays: 'kind' (indeks di LIGHT_TYPES), 'position', 'direction'
+        (ternormalisasi), 'color' (L, 3), 'attenuation' (L, 3), 'cos_inner'
+        dan 'cos_outer' (L,).
+    """
+    if len(lights) == 0:
+        raise ValueError("Minimal satu cahaya diperlukan")
+
+    count = len(lights)
+    packed = {
+        "kind": np.empty(count, dtype=np.int8),
+        "position": np.zeros((count, 3)),
+        "direction": np.zeros((count, 3)),
+        "color": np.zeros((count, 3)),
+        "attenuation": np.tile(np.asarray(NO_ATTENUATION), (count, 1)),
+        "cos_inner": np.full(count, -1.0),
+        "cos_outer": np.full(count, -2.0),
+    }
+    for i, light in enumerate(lights):
+        kind = light.get("type", "point")
+        if kind not in LIGHT_TYPES:
+            raise ValueError(f"Tipe cahaya harus salah satu dari {LIGHT_TYPES}")
+        packed["kind"][i] = LIGHT_TYPES.index(kind)
+        packed["color"][i] = light.get("color", (255, 255, 255))
+        if kind != "directional":
+            packed["position"][i] = light["position"]
+            packed["attenuation"][i] = light.get("attenuation", NO_ATTENUATION)
+        if kind != "point":
+            direction = np.asarray(light["direction"], dtype=float)
+            packed["direction"][i] = direction / np.linalg.norm(direction)
+        if kind == "spot":
+            packed["cos_inner"][i] = np.cos(np.radians(light.get("inner_angle", 15.0)))
+            packed["cos_outer"][i] = np.cos(np.radians(light.get("outer_angle", 25.0)))
+    return packed
+
+def pack_materials(materials: Union[dict, Sequence[dict]]) -> PackedArrays:
+    """
+    Mengemas satu atau beberapa dict material (ka, kd, ks, shininess) menjadi
+    array per koefisien dengan panjang M.
+    """
+    if isinstance(materials, dict):
+        materials = [materials]
+    if len(materials) == 0:
+        raise ValueError("Minimal satu material diperlukan")
+    return {key: np.array([m[key] for m in materials]) for key in ("ka", "kd", "ks", "shininess")}
+
+# --- Evaluasi Pencahayaan ------------------------------------------------------
+
+def calculate_lighting(
+    point_positions: np.ndarray,
+    point_normals: np.ndarray,
+    camera_position: Vector3D,
+    lights: Union[Sequence[Light], PackedArrays],
+    materials: Union[dict, Sequence[dict], PackedArrays],
+    material_indices: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Menghitung warna N titik yang disinari L cahaya dalam satu pass (L x N).
+
+    Untuk setiap cahaya: ambient = ka * warna, diffuse dan specular Phong
+    dikalikan atenuasi 1 / (c + l*d + q*d^2) (point/spot) dan faktor kerucut
+    (spot). Kontribusi semua cahaya dijumlahkan lalu di-clamp ke 0-255.
+    Dengan satu point light tanpa atenuasi dan satu material, hasilnya
+    identik dengan `calculate_phong_lighting` per titik.
+
+    Complexity:
+        Time: O(L * N)
+        Space: O(L * N)
+
+    Args:
+        point_positions (np.ndarray): Posisi titik, (N, 3).
+        point_normals (np.ndarray): Vektor normal titik, (N, 3).
+        camera_position (Vector3D): Posisi kamera/pengamat.
+        lights: Daftar dict cahaya, atau hasil `pack_lights`.
+        materials: Satu dict material, daftar material, atau hasil `pack_materials`.
+        material_indices (np.ndarray, optional): Indeks material per titik (N,)
+            (per vertex atau per face). Default material 0 untuk semua titik.
+
+    Returns:
+        np.ndarray: Array uint8 (N, 3) berisi warna (R, G, B) setiap titik.
+    """
+    if not (isinstance(lights, dict) and "kind" in lights):
+        lights = pack_lights(lights)
+    if not (isinstance(materials, dict) and isinstance(materials.get("ka"), np.ndarray)):
+        materials = pack_materials(materials)
+
+    positions = np.asarray(point_positions, dtype=float).reshape(-1, 3)
+    normals = _normalize3(np.asarray(point_normals, dtype=float).reshape(-1, 3))
+    view_dir = _normalize3(np.asarray(camera_position, dtype=float) - positions)
+
+    if material_indices is None:
+        material_indices = np.zeros(len(positions), dtype=np.intp)
+    ka, kd, ks, shininess = (materials[key][material_indices] for key in ("ka", "kd", "ks", "shininess"))
+
+    # Arah ke cahaya (L, N, 3); cahaya searah memakai arah rambat yang dibalik
+    kind = lights["kind"][:, None]
+    directional = kind == LIGHT_TYPES.index("directional")
+    to_light = lights["position"][:, None, :] - positions[None, :, :]
+    distance = np.sqrt(_dot3(to_light, to_light))
+    safe_distance = np.where(distance > 0, distance, 1.0)
+    light_dir = np.where(
+        directional[..., None],
+        -lights["direction"][:, None, :],
+        to_light / safe_distance[..., None]
+    )
+
+    # Atenuasi jarak dan faktor kerucut lampu sorot (L, N)
+    c, l, q = (lights["attenuation"][:, i:i + 1] for i in range(3))
+    attenuation = np.where(directional, 1.0, 1.0 / (c + l * distance + q * distance * distance))
+    cos_theta = -_dot3(light_dir, lights["direction"][:, None, :])
+    cos_inner, cos_outer = lights["cos_inner"][:, None], lights["cos_outer"][:, None]
+    cone = np.clip((cos_theta - cos_outer) / np.maximum(cos_inner - cos_outer, 1e-12), 0.0, 1.0)
+    weight = attenuation * np.where(kind == LIGHT_TYPES.index("spot"), cone, 1.0)
+
+    light = lights["color"][:, None, :]
+
+    # 1. Komponen Ambient
+    ambient = ka[None, :, None] * light
+
+    # 2. Komponen Diffuse
+    n_dot_l = _dot3(normals[None, :, :], light_dir)
+    diffuse = (kd * np.maximum(n_dot_l, 0.0))[..., None] * light
+
+    # 3. Komponen Specular
+    reflection_dir = (2 * n_dot_l)[..., None] * normals[None, :, :] - light_dir
+    specular_intensity = np.maximum(_dot3(view_dir[None, :, :], reflection_dir), 0.0) ** shininess
+    specular = (ks * specular_intensity)[..., None] * light
+
+    final_color = (ambient + diffuse * weight[..., None] + specular * weight[..., None]).sum(axis=0)
+    return np.clip(final_color, 0, 255).astype(np.uint8)
@@ -4,12 +4,28 @@ Implementasi Algoritma Penggambaran Garis.
 Berisi implementasi dari algoritma DDA (Digital Differential Analyzer)
 dan algoritma Garis Bresenham. Kedua fungsi dihiasi dengan @performance_tracker
 untuk mengukur performa secara otomatis.
+
+Selain versi skalar (satu garis per pemanggilan), tersedia juga versi batch
+(`dda_line_batch`, `bresenham_line_batch`) yang merasterisasi banyak segmen
+sekaligus dengan operasi vektor NumPy. Hasil versi batch identik per piksel
+dengan versi skalar.
+
+Untuk garis yang sangat panjang tersedia mode streaming: generator piksel
+(`iter_dda_line`, `iter_bresenham_line`), generator chunk NumPy
+(`iter_line_chunks`), dan `draw_line_into` yang menggambar langsung ke
+framebuffer dengan memori terbatas.
 """
 
-from typing import List, Tuple, Dict, Any
-from utils.helpers import performance_tracker
+import numpy as np
+from typing import List, Tuple, Dict, Any, Iterator
+from utils.performance import performance_tracker
+from algorithms.framebuffer import DEFAULT_CHUNK_SIZE, Color, plot_chunk
 
 Point = Tuple[int, int]
+LineBatch = Tuple[np.ndarray, np.ndarray]  # (pixels (M, 2) int32, offsets (N + 1,) int64)
+
+# Batas jumlah elemen array padding per chunk pada DDA batch (~8 MB float64)
+_DDA_CHUNK_ELEMENTS = 1 << 20
 
 @performance_tracker
 def dda_line(x1: int, y1: int, x2: int, y2: int, **kwargs) -> List[Point]:
@@ -53,7 +69,7 @@ def dda_line(x1: int, y1: int, x2: int, y2: int, **kwargs) -> List[Point]:
         pixels.append((round(x), round(y)))
         x += x_increment
         y += y_increment
-        op_counter['count'] += 4 # 2 pembulatan, 2 penambahan, 1 append
+    op_counter['count'] += 4 * (steps + 1) # 2 pembulatan, 2 penambahan, 1 append per langkah
 
     return pixels
 
@@ -92,27 +108,324 @@ def bresenham_line(x1: int, y1: int, x2: int, y2: int, **kwargs) -> List[Point]:
     op_counter['count'] += 1 # 1 pengurangan
 
     x, y = x1, y1
+    ops = 0 # Penghitung lokal; ditulis ke op_counter sekali di akhir
 
     while True:
         pixels.append((x, y))
-        op_counter['count'] += 1 # 1 append
+        ops += 1 # 1 append
 
         if x == x2 and y == y2:
             break
 
         e2 = 2 * err
-        op_counter['count'] += 1 # 1 perkalian
+        ops += 1 # 1 perkalian
 
         # Pindah horizontal
         if e2 > -dy:
             err -= dy
             x += sx
-            op_counter['count'] += 2 # 1 pengurangan, 1 penambahan
+            ops += 2 # 1 pengurangan, 1 penambahan
 
         # Pindah vertikal
         if e2 < dx:
             err += dx
             y += sy
-            op_counter['count'] += 2 # 1 penambahan, 1 penambahan
+            ops += 2 # 1 penambahan, 1 penambahan
 
+    op_counter['count'] += ops
     return pixels
+
+
+# --- Versi Batch (Vektorisasi NumPy) -------------------------------------------
+
+def _as_segments(segments: Any) -> np.ndarray:
+    """
+    Mengubah input segmen menjadi array int64 berbentuk (N, 4).
+    """
+    seg = np.asarray(segments)
+    if seg.size == 0:
+        return np.empty((0, 4), dtype=np.int64)
+    if seg.ndim != 2 or seg.shape[1] != 4:
+        raise ValueError("Segmen harus berbentuk (N, 4): [x1, y1, x2, y2] per baris")
+    return seg.astype(np.int64, copy=False)
+
+def _segment_layout(counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Menghitung offset per segmen, indeks segmen per piksel, dan indeks langkah
+    (0..steps) per piksel untuk hasil yang disusun bersambung.
+    """
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    seg_id = np.repeat(np.arange(len(counts)), counts)
+    step = np.arange(offsets[-1], dtype=np.int64) - offsets[seg_id]
+    return offsets, seg_id, step
+
+@performance_tracker
+def dda_line_batch(segments: Any, **kwargs) -> LineBatch:
+    """
+    Merasterisasi banyak garis sekaligus menggunakan algoritma DDA.
+
+    Akumulasi floating-point dilakukan berurutan per segmen (np.add.accumulate)
+    sehingga hasil pembulatannya identik dengan `dda_line`. Segmen diurutkan
+    berdasarkan panjang dan diproses per chunk untuk membatasi padding.
+
+    Complexity:
+        Time: O(total piksel)
+        Space: O(total piksel)
+
+    Args:
+        segments (array-like): Array (N, 4) berisi [x1, y1, x2, y2] per segmen.
+        **kwargs: Digunakan untuk menerima 'operation_counter'.
+
+    Returns:
+        LineBatch: Tuple (pixels, offsets). `pixels` adalah array int32 (M, 2)
+        berisi (x, y); piksel segmen ke-i ada di pixels[offsets[i]:offsets[i + 1]].
+    """
+    op_counter = kwargs.get('operation_counter', {'count': 0})
+    seg = _as_segments(segments)
+
+    dx = seg[:, 2] - seg[:, 0]
+    dy = seg[:, 3] - seg[:, 1]
+    steps = np.maximum(np.abs(dx), np.abs(dy))
+    counts = steps + 1
+
+    x_increment = np.divide(dx, steps, out=np.zeros(len(seg)), where=steps > 0)
+    y_increment = np.divide(dy, steps, out=np.zeros(len(seg)), where=steps > 0)
+
+    offsets = np.zeros(len(seg) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    pixels = np.empty((offsets[-1], 2), dtype=np.int32)
+
+    order = np.argsort(steps, kind='stable')
+    start = 0
+    while start < len(order):
+        # Ambil segmen sebanyak mungkin selama padding chunk masih di bawah batas
+        end = start + 1
+        while end < len(order) and (end - start + 1) * counts[order[end]] <= _DDA_CHUNK_ELEMENTS:
+            end += 1
+        rows = order[start:end]
+        width = counts[rows[-1]]
+        valid = np.arange(width) < counts[rows][:, None]
+        dest = np.repeat(offsets[rows], counts[rows]) + np.nonzero(valid)[1]
+
+        for axis, origin, increment in ((0, seg[rows, 0], x_increment[rows]),
+                                        (1, seg[rows, 1], y_increment[rows])):
+            acc = np.empty((len(rows), width))
+            acc[:, 0] = origin
+            acc[:, 1:] = increment[:, None]
+            np.add.accumulate(acc, axis=1, out=acc)
+            pixels[dest, axis] = np.rint(acc[valid])
+
+        start = end
+
+    op_counter['count'] += int(offsets[-1]) * 4 # 2 pembulatan, 2 penambahan per piksel
+    return pixels, offsets
+
+@performance_tracker
+def bresenham_line_batch(segments: Any, **kwargs) -> LineBatch:
+    """
+    Merasterisasi banyak garis sekaligus dengan hasil identik Bresenham.
+
+    Setiap langkah i pada sumbu mayor dihitung dalam bentuk tertutup
+    menggunakan aritmatika integer: minor = (2 * i * d_minor + d_major - 1) // (2 * d_major),
+    yang setara dengan parameter keputusan pada `bresenham_line`.
+
+    Complexity:
+        Time: O(total piksel)
+        Space: O(total piksel)
+
+    Args:
+        segments (array-like): Array (N, 4) berisi [x1, y1, x2, y2] per segmen.
+        **kwargs: Digunakan untuk menerima 'operation_counter'.
+
+    Returns:
+        LineBatch: Tuple (pixels, offsets). `pixels` adalah array int32 (M, 2)
+        berisi (x, y); piksel segmen ke-i ada di pixels[offsets[i]:offsets[i + 1]].
+    """
+    op_counter = kwargs.get('operation_counter', {'count': 0})
+    seg = _as_segments(segments)
+
+    dx = np.abs(seg[:, 2] - seg[:, 0])
+    dy = np.abs(seg[:, 3] - seg[:, 1])
+    sx = np.where(seg[:, 0] < seg[:, 2], 1, -1)
+    sy = np.where(seg[:, 1] < seg[:, 3], 1, -1)
+    counts = np.maximum(dx, dy) + 1
+
+    offsets, seg_id, step = _segment_layout(counts)
+    dx, dy = dx[seg_id], dy[seg_id]
+    x_major = dx >= dy
+
+    # Hindari pembagian dengan nol; segmen nol-panjang (dx = dy = 0) menghasilkan 0
+    x_minor = (2 * step * dx + dy - 1) // np.maximum(2 * dy, 1)
+    y_minor = np.maximum((2 * step * dy + dx - 1) // np.maximum(2 * dx, 1), 0)
+    x_off = np.where(x_major, step, x_minor)
+    y_off = np.where(x_major, y_minor, step)
+
+    pixels = np.empty((offsets[-1], 2), dtype=np.int32)
+    pixels[:, 0] = seg[seg_id, 0] + sx[seg_id] * x_off
+    pixels[:, 1] = seg[seg_id, 1] + sy[seg_id] * y_off
+
+    op_counter['count'] += int(offsets[-1]) * 3 # 1 perkalian, 1 penambahan, 1 pembagian per piksel
+    return pixels, offsets
+
+
+# --- Versi Streaming (Generator & Framebuffer) ---------------------------------
+
+def iter_dda_line(x1: int, y1: int, x2: int, y2: int) -> Iterator[Point]:
+    """
+    Generator piksel garis DDA; urutan dan nilai identik dengan `dda_line`.
+
+    Complexity:
+        Time: O(max(|dx|, |dy|))
+        Space: O(1)
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    steps = max(abs(dx), abs(dy))
+
+    if steps == 0:
+        yield (x1, y1)
+        return
+
+    x_increment = dx / steps
+    y_increment = dy / steps
+    x, y = float(x1), float(y1)
+
+    for _ in range(steps + 1):
+        yield (round(x), round(y))
+        x += x_increment
+        y += y_increment
+
+def iter_bresenham_line(x1: int, y1: int, x2: int, y2: int) -> Iterator[Point]:
+    """
+    Generator piksel garis Bresenham; urutan dan nilai identik dengan `bresenham_line`.
+
+    Complexity:
+        Time: O(max(|dx|, |dy|))
+        Space: O(1)
+    """
+    dx = abs(x2 - x1)
+    dy = abs(y2 - y1)
+    sx = 1 if x1 < x2 else -1
+    sy = 1 if y1 < y2 else -1
+    err = dx - dy
+    x, y = x1, y1
+
+    while True:
+        yield (x, y)
+        if x == x2 and y == y2:
+            break
+        e2 = 2 * err
+        if e2 > -dy:
+            err -= dy
+            x += sx
+        if e2 < dx:
+            err += dx
+            y += sy
+
+def iter_line_chunks(
+    x1: int, y1: int, x2: int, y2: int,
+    algorithm: str = "bresenham",
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[np.ndarray]:
+    """
+    Menghasilkan piksel garis sebagai chunk array int32 (k, 2), k <= chunk_size.
+
+    Setiap chunk dihitung secara vektor. DDA melanjutkan akumulasi float dari
+    chunk sebelumnya dan Bresenham memakai bentuk tertutup yang sama dengan
+    `bresenham_line_batch`, sehingga hasil gabungan semua chunk identik dengan
+    versi skalar.
+
+    Args:
+        x1, y1 (int): Koordinat titik awal.
+        x2, y2 (int): Koordinat titik akhir.
+        algorithm (str): 'dda' atau 'bresenham'.
+        chunk_size (int): Jumlah maksimum piksel per chunk.
+
+    Yields:
+        np.ndarray: Array int32 (k, 2) berisi (x, y).
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size harus lebih besar dari 0")
+    algorithm = algorithm.lower()
+    if algorithm not in ("dda", "bresenham"):
+        raise ValueError(f"Algoritma garis tidak dikenal: {algorithm}")
+
+    dx = x2 - x1
+    dy = y2 - y1
+    steps = max(abs(dx), abs(dy))
+    total = steps + 1
+
+    if algorithm == "dda":
+        x_increment = dx / steps if steps else 0.0
+        y_increment = dy / steps if steps else 0.0
+        x, y = float(x1), float(y1)
+        acc = np.empty((2, min(chunk_size, total)))
+        for start in range(0, total, chunk_size):
+            k = min(chunk_size, total - start)
+            block = acc[:, :k]
+            block[0, 0], block[1, 0] = x, y
+            block[0, 1:] = x_increment
+            block[1, 1:] = y_increment
+            np.add.accumulate(block, axis=1, out=block)
+            chunk = np.empty((k, 2), dtype=np.int32)
+            chunk[:, 0] = np.rint(block[0])
+            chunk[:, 1] = np.rint(block[1])
+            # Lanjutkan akumulasi persis seperti loop skalar
+            x = block[0, -1] + x_increment
+            y = block[1, -1] + y_increment
+            yield chunk
+        return
+
+    adx, ady = abs(dx), abs(dy)
+    sx = 1 if x1 < x2 else -1
+    sy = 1 if y1 < y2 else -1
+    for start in range(0, total, chunk_size):
+        step = np.arange(start, min(start + chunk_size, total), dtype=np.int64)
+        if adx >= ady:
+            x_off = step
+            y_off = (2 * step * ady + adx - 1) // (2 * adx) if adx else np.zeros_like(step)
+        else:
+            x_off = (2 * step * adx + ady - 1) // (2 * ady)
+            y_off = step
+        chunk = np.empty((len(step), 2), dtype=np.int32)
+        chunk[:, 0] = x1 + sx * x_off
+        chunk[:, 1] = y1 + sy * y_off
+        yield chunk
+
+@performance_tracker
+def draw_line_into(
+    framebuffer: np.ndarray,
+    x1: int, y1: int, x2: int, y2: int,
+    color: Color,
+    algorithm: str = "bresenham",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs
+) -> int:
+    """
+    Menggambar garis langsung ke framebuffer tanpa membuat list piksel.
+
+    Memori tambahan dibatasi O(chunk_size). Piksel di luar framebuffer diabaikan.
+
+    Args:
+        framebuffer (np.ndarray): Array (H, W) atau (H, W, C) yang diubah in-place.
+        x1, y1 (int): Koordinat titik awal.
+        x2, y2 (int): Koordinat titik akhir.
+        color (Color): Nilai piksel yang ditulis.
+        algorithm (str): 'dda' atau 'bresenham'.
+        chunk_size (int): Jumlah maksimum piksel per chunk.
+        **kwargs: Digunakan untuk menerima 'operation_counter'.
+
+    Returns:
+        int: Jumlah piksel garis yang dihasilkan algoritma.
+    """
+    op_counter = kwargs.get('operation_counter', {'count': 0})
+    ops_per_pixel = 4 if algorithm.lower() == "dda" else 3
+
+    total = 0
+    for chunk in iter_line_chunks(x1, y1, x2, y2, algorithm, chunk_size):
+        plot_chunk(framebuffer, chunk, color)
+        total += len(chunk)
+        op_counter['count'] += len(chunk) * ops_per_pixel
+
+    return total
@@ -0,0 +1,200 @@
+"""
+Struktur Data Mesh (Struct-of-Arrays).
+
+Menyimpan atribut vertex sebagai array float32 kontigu (posisi, normal, UV)
+dan index buffer int32 (F, k), menggantikan daftar dict per vertex yang
+membutuhkan satu ndarray kecil untuk setiap atribut setiap vertex.
+Data turunan (normal face, centroid, bounds, adjacency, edge) dihitung saat
+pertama kali diminta lalu di-cache; karena itu semua array dibuat read-only.
+"""
+
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+class Mesh:
+    """
+    Mesh poligon dengan layout struct-of-arrays.
+
+    Attributes:
+        positions (np.ndarray): Posisi vertex, float32 (V, 3).
+        faces (np.ndarray): Indeks vertex per face, int32 (F, k) dengan k >= 3.
+        normals (np.ndarray): Normal vertex, float32 (V, 3). Jika tidak diberikan,
+            dihitung dari normal face (dibobot luas).
+        uvs (Optional[np.ndarray]): Koordinat tekstur, float32 (V, 2), atau None.
+    """
+    __slots__ = ("positions", "faces", "normals", "uvs", "_cache")
+
+    def __init__(
+        self,
+        positions: np.ndarray,
+        faces: np.ndarray,
+        normals: Optional[np.ndarray] = None,
+        uvs: Optional[np.ndarray] = None
+    ):
+        self._cache: Dict[str, Any] = {}
+        self.positions = self._frozen(positions, np.float32, 3)
+        faces = np.asarray(faces)
+        self.faces = self._frozen(faces if faces.size else np.empty((0, 3)), np.int32, None)
+        if self.faces.ndim != 2 or self.faces.shape[1] < 3:
+            raise ValueError("faces harus berbentuk (F, k) dengan k >= 3")
+        if len(self.faces) and (self.faces.min() < 0 or self.faces.max() >= len(self.positions)):
+            raise ValueError("Indeks face di luar jangkauan vertex")
+
+        if normals is None:
+            normals = self._area_weighted_normals()
+        self.normals = self._frozen(normals, np.float32, 3)
+        self.uvs = None if uvs is None else self._frozen(uvs, np.float32, 2)
+
+        for name, array in (("normals", self.normals), ("uvs", self.uvs)):
+            if array is not None and len(array) != len(self.positions):
+                raise ValueError(f"Jumlah {name} harus sama dengan jumlah vertex")
+
+    @staticmethod
+    def _frozen(array, dtype, columns: Optional[int]) -> np.ndarray:
+        """Menyalin ke array kontigu ber-dtype tetap dan menandainya read-only."""
+        array = np.array(array, dtype=dtype, order="C")
+        if columns is not None:
+            array = array.reshape(-1, columns)
+        array.setflags(write=False)
+        return array
+
+    def _cached(self, key: str, compute) -> Any:
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    # --- Konstruktor dari format lama -------------------------------------------
+
+    @classmethod
+    def from_vertex_dicts(cls, vertices: Sequence[Dict[str, Any]], polygons: Sequence[Sequence[int]]) -> "Mesh":
+        """
+        Membuat Mesh dari daftar dict vertex ('position', opsional 'normal' dan 'uv')
+        dan daftar poligon, format `assets/data/sample_objects.json`.
+        """
+        positions = [v["position"] for v in vertices]
+        normals = [v["normal"] for v in vertices] if vertices and "normal" in vertices[0] else None
+        uvs = [v["uv"] for v in vertices] if vertices and "uv" in vertices[0] else None
+        return cls(positions, polygons, normals, uvs)
+
+    def to_vertex_dicts(self) -> List[Dict[str, np.ndarray]]:
+        """Mengubah kembali ke daftar dict vertex untuk fungsi per poligon."""
+        vertices = [{"position": p, "normal": n} for p, n in zip(self.positions, self.normals)]
+        if self.uvs is not None:
+            for vertex, uv in zip(vertices, self.uvs):
+                vertex["uv"] = uv
+        return vertices
+
+    # --- Informasi dasar ---------------------------------------------------------
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.positions)
+
+    @property
+    def face_count(self) -> int:
+        return len(self.faces)
+
+    @property
+    def nbytes(self) -> int:
+        """Ukuran semua buffer vertex dan index dalam byte."""
+        arrays = (self.positions, self.normals, self.uvs, self.faces)
+        return sum(a.nbytes for a in arrays if a is not None)
+
+    def __repr__(self) -> str:
+        return f"Mesh(vertices={self.vertex_count}, faces={self.face_count})"
+
+    # --- Data turunan (lazy + cache) ---------------------------------------------
+
+    def _face_cross(self) -> np.ndarray:
+        """Cross product dua sisi pertama setiap face (panjang = 2x luas segitiga)."""
+        p = self.positions.astype(np.float64)
+        a, b, c = p[self.faces[:, 0]], p[self.faces[:, 1]], p[self.faces[:, 2]]
+        return np.cross(b - a, c - a)
+
+    def _area_weighted_normals(self) -> np.ndarray:
+        cross = self._face_cross()
+        normals = np.zeros((len(self.positions), 3))
+        for column in range(self.faces.shape[1]):
+            np.add.at(normals, self.faces[:, column], cross)
+        length = np.linalg.norm(normals, axis=1, keepdims=True)
+        return normals / np.where(length > 0, length, 1.0)
+
+    @property
+    def face_normals(self) -> np.ndarray:
+        """Normal geometris setiap face, float32 (F, 3) ternormalisasi."""
+        def compute():
+            cross = self._face_cross()
+            length = np.linalg.norm(cross, axis=1, keepdims=True)
+            return self._frozen(cross / np.where(length > 0, length, 1.0), np.float32, 3)
+        return self._cached("face_normals", compute)
+
+    @property
+    def face_centroids(self) -> np.ndarray:
+        """Centroid setiap face, float32 (F, 3)."""
+        return self._cached(
+            "face_centroids",
+            lambda: self._frozen(self.positions[self.faces].mean(axis=1), np.float32, 3)
+        )
+
+    @property
+    def bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Bounding box (min, max) posisi vertex, masing-masing (3,)."""
+        return self._cached("bounds", lambda: (self.positions.min(axis=0), self.positions.max(axis=0)))
+
+    @property
+    def vertex_faces(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Adjacency vertex -> face dalam format CSR.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (offsets (V + 1,), face_indices); face
+            yang memakai vertex v adalah face_indices[offsets[v]:offsets[v + 1]].
+        """
+        def compute():
+            flat = self.faces.ravel()
+            order = np.argsort(flat, kind="stable")
+            face_indices = (order // self.faces.shape[1]).astype(np.int32)
+            offsets = np.searchsorted(flat[order], np.arange(len(self.positions) + 1))
+            return offsets, face_indices
+        return self._cached("vertex_faces", compute)
+
+    @property
+    def edges(self) -> np.ndarray:
+        """Edge unik (tak berarah) antar vertex, int32 (E, 2) dengan kolom a < b."""
+        def compute():
+            pairs = np.stack([self.faces, np.roll(self.faces, -1, axis=1)], axis=-1).reshape(-1, 2)
+            pairs = np.sort(pairs, axis=1)
+            return self._frozen(np.unique(pairs, axis=0) if len(pairs) else pairs, np.int32, 2)
+        return self._cached("edges", compute)
+
+    @property
+    def triangles(self) -> np.ndarray:
+        """
+        Index buffer segitiga (T, 3). Untuk mesh segitiga ini adalah `faces`
+        itu sendiri (tanpa salinan); poligon k > 3 dipecah dengan fan triangulation.
+        """
+        def compute():
+            k = self.faces.shape[1]
+            if k == 3:
+                return self.faces
+            fan = [self.faces[:, [0, i, i + 1]] for i in range(1, k - 1)]
+            return self._frozen(np.stack(fan, axis=1).reshape(-1, 3), np.int32, 3)
+        return self._cached("triangles", compute)
+
+    # --- Adapter Plotly ------------------------------------------------------------
+
+    def plotly_mesh3d_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Argumen x, y, z, i, j, k untuk `plotly.graph_objects.Mesh3d`.
+
+        Semua kolom adalah view dari buffer mesh (tanpa salinan).
+        """
+        triangles = self.triangles
+        return {
+            "x": self.positions[:, 0],
+            "y": self.positions[:, 1],
+            "z": self.positions[:, 2],
+            "i": triangles[:, 0],
+            "j": triangles[:, 1],
+            "k": triangles[:, 2],
+        }
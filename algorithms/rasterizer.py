@@ -0,0 +1,451 @@
+"""
+Rasterizer Segitiga Software Berbasis Blok Piksel.
+
+Memproyeksikan vertex 3D ke clip space, memotong segitiga terhadap near
+plane, membuang sisi belakang (opsional), lalu merasterisasi segitiga per blok
+piksel bounding box-nya. Segitiga dikelompokkan menurut ukuran bounding box
+(kelas pangkat dua), dan setiap kelompok diuji terhadap semua piksel
+bloknya sekaligus dengan edge function dalam satu operasi array
+(segitiga x piksel). Fragmen terdekat per piksel dipilih terhadap z-buffer.
+
+Hasil rasterisasi adalah visibility buffer (indeks segitiga + koordinat
+barycentric per piksel). Atribut vertex (normal, posisi, warna, UV, ...)
+diinterpolasi setelahnya, tepat satu kali untuk setiap piksel yang terlihat.
+`draw_triangles` menjalankan seluruh pipeline tersebut.
+"""
+
+import numpy as np
+from typing import Any, Dict, List, Optional
+
+Raster = Dict[str, Any]
+
+CULL_MODES = (None, "back", "front")
+
+# Batas elemen matriks (segitiga x piksel blok) per batch (~2 MB per array float64)
+_BLOCK_ELEMENTS = 1 << 18
+
+# --- Transformasi Kamera -------------------------------------------------------
+
+def look_at(eye: np.ndarray, target: np.ndarray, up: np.ndarray = (0.0, 1.0, 0.0)) -> np.ndarray:
+    """
+    Membuat matriks view 4x4 (right-handed, kamera menghadap -z).
+
+    Args:
+        eye (np.ndarray): Posisi kamera.
+        target (np.ndarray): Titik yang dilihat.
+        up (np.ndarray): Arah atas dunia.
+
+    Returns:
+        np.ndarray: Matriks view 4x4.
+    """
+    eye = np.asarray(eye, dtype=float)
+    forward = np.asarray(target, dtype=float) - eye
+    forward /= np.linalg.norm(forward)
+    right = np.cross(forward, np.asarray(up, dtype=float))
+    if np.linalg.norm(right) < 1e-12:
+        # Arah pandang sejajar dengan up: pilih sumbu bantu lain
+        right = np.cross(forward, (1.0, 0.0, 0.0))
+    right /= np.linalg.norm(right)
+    true_up = np.cross(right, forward)
+
+    view = np.eye(4)
+    view[0, :3], view[1, :3], view[2, :3] = right, true_up, -forward
+    view[:3, 3] = -view[:3, :3] @ eye
+    return view
+
+def perspective(fov_y_deg: float, aspect: float, near: float = 0.1, far: float = 100.0) -> np.ndarray:
+    """
+    Membuat matriks proyeksi perspektif 4x4 (gaya OpenGL, NDC z di [-1, 1]).
+
+    Args:
+        fov_y_deg (float): Field of view vertikal dalam derajat.
+        aspect (float): Rasio lebar / tinggi viewport.
+        near (float): Jarak bidang dekat (> 0).
+        far (float): Jarak bidang jauh (> near).
+
+    Returns:
+        np.ndarray: Matriks proyeksi 4x4.
+    """
+    if near <= 0 or far <= near:
+        raise ValueError("Harus berlaku 0 < near < far")
+    f = 1.0 / np.tan(np.radians(fov_y_deg) / 2)
+    return np.array([
+        [f / aspect, 0, 0, 0],
+        [0, f, 0, 0],
+        [0, 0, (far + near) / (near - far), 2 * far * near / (near - far)],
+        [0, 0, -1, 0],
+    ], dtype=float)
+
+def to_clip_space(positions: np.ndarray, mvp: np.ndarray) -> np.ndarray:
+    """Mentransformasi posisi (N, 3) ke koordinat homogen clip space (N, 4)."""
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    return np.hstack([positions, np.ones((len(positions), 1))]) @ np.asarray(mvp, dtype=float).T
+
+def clip_to_screen(clip: np.ndarray, width: int, height: int) -> Dict[str, np.ndarray]:
+    """
+    Perspective divide dan transformasi viewport dari clip space ke layar.
+
+    Returns:
+        Dict[str, np.ndarray]: 'screen' (N, 3) berisi x, y piksel (y ke bawah)
+        dan z NDC, serta 'w' (N,) komponen w clip space.
+    """
+    w = clip[:, 3]
+    safe_w = np.where(np.abs(w) > 1e-12, w, 1e-12)
+    ndc = clip[:, :3] / safe_w[:, None]
+    screen = np.column_stack([
+        (ndc[:, 0] + 1) * 0.5 * width,
+        (1 - ndc[:, 1]) * 0.5 * height,
+        ndc[:, 2],
+    ])
+    return {"screen": screen, "w": w}
+
+def project_vertices(positions: np.ndarray, mvp: np.ndarray, width: int, height: int) -> Dict[str, np.ndarray]:
+    """
+    Memproyeksikan vertex ke koordinat layar.
+
+    Args:
+        positions (np.ndarray): Posisi vertex (N, 3).
+        mvp (np.ndarray): Matriks projection @ view @ model (4x4).
+        width (int): Lebar layar (piksel).
+        height (int): Tinggi layar (piksel).
+
+    Returns:
+        Dict[str, np.ndarray]: 'screen' (N, 3) berisi x, y piksel (y ke bawah)
+        dan z NDC, serta 'w' (N,) komponen w clip space.
+    """
+    return clip_to_screen(to_clip_space(positions, mvp), width, height)
+
+# --- Clipping ------------------------------------------------------------------
+
+def clip_near_plane(
+    clip: np.ndarray,
+    triangles: np.ndarray,
+    attributes: Optional[np.ndarray] = None
+) -> Dict[str, Any]:
+    """
+    Memotong segitiga terhadap near plane (z + w >= 0) di clip space.
+
+    Segitiga dengan satu vertex di dalam menjadi satu segitiga lebih kecil,
+    dengan dua vertex di dalam menjadi dua segitiga (quad). Vertex baru
+    diinterpolasi linear di clip space bersama atributnya dan ditambahkan
+    di akhir buffer vertex; urutan putaran (winding) tetap terjaga. Semua
+    kasus diproses per kelompok dengan operasi array, tanpa loop per segitiga.
+    Sisi far dan samping cukup ditangani per fragmen oleh `rasterize`.
+
+    Args:
+        clip (np.ndarray): Vertex clip space, (N, 4).
+        triangles (np.ndarray): Indeks vertex segitiga, (T, 3).
+        attributes (np.ndarray, optional): Atribut per vertex, (N, C).
+
+    Returns:
+        Dict[str, Any]: 'clip' (N', 4), 'attributes' (N', C) atau None,
+        'triangles' (T', 3), dan 'source' (T',) indeks segitiga asal.
+    """
+    clip = np.asarray(clip, dtype=float)
+    triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    distance = clip[:, 2] + clip[:, 3]
+    inside = distance[triangles] >= 0
+    inside_count = inside.sum(axis=1)
+
+    if np.all(inside_count == 3):
+        return {
+            "clip": clip,
+            "attributes": attributes,
+            "triangles": triangles,
+            "source": np.arange(len(triangles)),
+        }
+
+    columns = [clip] if attributes is None else [clip, np.asarray(attributes, dtype=float).reshape(len(clip), -1)]
+    vertex_data = np.hstack(columns)
+    new_vertices: List[np.ndarray] = []
+    next_index = len(vertex_data)
+
+    def intersect(i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        """Menambahkan titik potong sisi i-j dengan near plane; mengembalikan indeksnya."""
+        nonlocal next_index
+        t = distance[i] / (distance[i] - distance[j])
+        new_vertices.append(vertex_data[i] + t[:, None] * (vertex_data[j] - vertex_data[i]))
+        indices = np.arange(next_index, next_index + len(i))
+        next_index += len(i)
+        return indices
+
+    def rotated(ids: np.ndarray, first: np.ndarray) -> np.ndarray:
+        """Memutar urutan vertex (tanpa mengubah winding) agar kolom `first` di depan."""
+        return triangles[ids[:, None], (first[:, None] + np.arange(3)) % 3]
+
+    full = np.flatnonzero(inside_count == 3)
+    pieces, sources = [triangles[full]], [full]
+
+    # Satu vertex di dalam: (a, ab, ac)
+    one = np.flatnonzero(inside_count == 1)
+    if len(one):
+        a, b, c = rotated(one, np.argmax(inside[one], axis=1)).T
+        pieces.append(np.column_stack([a, intersect(a, b), intersect(a, c)]))
+        sources.append(one)
+
+    # Dua vertex di dalam: quad (oa, a, b, bo) dipecah menjadi dua segitiga
+    two = np.flatnonzero(inside_count == 2)
+    if len(two):
+        o, a, b = rotated(two, np.argmin(inside[two], axis=1)).T
+        oa, bo = intersect(o, a), intersect(b, o)
+        pieces += [np.column_stack([oa, a, b]), np.column_stack([oa, b, bo])]
+        sources += [two, two]
+
+    vertex_data = np.vstack([vertex_data] + new_vertices)
+    triangles = np.vstack(pieces)
+    source = np.concatenate(sources)
+    order = np.argsort(source, kind="stable")
+    return {
+        "clip": vertex_data[:, :4],
+        "attributes": None if attributes is None else vertex_data[:, 4:],
+        "triangles": triangles[order],
+        "source": source[order],
+    }
+
+# --- Rasterisasi ---------------------------------------------------------------
+
+def _triangle_setup(screen: np.ndarray, triangles: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Menyiapkan koefisien edge function dan bounding box piksel setiap segitiga.
+
+    Barycentric layar lambda_i(x, y) = a_i * x + b_i * y + c_i, dengan
+    lambda_i = 1 di vertex i dan 0 di sisi seberangnya; berlaku untuk kedua
+    orientasi (CW maupun CCW). Bounding box berisi indeks piksel yang
+    pusatnya (i + 0.5) berada di dalam kotak pembatas segitiga.
+    """
+    x = screen[triangles, 0]
+    y = screen[triangles, 1]
+    area = (x[:, 1] - x[:, 0]) * (y[:, 2] - y[:, 0]) - (y[:, 1] - y[:, 0]) * (x[:, 2] - x[:, 0])
+    safe_area = np.where(area != 0, area, 1.0)
+
+    j, k = [1, 2, 0], [2, 0, 1]
+    a = -(y[:, k] - y[:, j]) / safe_area[:, None]
+    b = (x[:, k] - x[:, j]) / safe_area[:, None]
+    c = ((y[:, k] - y[:, j]) * x[:, j] - (x[:, k] - x[:, j]) * y[:, j]) / safe_area[:, None]
+    return {
+        "a": a,
+        "b": b,
+        "c": c,
+        "area": area,
+        "z": screen[triangles, 2],
+        "x0": np.ceil(x.min(axis=1) - 0.5),
+        "x1": np.floor(x.max(axis=1) - 0.5),
+        "y0": np.ceil(y.min(axis=1) - 0.5),
+        "y1": np.floor(y.max(axis=1) - 0.5),
+    }
+
+def _resolve_depth(raster: Raster, pixels: np.ndarray, z: np.ndarray, tris: np.ndarray, bary: np.ndarray) -> int:
+    """
+    Depth test sekumpulan fragmen terhadap z-buffer.
+
+    Fragmen diurutkan per piksel lalu per depth; hanya fragmen terdekat per
+    piksel yang dibandingkan dengan z-buffer dan ditulis jika lebih dekat.
+
+    Returns:
+        int: Jumlah piksel yang ditulis.
+    """
+    order = np.lexsort((z, pixels))
+    sorted_pixels = pixels[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = sorted_pixels[1:] != sorted_pixels[:-1]
+    nearest = order[first]
+
+    depth = raster["depth"].reshape(-1)
+    closer = nearest[z[nearest] < depth[pixels[nearest]]]
+    target = pixels[closer]
+    depth[target] = z[closer]
+    raster["triangle"].reshape(-1)[target] = tris[closer]
+    raster["barycentric"].reshape(-1, 3)[target] = bary[closer]
+    return len(target)
+
+def rasterize(
+    screen: np.ndarray,
+    w: np.ndarray,
+    triangles: np.ndarray,
+    width: int,
+    height: int,
+    cull: Optional[str] = None
+) -> Raster:
+    """
+    Merasterisasi segitiga ke visibility buffer dengan z-buffer.
+
+    Segitiga dikelompokkan menurut luas bounding box (dibulatkan ke pangkat
+    dua), sehingga satu kelompok dapat diproses sebagai matriks
+    (segitiga x piksel blok). Pusat piksel diuji dengan edge function,
+    depth diinterpolasi linear di ruang layar, lalu fragmen yang lolos
+    di-depth-test per batch. Segitiga dengan vertex di belakang kamera
+    (w <= 0) dibuang. Loop Python hanya atas kelas ukuran dan batch,
+    bukan atas segitiga atau piksel.
+
+    Sisi depan adalah segitiga yang berputar berlawanan arah jarum jam (CCW)
+    di NDC, seperti konvensi OpenGL.
+
+    Complexity:
+        Time: O(T + B log B), B = total piksel blok semua segitiga.
+        Space: O(W * H + _BLOCK_ELEMENTS)
+
+    Args:
+        screen (np.ndarray): Hasil `project_vertices` ('screen'), (N, 3).
+        w (np.ndarray): Komponen w clip space, (N,).
+        triangles (np.ndarray): Indeks vertex segitiga, (T, 3).
+        width (int): Lebar framebuffer.
+        height (int): Tinggi framebuffer.
+        cull (str, optional): 'back' atau 'front' untuk membuang sisi
+            belakang/depan; None (default) menggambar keduanya. Jika semua
+            segitiga terbuang, hasilnya raster kosong.
+
+    Returns:
+        Raster: 'depth' (H, W) z-buffer (inf = kosong), 'triangle' (H, W)
+        indeks segitiga (-1 = kosong), 'barycentric' (H, W, 3) barycentric
+        layar, 'w' (N,) untuk interpolasi perspective-correct, dan
+        'fragments' (jumlah fragmen yang lolos uji cakupan).
+    """
+    if cull not in CULL_MODES:
+        raise ValueError(f"cull harus salah satu dari {CULL_MODES}")
+
+    triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    screen = np.asarray(screen, dtype=float)
+    raster = {
+        "depth": np.full((height, width), np.inf),
+        "triangle": np.full((height, width), -1, dtype=np.int32),
+        "barycentric": np.zeros((height, width, 3), dtype=np.float32),
+        "w": np.asarray(w, dtype=float),
+        "fragments": 0,
+    }
+    if len(triangles) == 0:
+        return raster
+
+    setup = _triangle_setup(screen, triangles)
+    x0 = np.maximum(setup["x0"], 0)
+    y0 = np.maximum(setup["y0"], 0)
+    box_w = np.minimum(setup["x1"], width - 1) - x0 + 1
+    box_h = np.minimum(setup["y1"], height - 1) - y0 + 1
+    valid = (setup["area"] != 0) & np.all(raster["w"][triangles] > 0, axis=1) & (box_w > 0) & (box_h > 0)
+    # Sumbu y layar terbalik terhadap NDC, sehingga CCW di NDC bernilai luas negatif
+    if cull == "back":
+        valid &= setup["area"] < 0
+    elif cull == "front":
+        valid &= setup["area"] > 0
+
+    ids = np.flatnonzero(valid)
+    if ids.size == 0:
+        return raster
+    size_class = np.ceil(np.log2(box_w[ids] * box_h[ids])).astype(np.int64)
+    order = np.argsort(size_class, kind="stable")
+    ids, size_class = ids[order], size_class[order]
+    class_starts = np.concatenate([[0], np.flatnonzero(np.diff(size_class)) + 1])
+    class_ends = np.concatenate([class_starts[1:], [len(ids)]])
+
+    for start, end in zip(class_starts.tolist(), class_ends.tolist()):
+        block = 1 << int(size_class[start])
+        k = np.arange(block, dtype=float)
+        step = max(_BLOCK_ELEMENTS // block, 1)
+
+        for batch in range(start, end, step):
+            tris = ids[batch:min(batch + step, end)]
+            bw, bh = box_w[tris][:, None], box_h[tris][:, None]
+            # Offset piksel lokal di dalam bounding box (baris demi baris)
+            ly = np.floor((k + 0.5) / bw)
+            lx = k - ly * bw
+            px = x0[tris][:, None] + lx + 0.5
+            py = y0[tris][:, None] + ly + 0.5
+
+            a, b, c = setup["a"][tris], setup["b"][tris], setup["c"][tris]
+            l0 = a[:, 0:1] * px + b[:, 0:1] * py + c[:, 0:1]
+            l1 = a[:, 1:2] * px + b[:, 1:2] * py + c[:, 1:2]
+            tz = setup["z"][tris]
+            z = tz[:, 2:3] + l0 * (tz[:, 0:1] - tz[:, 2:3]) + l1 * (tz[:, 1:2] - tz[:, 2:3])
+            inside = (ly < bh) & (l0 >= 0) & (l1 >= 0) & (l0 + l1 <= 1) & (z >= -1) & (z <= 1)
+
+            rows, cols = np.nonzero(inside)
+            if len(rows) == 0:
+                continue
+            pixels = (py[rows, cols] - 0.5).astype(np.int64) * width + (px[rows, cols] - 0.5).astype(np.int64)
+            f0, f1 = l0[rows, cols], l1[rows, cols]
+            bary = np.column_stack([f0, f1, 1.0 - f0 - f1])
+            raster["fragments"] += len(rows)
+            _resolve_depth(raster, pixels, z[rows, cols], tris[rows], bary)
+
+    return raster
+
+def interpolate_attributes(raster: Raster, triangles: np.ndarray, attributes: np.ndarray) -> np.ndarray:
+    """
+    Menginterpolasi atribut vertex secara perspective-correct untuk setiap
+    piksel yang tertutup segitiga.
+
+    Args:
+        raster (Raster): Hasil `rasterize`.
+        triangles (np.ndarray): Indeks vertex segitiga yang sama dengan saat rasterisasi.
+        attributes (np.ndarray): Atribut per vertex, (N,) atau (N, C).
+
+    Returns:
+        np.ndarray: Atribut (K, C) untuk K piksel tertutup, urut baris
+        (sesuai `np.nonzero(raster['triangle'] >= 0)`).
+    """
+    triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    attributes = np.asarray(attributes, dtype=float)
+    attributes = attributes.reshape(len(attributes), -1)
+
+    covered = raster["triangle"] >= 0
+    corners = triangles[raster["triangle"][covered]]
+    weights = raster["barycentric"][covered].astype(float) / raster["w"][corners]
+    weights /= weights.sum(axis=1, keepdims=True)
+    return np.einsum("ki,kic->kc", weights, attributes[corners])
+
+# --- Pipeline ------------------------------------------------------------------
+
+def draw_triangles(
+    positions: np.ndarray,
+    triangles: np.ndarray,
+    mvp: np.ndarray,
+    width: int,
+    height: int,
+    attributes: Optional[Dict[str, np.ndarray]] = None,
+    cull: Optional[str] = None
+) -> Raster:
+    """
+    Pipeline rasterisasi lengkap: transformasi ke clip space, clipping near
+    plane, perspective divide dan viewport, back-face culling, rasterisasi
+    dengan z-buffer, lalu interpolasi atribut vertex bernama.
+
+    Complexity:
+        Time: O(N + T + B log B), B = total piksel blok semua segitiga.
+        Space: O(W * H * C)
+
+    Args:
+        positions (np.ndarray): Posisi vertex, (N, 3).
+        triangles (np.ndarray): Indeks vertex segitiga, (T, 3).
+        mvp (np.ndarray): Matriks projection @ view @ model (4x4).
+        width (int): Lebar framebuffer.
+        height (int): Tinggi framebuffer.
+        attributes (Dict[str, np.ndarray], optional): Atribut per vertex
+            bernama, misal {'normal': (N, 3), 'uv': (N, 2), 'color': (N, 3)}.
+        cull (str, optional): Mode culling, lihat `rasterize`.
+
+    Returns:
+        Raster: Hasil `rasterize` atas segitiga hasil clipping, ditambah
+        'face' (H, W) indeks segitiga asal per piksel (-1 = kosong),
+        'mask' (H, W) piksel tertutup, 'triangles_in' (jumlah segitiga
+        masukan), dan 'attributes' berisi atribut terinterpolasi
+        (K, C) per nama untuk K piksel tertutup (urut baris).
+    """
+    triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    attributes = attributes or {}
+    names = list(attributes)
+    columns = [np.asarray(attributes[name], dtype=float).reshape(len(attributes[name]), -1) for name in names]
+    packed = np.hstack(columns) if columns else None
+
+    clipped = clip_near_plane(to_clip_space(positions, mvp), triangles, packed)
+    projected = clip_to_screen(clipped["clip"], width, height)
+    raster = rasterize(projected["screen"], projected["w"], clipped["triangles"], width, height, cull)
+
+    mask = raster["triangle"] >= 0
+    face = np.full((height, width), -1, dtype=np.int32)
+    face[mask] = clipped["source"][raster["triangle"][mask]]
+    raster.update({"face": face, "mask": mask, "triangles_in": len(triangles), "attributes": {}})
+
+    if packed is not None:
+        values = interpolate_attributes(raster, clipped["triangles"], clipped["attributes"])
+        splits = np.cumsum([c.shape[1] for c in columns])[:-1]
+        raster["attributes"] = dict(zip(names, np.split(values, splits, axis=1)))
+    return raster
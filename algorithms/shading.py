@@ -6,15 +6,37 @@ permukaan objek 3D, yaitu Flat, Gouraud, dan Phong shading.
 """
 
 import numpy as np
-from typing import List, Tuple, Dict
+from typing import List, Optional, Tuple, Dict
 
-from algorithms.color_models import calculate_phong_lighting
+from algorithms.color_models import calculate_phong_lighting_batch
+from algorithms.lighting import calculate_lighting
+from algorithms.rasterizer import look_at, perspective, draw_triangles
 
 # Tipe data untuk kejelasan
 Vector3D = np.ndarray
 Polygon = List[int] # List of vertex indices
 Vertex = Dict[str, Vector3D] # e.g., {'position': vec, 'normal': vec}
 
+def _shade_points(positions: np.ndarray, normals: np.ndarray, **kwargs) -> np.ndarray:
+    """
+    Menghitung warna sekumpulan titik dari argumen pencahayaan.
+
+    Argumen mesin multi-cahaya (lights, camera_position, materials,
+    material_indices) diteruskan ke `calculate_lighting`; argumen model Phong
+    satu cahaya (light_color, light_position, camera_position, material)
+    memakai kernel Phong batch yang lebih ringan untuk poligon kecil.
+    """
+    if "lights" in kwargs:
+        return calculate_lighting(
+            positions,
+            normals,
+            kwargs["camera_position"],
+            kwargs["lights"],
+            kwargs.get("materials", kwargs.get("material")),
+            kwargs.get("material_indices")
+        )
+    return calculate_phong_lighting_batch(point_positions=positions, point_normals=normals, **kwargs)
+
 def flat_shading(polygon: Polygon, vertices: List[Vertex], **kwargs) -> Tuple[float, float, float]:
     """
     Menghitung warna untuk satu poligon menggunakan Flat Shading.
@@ -23,7 +45,8 @@ def flat_shading(polygon: Polygon, vertices: List[Vertex], **kwargs) -> Tuple[fl
     Args:
         polygon (Polygon): Indeks-indeks vertex yang membentuk poligon.
         vertices (List[Vertex]): Daftar semua vertex dalam objek.
-        **kwargs: Argumen pencahayaan (light_color, light_position, etc.).
+        **kwargs: Argumen pencahayaan (light_color, light_position, etc.),
+            atau `lights`/`materials` untuk mesin multi-cahaya.
 
     Returns:
         Tuple[float, float, float]: Warna RGB tunggal untuk poligon tersebut.
@@ -41,12 +64,8 @@ def flat_shading(polygon: Polygon, vertices: List[Vertex], **kwargs) -> Tuple[fl
     face_normal /= np.linalg.norm(face_normal)
 
     # Hitung pencahayaan di centroid
-    color = calculate_phong_lighting(
-        point_position=centroid,
-        point_normal=face_normal,
-        **kwargs
-    )
-    return color
+    color = _shade_points(centroid[None, :], face_normal[None, :], **kwargs)[0]
+    return tuple(color.tolist())
 
 def gouraud_shading(polygon: Polygon, vertices: List[Vertex], **kwargs) -> List[Tuple[float, float, float]]:
     """
@@ -56,23 +75,141 @@ def gouraud_shading(polygon: Polygon, vertices: List[Vertex], **kwargs) -> List[
     Args:
         polygon (Polygon): Indeks-indeks vertex yang membentuk poligon.
         vertices (List[Vertex]): Daftar semua vertex dalam objek.
-        **kwargs: Argumen pencahayaan.
+        **kwargs: Argumen pencahayaan, atau `lights`/`materials` untuk mesin multi-cahaya.
 
     Returns:
         List[Tuple[float, float, float]]: Daftar warna RGB untuk setiap vertex poligon.
     """
-    vertex_colors = []
-    for vertex_index in polygon:
-        vertex = vertices[vertex_index]
-        # Hitung pencahayaan di setiap vertex
-        color = calculate_phong_lighting(
-            point_position=vertex['position'],
-            point_normal=vertex['normal'],
-            **kwargs
-        )
-        vertex_colors.append(color)
-    
-    return vertex_colors
+    # Hitung pencahayaan di semua vertex poligon sekaligus
+    positions = np.array([vertices[i]['position'] for i in polygon], dtype=float)
+    normals = np.array([vertices[i]['normal'] for i in polygon], dtype=float)
+    vertex_colors = _shade_points(positions, normals, **kwargs)
+    return [tuple(color) for color in vertex_colors.tolist()]
+
+def flat_shading_mesh(positions: np.ndarray, normals: np.ndarray, faces: np.ndarray, **kwargs) -> np.ndarray:
+    """
+    Flat Shading untuk seluruh mesh dalam satu pass tervektorisasi.
+
+    Centroid dan normal rata-rata setiap face dihitung dari array indeks
+    sekaligus, lalu setiap face disinari tepat satu kali. Hasilnya sama
+    dengan memanggil `flat_shading` per poligon.
+
+    Complexity:
+        Time: O(F * k), F = jumlah face, k = vertex per face.
+        Space: O(F)
+
+    Args:
+        positions (np.ndarray): Posisi vertex, (V, 3).
+        normals (np.ndarray): Normal vertex, (V, 3).
+        faces (np.ndarray): Indeks vertex per face, (F, k).
+        **kwargs: Argumen pencahayaan (seperti `flat_shading`); `material_indices`
+            untuk mesin multi-cahaya berlaku per face.
+
+    Returns:
+        np.ndarray: Array uint8 (F, 3) berisi warna RGB setiap face.
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    normals = np.asarray(normals, dtype=float).reshape(-1, 3)
+    faces = np.asarray(faces, dtype=np.intp)
+    if faces.ndim != 2 or faces.shape[1] < 3:
+        raise ValueError("faces harus berbentuk (F, k) dengan k >= 3")
+
+    centroids = positions[faces].mean(axis=1)
+    face_normals = normals[faces].mean(axis=1)
+    face_normals /= np.linalg.norm(face_normals, axis=1, keepdims=True)
+    return _shade_points(centroids, face_normals, **kwargs)
+
+def gouraud_shading_mesh(positions: np.ndarray, normals: np.ndarray, **kwargs) -> np.ndarray:
+    """
+    Gouraud Shading untuk seluruh mesh: setiap vertex disinari tepat satu kali.
+
+    Vertex yang dipakai bersama oleh banyak face tidak dihitung ulang; warna
+    di dalam face diinterpolasi oleh rasterizer dari warna vertex ini.
+
+    Complexity:
+        Time: O(V)
+        Space: O(V)
+
+    Args:
+        positions (np.ndarray): Posisi vertex, (V, 3).
+        normals (np.ndarray): Normal vertex, (V, 3).
+        **kwargs: Argumen pencahayaan (seperti `gouraud_shading`); `material_indices`
+            untuk mesin multi-cahaya berlaku per vertex.
+
+    Returns:
+        np.ndarray: Array uint8 (V, 3) berisi warna RGB setiap vertex.
+    """
+    return _shade_points(positions, normals, **kwargs)
+
+def phong_shading_image(
+    positions: np.ndarray,
+    normals: np.ndarray,
+    triangles: np.ndarray,
+    width: int = 640,
+    height: int = 480,
+    target: Vector3D = None,
+    fov_y: float = 45.0,
+    background: Tuple[int, int, int] = (0, 0, 0),
+    cull: Optional[str] = None,
+    **kwargs
+) -> np.ndarray:
+    """
+    Phong Shading per piksel dengan rasterizer software.
+
+    Mesh diproyeksikan dari `camera_position` ke arah `target`, dirasterisasi
+    per blok piksel dengan z-buffer, lalu posisi dan normal diinterpolasi
+    (barycentric, perspective-correct) untuk setiap piksel yang terlihat.
+    Model Phong dievaluasi sekali per piksel tersebut dalam satu batch.
+
+    Complexity:
+        Time: O(T + F), F = piksel blok yang diuji untuk semua segitiga.
+        Space: O(W * H)
+
+    Args:
+        positions (np.ndarray): Posisi vertex, (V, 3).
+        normals (np.ndarray): Normal vertex, (V, 3).
+        triangles (np.ndarray): Indeks vertex segitiga, (T, 3).
+        width (int): Lebar gambar.
+        height (int): Tinggi gambar.
+        target (Vector3D, optional): Titik yang dilihat kamera; default pusat bounding box.
+        fov_y (float): Field of view vertikal (derajat).
+        background (Tuple[int, int, int]): Warna latar.
+        cull (str, optional): 'back' untuk back-face culling (mesh harus
+            berorientasi konsisten); default None menggambar kedua sisi.
+        **kwargs: Argumen pencahayaan (seperti `flat_shading`, wajib ada
+            `camera_position`); `material_indices` berlaku per segitiga.
+
+    Returns:
+        np.ndarray: Gambar uint8 (height, width, 3).
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    camera = np.asarray(kwargs["camera_position"], dtype=float)
+    if target is None:
+        target = (positions.min(axis=0) + positions.max(axis=0)) / 2
+
+    distance = np.linalg.norm(camera - np.asarray(target, dtype=float))
+    extent = np.linalg.norm(positions.max(axis=0) - positions.min(axis=0)) if len(positions) else 1.0
+    near = max(distance - extent, distance * 1e-3, 1e-3)
+    mvp = perspective(fov_y, width / height, near, distance + extent + near) @ look_at(camera, target)
+
+    # Interpolasi posisi dan normal sekaligus, lalu Phong per fragmen
+    raster = draw_triangles(
+        positions, triangles, mvp, width, height,
+        attributes={"position": positions, "normal": normals},
+        cull=cull
+    )
+
+    image = np.empty((height, width, 3), dtype=np.uint8)
+    image[:] = background
+    covered = raster["mask"]
+    if not covered.any():
+        return image
+
+    fragments = raster["attributes"]
+    if kwargs.get("material_indices") is not None:
+        kwargs = dict(kwargs, material_indices=np.asarray(kwargs["material_indices"])[raster["face"][covered]])
+    image[covered] = _shade_points(fragments["position"], fragments["normal"], **kwargs)
+    return image
 
 def phong_shading_vectors(polygon: Polygon, vertices: List[Vertex]) -> Tuple[List[Vector3D], List[Vector3D]]:
     """
@@ -0,0 +1,156 @@
+"""
+Representasi Run-Length (Span) untuk Hasil Pengisian.
+
+Area terisi disimpan sebagai span horizontal (y, x_start, x_end) dengan x_end
+inklusif di dalam satu array NumPy int32 (K, 3). Area 1000 x 1000 piksel cukup
+disimpan dalam 1000 span (~12 KB), bukan satu juta tuple (x, y) (puluhan MB).
+SpanList dapat diubah ke mask, array titik, daftar titik, atau langsung
+digambar ke canvas NumPy maupun gambar PIL.
+"""
+
+import numpy as np
+from typing import Iterator, List, Tuple, Union
+
+Point = Tuple[int, int]
+Color = Union[int, Tuple[int, ...]]
+
+class SpanList:
+    """
+    Kumpulan span horizontal (y, x_start, x_end), x_end inklusif.
+
+    Attributes:
+        data (np.ndarray): Array int32 (K, 3) berisi kolom y, x_start, x_end.
+    """
+    __slots__ = ("data",)
+
+    def __init__(self, data: np.ndarray = None):
+        if data is None:
+            data = np.empty((0, 3), dtype=np.int32)
+        self.data = np.ascontiguousarray(data, dtype=np.int32).reshape(-1, 3)
+
+    @classmethod
+    def from_runs(cls, ys: np.ndarray, x_start: np.ndarray, x_end: np.ndarray) -> "SpanList":
+        """Membuat SpanList dari tiga kolom; x_end inklusif."""
+        return cls(np.column_stack([ys, x_start, x_end]))
+
+    @classmethod
+    def from_mask(cls, mask: np.ndarray) -> "SpanList":
+        """
+        Memecah mask boolean (H, W) menjadi run horizontal maksimal, urut per baris lalu x.
+        """
+        height, width = mask.shape
+        padded = np.zeros((height, width + 2), dtype=np.int8)
+        padded[:, 1:-1] = mask
+        edges = np.diff(padded, axis=1)
+        rows, starts = np.nonzero(edges == 1)
+        _, ends = np.nonzero(edges == -1)
+        return cls.from_runs(rows, starts, ends - 1)
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.data[:, 0]
+
+    @property
+    def x0(self) -> np.ndarray:
+        return self.data[:, 1]
+
+    @property
+    def x1(self) -> np.ndarray:
+        return self.data[:, 2]
+
+    @property
+    def nbytes(self) -> int:
+        """Ukuran penyimpanan span dalam byte."""
+        return self.data.nbytes
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int]]:
+        return iter(map(tuple, self.data.tolist()))
+
+    def __repr__(self) -> str:
+        return f"SpanList(spans={len(self)}, pixels={self.pixel_count()})"
+
+    def lengths(self) -> np.ndarray:
+        """Panjang setiap span (span terbalik dihitung 0)."""
+        return np.maximum(self.data[:, 2].astype(np.int64) - self.data[:, 1] + 1, 0)
+
+    def pixel_count(self) -> int:
+        """Jumlah piksel yang dicakup semua span."""
+        return int(self.lengths().sum())
+
+    def clip(self, height: int, width: int) -> "SpanList":
+        """Memotong span ke batas canvas (height, width) dan membuang span kosong."""
+        y, x0, x1 = self.data[:, 0], np.maximum(self.data[:, 1], 0), np.minimum(self.data[:, 2], width - 1)
+        keep = (y >= 0) & (y < height) & (x0 <= x1)
+        return SpanList.from_runs(y[keep], x0[keep], x1[keep])
+
+    def to_points(self) -> np.ndarray:
+        """
+        Mengubah span menjadi array int32 (P, 2) berisi piksel (x, y) berurutan.
+        """
+        lengths = self.lengths()
+        rows = np.repeat(np.arange(len(self.data)), lengths)
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        points = np.empty((len(rows), 2), dtype=np.int32)
+        points[:, 0] = self.data[rows, 1] + offsets
+        points[:, 1] = self.data[rows, 0]
+        return points
+
+    def to_point_list(self) -> List[Point]:
+        """Mengubah span menjadi daftar tuple (x, y), format lama algoritma fill."""
+        points = self.to_points()
+        return list(zip(points[:, 0].tolist(), points[:, 1].tolist()))
+
+    def to_mask(self, height: int, width: int) -> np.ndarray:
+        """
+        Menulis span ke mask boolean (height, width); bagian di luar batas dipotong.
+
+        Setiap span menambah +1 di x_start dan -1 setelah x_end pada array
+        selisih, lalu cumsum per baris menghasilkan mask tanpa loop Python.
+        """
+        clipped = self.clip(height, width).data
+        diff = np.zeros((height, width + 1), dtype=np.int32)
+        np.add.at(diff, (clipped[:, 0], clipped[:, 1]), 1)
+        np.add.at(diff, (clipped[:, 0], clipped[:, 2] + 1), -1)
+        return np.cumsum(diff[:, :width], axis=1) > 0
+
+    def blit(self, canvas: np.ndarray, color: Color) -> int:
+        """
+        Mewarnai span pada canvas (H, W) atau (H, W, C) secara in-place.
+
+        Returns:
+            int: Jumlah piksel canvas yang diwarnai.
+        """
+        mask = self.to_mask(*canvas.shape[:2])
+        canvas[mask] = color
+        return int(np.count_nonzero(mask))
+
+    def blit_image(self, image, color: Color) -> int:
+        """
+        Mewarnai span pada gambar PIL secara in-place.
+
+        Hanya bounding box span yang diubah menjadi mask, lalu ditempel
+        dengan satu panggilan `Image.paste`.
+
+        Args:
+            image (PIL.Image.Image): Gambar tujuan.
+            color (Color): Warna isian sesuai mode gambar.
+
+        Returns:
+            int: Jumlah piksel gambar yang diwarnai.
+        """
+        from PIL import Image
+
+        width, height = image.size
+        clipped = self.clip(height, width)
+        if len(clipped) == 0:
+            return 0
+
+        top, left = int(clipped.y.min()), int(clipped.x0.min())
+        bottom, right = int(clipped.y.max()) + 1, int(clipped.x1.max()) + 1
+        local = SpanList.from_runs(clipped.y - top, clipped.x0 - left, clipped.x1 - left)
+        mask = local.to_mask(bottom - top, right - left)
+        image.paste(color, (left, top, right, bottom), Image.fromarray(mask.astype(np.uint8) * 255, "L"))
+        return int(np.count_nonzero(mask))
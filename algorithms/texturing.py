@@ -0,0 +1,576 @@
+"""
+Sampling Tekstur Tervektorisasi.
+
+Mengambil sampel tekstur NumPy (H, W, C) untuk seluruh array koordinat
+(u, v[, lod]) sekaligus: nearest neighbor, bilinear, trilinear dengan
+mipmap, dan anisotropic, serta mode wrap repeat/clamp/mirror. Konvensi UV mengikuti halaman
+Texturing: u ke kanan, v ke atas, (0, 0) di kiri bawah tekstur.
+
+`render_textured` menghubungkan sampler dengan `algorithms.rasterizer`:
+UV diinterpolasi per piksel (perspective-correct), turunan UV layar dihitung
+dari piksel tetangga untuk LOD, lalu seluruh frame di-sample dalam satu batch.
+"""
+
+import hashlib
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+
+from algorithms.rasterizer import draw_triangles
+
+FILTER_MODES = ("nearest", "bilinear", "trilinear", "anisotropic")
+WRAP_MODES = ("repeat", "clamp", "mirror")
+MIPMAP_FILTERS = ("box", "lanczos")
+
+# --- Koordinat dan Wrap --------------------------------------------------------
+
+def _as_texture(texture: np.ndarray) -> np.ndarray:
+    """Memastikan tekstur berbentuk (H, W, C)."""
+    texture = np.asarray(texture)
+    if texture.ndim == 2:
+        texture = texture[:, :, None]
+    if texture.ndim != 3 or texture.shape[0] == 0 or texture.shape[1] == 0:
+        raise ValueError("Tekstur harus berbentuk (H, W) atau (H, W, C) dan tidak kosong")
+    return texture
+
+def _check_wrap(wrap: str):
+    if wrap not in WRAP_MODES:
+        raise ValueError(f"Mode wrap harus salah satu dari {WRAP_MODES}")
+
+def _wrap_index(index: np.ndarray, size: int, wrap: str) -> np.ndarray:
+    """Memetakan indeks texel integer ke [0, size) sesuai mode wrap."""
+    if wrap == "repeat":
+        return np.mod(index, size)
+    if wrap == "clamp":
+        return np.clip(index, 0, size - 1)
+    mirrored = np.mod(index, 2 * size)
+    return np.where(mirrored < size, mirrored, 2 * size - 1 - mirrored)
+
+def wrap_uv(u: np.ndarray, v: np.ndarray, wrap: str = "repeat") -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Memetakan koordinat UV di luar [0, 1] kembali ke rentang tekstur.
+
+    Args:
+        u (np.ndarray): Koordinat u.
+        v (np.ndarray): Koordinat v.
+        wrap (str): 'repeat', 'clamp', atau 'mirror'.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (u, v) hasil wrap.
+    """
+    _check_wrap(wrap)
+    u, v = np.asarray(u, dtype=float), np.asarray(v, dtype=float)
+    if wrap == "repeat":
+        return np.mod(u, 1.0), np.mod(v, 1.0)
+    if wrap == "clamp":
+        return np.clip(u, 0.0, 1.0), np.clip(v, 0.0, 1.0)
+    return 1.0 - np.abs(np.mod(u, 2.0) - 1.0), 1.0 - np.abs(np.mod(v, 2.0) - 1.0)
+
+# --- Sampler -------------------------------------------------------------------
+
+def sample_nearest(texture: np.ndarray, u: np.ndarray, v: np.ndarray, wrap: str = "repeat") -> np.ndarray:
+    """
+    Nearest neighbor: satu texel terdekat per koordinat.
+
+    Complexity:
+        Time: O(N)
+        Space: O(N * C)
+
+    Args:
+        texture (np.ndarray): Tekstur (H, W) atau (H, W, C).
+        u (np.ndarray): Koordinat u, (N,).
+        v (np.ndarray): Koordinat v, (N,).
+        wrap (str): Mode wrap.
+
+    Returns:
+        np.ndarray: Warna float32 (N, C).
+    """
+    _check_wrap(wrap)
+    texture = _as_texture(texture)
+    height, width = texture.shape[:2]
+    x = _wrap_index(np.floor(np.asarray(u) * width).astype(np.int64), width, wrap)
+    y = _wrap_index(np.floor((1 - np.asarray(v)) * height).astype(np.int64), height, wrap)
+    return texture[y, x].astype(np.float32)
+
+def sample_bilinear(texture: np.ndarray, u: np.ndarray, v: np.ndarray, wrap: str = "repeat") -> np.ndarray:
+    """
+    Bilinear: interpolasi linear 2D dari 2x2 texel di sekitar koordinat.
+
+    Pusat texel berada di (i + 0.5) / ukuran; keempat tetangga di-wrap
+    sendiri-sendiri sehingga tepi tekstur mengikuti mode wrap.
+
+    Complexity:
+        Time: O(N)
+        Space: O(N * C)
+
+    Args:
+        texture (np.ndarray): Tekstur (H, W) atau (H, W, C).
+        u (np.ndarray): Koordinat u, (N,).
+        v (np.ndarray): Koordinat v, (N,).
+        wrap (str): Mode wrap.
+
+    Returns:
+        np.ndarray: Warna float32 (N, C).
+    """
+    _check_wrap(wrap)
+    texture = _as_texture(texture)
+    height, width = texture.shape[:2]
+    x = np.asarray(u, dtype=np.float32) * width - 0.5
+    y = (1 - np.asarray(v, dtype=np.float32)) * height - 0.5
+    x0, y0 = np.floor(x), np.floor(y)
+    fx, fy = (x - x0)[:, None], (y - y0)[:, None]
+
+    x0 = x0.astype(np.int64)
+    y0 = y0.astype(np.int64)
+    xa, xb = _wrap_index(x0, width, wrap), _wrap_index(x0 + 1, width, wrap)
+    ya, yb = _wrap_index(y0, height, wrap), _wrap_index(y0 + 1, height, wrap)
+
+    c00 = texture[ya, xa].astype(np.float32)
+    c10 = texture[ya, xb].astype(np.float32)
+    c01 = texture[yb, xa].astype(np.float32)
+    c11 = texture[yb, xb].astype(np.float32)
+    top = c00 + fx * (c10 - c00)
+    bottom = c01 + fx * (c11 - c01)
+    return top + fy * (bottom - top)
+
+# --- Mipmap --------------------------------------------------------------------
+
+def _mip_shapes(height: int, width: int, max_levels: Optional[int]) -> List[Tuple[int, int]]:
+    """Ukuran setiap level mipmap: max(1, ukuran // 2) hingga 1x1."""
+    shapes = [(height, width)]
+    while shapes[-1] != (1, 1) and (max_levels is None or len(shapes) < max_levels):
+        height, width = shapes[-1]
+        shapes.append((max(1, height // 2), max(1, width // 2)))
+    return shapes
+
+def _downsample_box(level: np.ndarray) -> np.ndarray:
+    """Box filter 2x2; pada ukuran ganjil baris/kolom terakhir tidak ikut dirata-rata."""
+    height, width = level.shape[:2]
+    if height > 1:
+        rows = 2 * (height // 2)
+        level = (level[0:rows:2] + level[1:rows:2]) * 0.5
+    if width > 1:
+        cols = 2 * (width // 2)
+        level = (level[:, 0:cols:2] + level[:, 1:cols:2]) * 0.5
+    return level
+
+def generate_mipmaps(texture: np.ndarray, max_levels: Optional[int] = None) -> List[np.ndarray]:
+    """
+    Membuat piramida mipmap dengan box filter 2x2 hingga ukuran 1x1.
+
+    Setiap level berukuran max(1, ukuran // 2); pada ukuran ganjil baris atau
+    kolom terakhir tidak ikut dirata-rata.
+
+    Args:
+        texture (np.ndarray): Tekstur level 0.
+        max_levels (int, optional): Jumlah level maksimum (None = sampai 1x1).
+
+    Returns:
+        List[np.ndarray]: Level mipmap float32 (H_i, W_i, C), level 0 pertama.
+    """
+    level = _as_texture(texture).astype(np.float32)
+    levels = [level]
+    for _ in _mip_shapes(*level.shape[:2], max_levels)[1:]:
+        level = _downsample_box(level)
+        levels.append(level)
+    return levels
+
+def _cast_level(level: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """Mengembalikan level float ke dtype tekstur (dibulatkan untuk dtype integer)."""
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        return np.clip(np.rint(level), info.min, info.max).astype(dtype)
+    return level.astype(dtype)
+
+def texture_hash(texture: np.ndarray) -> str:
+    """Hash isi tekstur (bentuk, dtype, dan piksel) untuk kunci cache."""
+    texture = np.ascontiguousarray(texture)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{texture.shape}{texture.dtype.str}".encode())
+    digest.update(texture.data)
+    return digest.hexdigest()
+
+class MipmapPyramid:
+    """
+    Piramida mipmap dalam satu buffer kontigu dengan offset per level.
+
+    Level disimpan berurutan (level 0 pertama) dalam dtype tekstur asli,
+    sehingga tambahan memori terhadap tekstur sekitar 1/4 + 1/16 + ... = 33%.
+    Indexing `pyramid[i]` mengembalikan view (H_i, W_i, C) tanpa salinan,
+    jadi objek ini dapat langsung dipakai sebagai `mipmaps` pada sampler.
+
+    Attributes:
+        buffer (np.ndarray): Buffer 1D read-only berisi semua level.
+        shapes (Tuple[Tuple[int, int, int], ...]): Bentuk setiap level.
+        offsets (np.ndarray): Offset awal setiap level di buffer, (L + 1,).
+        filter (str): Filter downsampling yang dipakai ('box' atau 'lanczos').
+    """
+    __slots__ = ("buffer", "shapes", "offsets", "filter")
+
+    def __init__(self, levels: Sequence[np.ndarray], filter: str = "box"):
+        levels = [_as_texture(level) for level in levels]
+        if not levels:
+            raise ValueError("Minimal satu level mipmap diperlukan")
+        self.shapes = tuple(level.shape for level in levels)
+        self.offsets = np.concatenate([[0], np.cumsum([level.size for level in levels])])
+        self.buffer = np.empty(int(self.offsets[-1]), dtype=levels[0].dtype)
+        for level, start in zip(levels, self.offsets[:-1].tolist()):
+            self.buffer[start:start + level.size] = level.ravel()
+        self.buffer.setflags(write=False)
+        self.filter = filter
+
+    @classmethod
+    def from_texture(cls, texture: np.ndarray, filter: str = "box", max_levels: Optional[int] = None) -> "MipmapPyramid":
+        """
+        Membangun piramida dari tekstur level 0.
+
+        'box' adalah jalur cepat: setiap level dirata-rata 2x2 dari level
+        sebelumnya (float32, tanpa pembulatan berantai). 'lanczos' mengecilkan
+        level 0 langsung ke setiap ukuran dengan PIL (lebih tajam, lebih lambat).
+
+        Complexity:
+            Time: O(H * W * C) untuk 'box'.
+            Space: O(H * W * C)
+
+        Args:
+            texture (np.ndarray): Tekstur (H, W) atau (H, W, C).
+            filter (str): 'box' atau 'lanczos'.
+            max_levels (int, optional): Jumlah level maksimum (None = sampai 1x1).
+
+        Returns:
+            MipmapPyramid: Piramida dalam dtype tekstur.
+        """
+        if filter not in MIPMAP_FILTERS:
+            raise ValueError(f"Filter mipmap harus salah satu dari {MIPMAP_FILTERS}")
+        texture = _as_texture(texture)
+        shapes = _mip_shapes(*texture.shape[:2], max_levels)
+
+        if filter == "box":
+            levels = [_cast_level(level, texture.dtype) for level in generate_mipmaps(texture, max_levels)]
+            levels[0] = texture
+            return cls(levels, filter)
+
+        from PIL import Image
+
+        channels = [Image.fromarray(np.ascontiguousarray(texture[:, :, c], dtype=np.float32), "F")
+                    for c in range(texture.shape[2])]
+        levels = [texture]
+        for height, width in shapes[1:]:
+            resized = [np.asarray(ch.resize((width, height), Image.Resampling.LANCZOS)) for ch in channels]
+            levels.append(_cast_level(np.stack(resized, axis=-1), texture.dtype))
+        return cls(levels, filter)
+
+    def __len__(self) -> int:
+        return len(self.shapes)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        index = range(len(self))[index]
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.buffer[start:end].reshape(self.shapes[index])
+
+    @property
+    def levels(self) -> List[np.ndarray]:
+        """Semua level sebagai view (H_i, W_i, C)."""
+        return [self[i] for i in range(len(self))]
+
+    @property
+    def nbytes(self) -> int:
+        """Ukuran buffer seluruh level dalam byte."""
+        return self.buffer.nbytes
+
+    @property
+    def base_nbytes(self) -> int:
+        """Ukuran level 0 (tekstur asli) dalam byte."""
+        return int(self.offsets[1]) * self.buffer.itemsize
+
+    @property
+    def overhead(self) -> float:
+        """Tambahan memori level 1..L relatif terhadap level 0 (~0.33)."""
+        return (self.nbytes - self.base_nbytes) / self.base_nbytes
+
+    def __repr__(self) -> str:
+        height, width = self.shapes[0][:2]
+        return f"MipmapPyramid({width}x{height}, levels={len(self)}, filter={self.filter!r}, overhead={self.overhead:.1%})"
+
+# --- Filtering Trilinear ------------------------------------------------------
+
+def sample_trilinear(
+    mipmaps: Sequence[np.ndarray],
+    u: np.ndarray,
+    v: np.ndarray,
+    lod: np.ndarray,
+    wrap: str = "repeat"
+) -> np.ndarray:
+    """
+    Trilinear: bilinear pada dua level mipmap terdekat, lalu interpolasi
+    linear antar level menurut bagian pecahan LOD.
+
+    Titik dikelompokkan per level dasar, sehingga loop Python hanya atas
+    jumlah level (log2 ukuran tekstur), bukan atas titik.
+
+    Complexity:
+        Time: O(N * log S), S = ukuran sisi tekstur.
+        Space: O(N * C)
+
+    Args:
+        mipmaps (Sequence[np.ndarray]): Level mipmap, level 0 pertama.
+        u (np.ndarray): Koordinat u, (N,).
+        v (np.ndarray): Koordinat v, (N,).
+        lod (np.ndarray): Level of detail per titik, (N,).
+        wrap (str): Mode wrap.
+
+    Returns:
+        np.ndarray: Warna float32 (N, C).
+    """
+    u, v = np.asarray(u), np.asarray(v)
+    top = len(mipmaps) - 1
+    lod = np.clip(np.broadcast_to(np.asarray(lod, dtype=np.float32), u.shape), 0, top)
+    base = np.floor(lod).astype(np.int64)
+    frac = (lod - base)[:, None]
+
+    result = np.empty((len(u), _as_texture(mipmaps[0]).shape[2]), dtype=np.float32)
+    for level in np.unique(base).tolist():
+        ids = np.flatnonzero(base == level)
+        color0 = sample_bilinear(mipmaps[level], u[ids], v[ids], wrap)
+        if level == top:
+            result[ids] = color0
+            continue
+        color1 = sample_bilinear(mipmaps[level + 1], u[ids], v[ids], wrap)
+        result[ids] = color0 + frac[ids] * (color1 - color0)
+    return result
+
+def calculate_lod(
+    dudx: np.ndarray,
+    dudy: np.ndarray,
+    dvdx: np.ndarray,
+    dvdy: np.ndarray,
+    texture_size: Tuple[int, int]
+) -> np.ndarray:
+    """
+    Menghitung level of detail dari turunan UV terhadap piksel layar.
+
+    LOD = log2(max(|d(uv)/dx|, |d(uv)/dy|)) dalam satuan texel, minimal 0.
+
+    Args:
+        dudx, dudy (np.ndarray): Turunan u terhadap x dan y layar.
+        dvdx, dvdy (np.ndarray): Turunan v terhadap x dan y layar.
+        texture_size (Tuple[int, int]): (width, height) tekstur level 0.
+
+    Returns:
+        np.ndarray: LOD per titik.
+    """
+    px, py = _footprint_axes(dudx, dudy, dvdx, dvdy, texture_size)
+    return _lod_from_length(np.maximum(px, py))
+
+def _footprint_axes(dudx, dudy, dvdx, dvdy, texture_size: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Panjang sumbu footprint piksel (arah x dan y layar) dalam satuan texel."""
+    width, height = texture_size
+    px = np.hypot(np.asarray(dudx) * width, np.asarray(dvdx) * height)
+    py = np.hypot(np.asarray(dudy) * width, np.asarray(dvdy) * height)
+    return px, py
+
+def _lod_from_length(length: np.ndarray) -> np.ndarray:
+    return np.maximum(np.log2(np.where(length > 0, length, 1.0)), 0.0)
+
+# --- Filtering Anisotropic -----------------------------------------------------
+
+def sample_anisotropic(
+    mipmaps: Sequence[np.ndarray],
+    u: np.ndarray,
+    v: np.ndarray,
+    derivatives: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    max_anisotropy: int = 8,
+    wrap: str = "repeat"
+) -> np.ndarray:
+    """
+    Anisotropic: beberapa tap trilinear di sepanjang sumbu mayor footprint.
+
+    Footprint piksel di ruang texel dibentuk oleh turunan UV terhadap x dan y
+    layar. Jumlah tap N = min(ceil(mayor / minor), max_anisotropy), LOD
+    diambil dari mayor / N (bukan dari mayor seperti trilinear), dan tap
+    tersebar merata di sepanjang sumbu mayor lalu dirata-rata. Dengan
+    max_anisotropy = 1 hasilnya sama dengan `sample_trilinear`.
+
+    Titik dikelompokkan menurut N, sehingga loop Python hanya atas
+    nilai N yang muncul (paling banyak max_anisotropy).
+
+    Complexity:
+        Time: O(N_tap * log S), N_tap = total tap semua titik.
+        Space: O(N_tap * C)
+
+    Args:
+        mipmaps (Sequence[np.ndarray]): Level mipmap, level 0 pertama.
+        u (np.ndarray): Koordinat u, (N,).
+        v (np.ndarray): Koordinat v, (N,).
+        derivatives (Tuple[np.ndarray, ...]): (dudx, dudy, dvdx, dvdy), lihat `uv_derivatives`.
+        max_anisotropy (int): Jumlah tap maksimum per piksel (misal 2, 4, 8, 16).
+        wrap (str): Mode wrap.
+
+    Returns:
+        np.ndarray: Warna float32 (N, C).
+    """
+    if max_anisotropy < 1:
+        raise ValueError("max_anisotropy minimal 1")
+    u, v = np.asarray(u, dtype=float), np.asarray(v, dtype=float)
+    dudx, dudy, dvdx, dvdy = (np.asarray(d, dtype=float) for d in derivatives)
+    height, width = mipmaps[0].shape[:2]
+    px, py = _footprint_axes(dudx, dudy, dvdx, dvdy, (width, height))
+
+    x_major = px >= py
+    major = np.maximum(px, py)
+    minor = np.minimum(px, py)
+    ratio = np.where(minor > 0, major / np.where(minor > 0, minor, 1.0), np.where(major > 0, np.inf, 1.0))
+    taps = np.clip(np.ceil(ratio), 1, max_anisotropy).astype(np.int64)
+    lod = _lod_from_length(major / taps)
+    axis_u = np.where(x_major, dudx, dudy)
+    axis_v = np.where(x_major, dvdx, dvdy)
+
+    result = np.empty((len(u), _as_texture(mipmaps[0]).shape[2]), dtype=np.float32)
+    for count in np.unique(taps).tolist():
+        ids = np.flatnonzero(taps == count)
+        offsets = (np.arange(count) + 0.5) / count - 0.5
+        tap_u = (u[ids, None] + offsets * axis_u[ids, None]).ravel()
+        tap_v = (v[ids, None] + offsets * axis_v[ids, None]).ravel()
+        colors = sample_trilinear(mipmaps, tap_u, tap_v, np.repeat(lod[ids], count), wrap)
+        result[ids] = colors.reshape(len(ids), count, -1).mean(axis=1)
+    return result
+
+def sample_texture(
+    texture: np.ndarray,
+    u: np.ndarray,
+    v: np.ndarray,
+    method: str = "bilinear",
+    wrap: str = "repeat",
+    lod: Optional[np.ndarray] = None,
+    mipmaps: Optional[Sequence[np.ndarray]] = None,
+    derivatives: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None,
+    max_anisotropy: int = 8
+) -> np.ndarray:
+    """
+    Mengambil sampel tekstur dengan metode filtering pilihan.
+
+    Args:
+        texture (np.ndarray): Tekstur level 0.
+        u (np.ndarray): Koordinat u, (N,).
+        v (np.ndarray): Koordinat v, (N,).
+        method (str): 'nearest', 'bilinear', 'trilinear', atau 'anisotropic'.
+        wrap (str): Mode wrap.
+        lod (np.ndarray, optional): LOD per titik, wajib untuk 'trilinear'.
+        mipmaps (Sequence[np.ndarray], optional): Mipmap yang sudah dibuat
+            (daftar level atau `MipmapPyramid`); dibuat dari `texture` jika None.
+        derivatives (Tuple[np.ndarray, ...], optional): Turunan UV layar
+            (dudx, dudy, dvdx, dvdy), wajib untuk 'anisotropic'.
+        max_anisotropy (int): Jumlah tap maksimum untuk 'anisotropic'.
+
+    Returns:
+        np.ndarray: Warna float32 (N, C).
+    """
+    if method not in FILTER_MODES:
+        raise ValueError(f"Metode filtering harus salah satu dari {FILTER_MODES}")
+    if method == "nearest":
+        return sample_nearest(texture, u, v, wrap)
+    if method == "bilinear":
+        return sample_bilinear(texture, u, v, wrap)
+    if method == "trilinear" and lod is None:
+        raise ValueError("Filtering trilinear membutuhkan nilai lod")
+    if method == "anisotropic" and derivatives is None:
+        raise ValueError("Filtering anisotropic membutuhkan turunan UV")
+    if mipmaps is None:
+        mipmaps = generate_mipmaps(texture)
+    if method == "anisotropic":
+        return sample_anisotropic(mipmaps, u, v, derivatives, max_anisotropy, wrap)
+    return sample_trilinear(mipmaps, u, v, lod, wrap)
+
+# --- Integrasi Rasterizer ------------------------------------------------------
+
+def uv_derivatives(triangle_ids: np.ndarray, uv: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Turunan UV terhadap x dan y layar untuk setiap piksel tertutup.
+
+    Selisih diambil dari tetangga kanan/bawah (atau kiri/atas jika tidak
+    tersedia) yang berasal dari segitiga yang sama, seperti quad 2x2 pada
+    GPU; seam UV antar segitiga tidak menghasilkan lonjakan LOD.
+
+    Args:
+        triangle_ids (np.ndarray): Indeks segitiga per piksel (H, W), -1 = kosong.
+        uv (np.ndarray): UV piksel tertutup (K, 2), urut baris.
+
+    Returns:
+        Tuple[np.ndarray, ...]: (dudx, dudy, dvdx, dvdy), masing-masing (K,).
+    """
+    mask = triangle_ids >= 0
+    grid = np.zeros(triangle_ids.shape + (2,))
+    grid[mask] = uv
+
+    def along(axis: int) -> np.ndarray:
+        ids = np.moveaxis(triangle_ids, axis, 0)
+        values = np.moveaxis(grid, axis, 0)
+        same = (ids[1:] == ids[:-1]) & (ids[:-1] >= 0)
+        step = np.where(same[..., None], values[1:] - values[:-1], 0.0)
+        derivative = np.zeros_like(values)
+        derivative[:-1] = step
+        # Piksel tanpa tetangga maju memakai selisih mundur
+        backward = same & ~np.concatenate([same[1:], np.zeros_like(same[:1])])
+        derivative[1:][backward] = step[backward]
+        return np.moveaxis(derivative, 0, axis)[mask]
+
+    ddx, ddy = along(1), along(0)
+    return ddx[:, 0], ddy[:, 0], ddx[:, 1], ddy[:, 1]
+
+def render_textured(
+    positions: np.ndarray,
+    triangles: np.ndarray,
+    uvs: np.ndarray,
+    texture: np.ndarray,
+    mvp: np.ndarray,
+    width: int,
+    height: int,
+    method: str = "bilinear",
+    wrap: str = "repeat",
+    mipmaps: Optional[Sequence[np.ndarray]] = None,
+    background: Tuple[int, ...] = (0, 0, 0),
+    cull: Optional[str] = None,
+    max_anisotropy: int = 8
+) -> np.ndarray:
+    """
+    Merender mesh bertekstur dengan rasterizer software.
+
+    Complexity:
+        Time: O(T + B log B + K * A * log S), K = piksel tertutup, A = tap anisotropic.
+        Space: O(W * H * C)
+
+    Args:
+        positions (np.ndarray): Posisi vertex, (V, 3).
+        triangles (np.ndarray): Indeks vertex segitiga, (T, 3).
+        uvs (np.ndarray): Koordinat tekstur per vertex, (V, 2).
+        texture (np.ndarray): Tekstur uint8 (H, W, C).
+        mvp (np.ndarray): Matriks projection @ view @ model (4x4).
+        width (int): Lebar gambar.
+        height (int): Tinggi gambar.
+        method (str): Metode filtering, lihat `sample_texture`.
+        wrap (str): Mode wrap.
+        mipmaps (Sequence[np.ndarray], optional): Mipmap tekstur untuk
+            'trilinear'/'anisotropic' (daftar level atau `MipmapPyramid`).
+        background (Tuple[int, ...]): Warna latar dengan C kanal.
+        cull (str, optional): Mode culling, lihat `algorithms.rasterizer.rasterize`.
+        max_anisotropy (int): Jumlah tap maksimum untuk 'anisotropic'.
+
+    Returns:
+        np.ndarray: Gambar uint8 (height, width, C).
+    """
+    texture = _as_texture(texture)
+    raster = draw_triangles(positions, triangles, mvp, width, height, attributes={"uv": uvs}, cull=cull)
+
+    image = np.empty((height, width, texture.shape[2]), dtype=np.uint8)
+    image[:] = background
+    mask = raster["mask"]
+    if not mask.any():
+        return image
+
+    uv = raster["attributes"]["uv"]
+    lod = derivatives = None
+    if method in ("trilinear", "anisotropic"):
+        derivatives = uv_derivatives(raster["triangle"], uv)
+        lod = calculate_lod(*derivatives, (texture.shape[1], texture.shape[0]))
+    colors = sample_texture(texture, uv[:, 0], uv[:, 1], method, wrap, lod, mipmaps, derivatives, max_anisotropy)
+    image[mask] = np.clip(np.rint(colors), 0, 255).astype(np.uint8)
+    return image
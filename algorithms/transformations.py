@@ -4,8 +4,15 @@ algorithms/transformations.py
 Implementasi algoritma transformasi geometri 2D menggunakan matriks.
 """
 
+import math
 import numpy as np
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple, Union
+
+# Jumlah titik per potongan saat transformasi batch (~512 KB float64, muat di cache L2)
+_TRANSFORM_CHUNK = 1 << 15
+# Rata-rata titik per bentuk minimum agar stack matriks diproses per slice bentuk
+_MIN_POINTS_PER_SLICE = 64
 
 def create_translation_matrix(tx: float, ty: float) -> np.ndarray:
     """
@@ -49,12 +56,10 @@ def create_rotation_matrix(angle_deg: float, cx: float = 0, cy: float = 0) -> np
         [0,      0,     1]
     ], dtype=float)
     
-    # Jika pusat rotasi bukan origin, gunakan composite transformation
+    # Jika pusat rotasi bukan origin: T(cx, cy) × R(θ) × T(-cx, -cy)
     if cx != 0 or cy != 0:
-        # T(cx, cy) × R(θ) × T(-cx, -cy)
-        t1 = create_translation_matrix(-cx, -cy)
-        t2 = create_translation_matrix(cx, cy)
-        rotation = combine_transformations([t1, rotation, t2])
+        rotation[0, 2] = cx - cos_a * cx + sin_a * cy
+        rotation[1, 2] = cy - sin_a * cx - cos_a * cy
     
     return rotation
 
@@ -79,12 +84,10 @@ def create_scale_matrix(sx: float, sy: float, cx: float = 0, cy: float = 0) -> n
         [0,  0,  1]
     ], dtype=float)
     
-    # Jika pusat skala bukan origin
+    # Jika pusat skala bukan origin: T(cx, cy) × S(sx, sy) × T(-cx, -cy)
     if cx != 0 or cy != 0:
-        # T(cx, cy) × S(sx, sy) × T(-cx, -cy)
-        t1 = create_translation_matrix(-cx, -cy)
-        t2 = create_translation_matrix(cx, cy)
-        scale = combine_transformations([t1, scale, t2])
+        scale[0, 2] = cx - sx * cx
+        scale[1, 2] = cy - sy * cy
     
     return scale
 
@@ -162,10 +165,28 @@ def combine_transformations(matrices: List[np.ndarray]) -> np.ndarray:
     if not matrices:
         return np.identity(3)
     
-    result = matrices[0]
+    # Matriks affine dikomposisi dengan rumus tertutup pada float Python
+    a, b, c, d, e, f = 1.0, 0.0, 0.0, 0.0, 1.0, 0.0
+    for matrix in matrices:
+        if isinstance(matrix, Affine2D):
+            a2, b2, c2, d2, e2, f2 = matrix
+        else:
+            rows = (matrix if isinstance(matrix, np.ndarray) else np.asarray(matrix, dtype=float)).tolist()
+            if rows[2] != [0.0, 0.0, 1.0]:
+                return _combine_full(matrices)
+            (a2, b2, c2), (d2, e2, f2) = rows[0], rows[1]
+        a, b, c, d, e, f = (
+            a2 * a + b2 * d, a2 * b + b2 * e, a2 * c + b2 * f + c2,
+            d2 * a + e2 * d, d2 * b + e2 * e, d2 * c + e2 * f + f2
+        )
+    return np.array((a, b, c, d, e, f, 0.0, 0.0, 1.0), dtype=float).reshape(3, 3)
+
+
+def _combine_full(matrices: List[np.ndarray]) -> np.ndarray:
+    """Perkalian matriks 3x3 penuh untuk rantai yang memuat matriks non-affine."""
+    result = np.asarray(matrices[0].to_matrix() if isinstance(matrices[0], Affine2D) else matrices[0])
     for matrix in matrices[1:]:
-        result = matrix @ result  # Matrix multiplication
-    
+        result = (matrix.to_matrix() if isinstance(matrix, Affine2D) else matrix) @ result
     return result
 
 
@@ -187,18 +208,8 @@ def apply_transformation(points: List[Tuple[float, float]],
         >>> transformed = apply_transformation(points, matrix)
         >>> print(transformed)  # [(50, 30), (150, 30), (150, 130)]
     """
-    # Convert to homogeneous coordinates
-    points_array = np.array(points)
-    ones = np.ones((len(points), 1))
-    homogeneous = np.hstack([points_array, ones])  # [x, y, 1]
-    
-    # Apply transformation: P' = M × P^T
-    transformed = (matrix @ homogeneous.T).T
-    
-    # Convert back to 2D coordinates (remove homogeneous coordinate)
-    result = transformed[:, :2].tolist()
-    
-    return result
+    # Format list dipertahankan untuk kode lama; gunakan transform_points untuk array
+    return transform_points(points, matrix).tolist()
 
 
 def apply_transformation_to_point(point: Tuple[float, float], 
@@ -263,12 +274,349 @@ def inverse_transformation(matrix: np.ndarray) -> np.ndarray:
     Returns:
         Matriks invers
     """
+    affine = _as_affine(matrix)
+    if affine is not None:
+        return affine.inverse().to_matrix()
     try:
         return np.linalg.inv(matrix)
     except np.linalg.LinAlgError:
         raise ValueError("Matriks tidak memiliki invers (singular matrix)")
 
 
+# ============================================================================
+# AFFINE 2D (BENTUK TERTUTUP)
+# ============================================================================
+
+class Affine2D:
+    """
+    Transformasi affine 2D sebagai enam float.
+
+    Merepresentasikan matriks [[a, b, c], [d, e, f], [0, 0, 1]], yaitu
+    x' = a*x + b*y + c dan y' = d*x + e*y + f. Komposisi dan invers dihitung
+    dengan rumus tertutup pada float Python, tanpa alokasi ndarray, sehingga
+    rantai transformasi panjang (misal per frame animasi) tetap murah.
+    Objek diperlakukan immutable: semua operasi mengembalikan objek baru.
+
+    Attributes:
+        a, b, c, d, e, f: Koefisien matriks (baris pertama dan kedua)
+    """
+    __slots__ = ("a", "b", "c", "d", "e", "f")
+
+    def __init__(self, a: float = 1.0, b: float = 0.0, c: float = 0.0,
+                 d: float = 0.0, e: float = 1.0, f: float = 0.0):
+        self.a, self.b, self.c = float(a), float(b), float(c)
+        self.d, self.e, self.f = float(d), float(e), float(f)
+
+    # --- Konstruktor ---------------------------------------------------------
+
+    @classmethod
+    def identity(cls) -> "Affine2D":
+        return cls()
+
+    @classmethod
+    def translation(cls, tx: float, ty: float) -> "Affine2D":
+        return cls(1.0, 0.0, tx, 0.0, 1.0, ty)
+
+    @classmethod
+    def rotation(cls, angle_deg: float, cx: float = 0, cy: float = 0) -> "Affine2D":
+        """Rotasi counter-clockwise terhadap (cx, cy): T(cx, cy) × R(θ) × T(-cx, -cy)."""
+        angle_rad = math.radians(angle_deg)
+        cos_a, sin_a = math.cos(angle_rad), math.sin(angle_rad)
+        return cls(cos_a, -sin_a, cx - cos_a * cx + sin_a * cy,
+                   sin_a, cos_a, cy - sin_a * cx - cos_a * cy)
+
+    @classmethod
+    def scale(cls, sx: float, sy: float, cx: float = 0, cy: float = 0) -> "Affine2D":
+        """Skala terhadap (cx, cy)."""
+        return cls(sx, 0.0, cx - sx * cx, 0.0, sy, cy - sy * cy)
+
+    @classmethod
+    def shear(cls, shx: float, shy: float) -> "Affine2D":
+        return cls(1.0, shx, 0.0, shy, 1.0, 0.0)
+
+    @classmethod
+    def reflection(cls, axis: str = 'x') -> "Affine2D":
+        """Refleksi terhadap sumbu 'x', 'y', atau 'origin'."""
+        sx, sy = {'x': (1.0, -1.0), 'y': (-1.0, 1.0)}.get(axis, (-1.0, -1.0))
+        return cls(sx, 0.0, 0.0, 0.0, sy, 0.0)
+
+    # --- Konversi ndarray ----------------------------------------------------
+
+    @classmethod
+    def from_matrix(cls, matrix: np.ndarray) -> "Affine2D":
+        """
+        Membuat Affine2D dari matriks 3x3.
+
+        Raises:
+            ValueError: Jika matriks bukan 3x3 atau baris terakhir bukan [0, 0, 1]
+        """
+        affine = _as_affine(matrix)
+        if affine is None:
+            raise ValueError("Matriks harus 3x3 dengan baris terakhir [0, 0, 1]")
+        return affine
+
+    def to_matrix(self) -> np.ndarray:
+        """Matriks 3x3 float untuk API berbasis ndarray."""
+        return np.array((self.a, self.b, self.c, self.d, self.e, self.f, 0.0, 0.0, 1.0)).reshape(3, 3)
+
+    # --- Operasi -------------------------------------------------------------
+
+    def __matmul__(self, other: "Affine2D") -> "Affine2D":
+        """self @ other: terapkan `other` dahulu, lalu `self` (sama seperti matriks)."""
+        if not isinstance(other, Affine2D):
+            return NotImplemented
+        a, b, d, e = self.a, self.b, self.d, self.e
+        return Affine2D(
+            a * other.a + b * other.d, a * other.b + b * other.e, a * other.c + b * other.f + self.c,
+            d * other.a + e * other.d, d * other.b + e * other.e, d * other.c + e * other.f + self.f
+        )
+
+    def then(self, other: "Affine2D") -> "Affine2D":
+        """Terapkan `self` lalu `other` (urutan baca kiri ke kanan)."""
+        return other @ self
+
+    @property
+    def determinant(self) -> float:
+        return self.a * self.e - self.b * self.d
+
+    def inverse(self) -> "Affine2D":
+        """
+        Invers bentuk tertutup: A^-1 untuk bagian linear, -A^-1 t untuk translasi.
+
+        Raises:
+            ValueError: Jika determinan bagian linear nol
+        """
+        det = self.determinant
+        if det == 0:
+            raise ValueError("Matriks tidak memiliki invers (singular matrix)")
+        a, b, d, e = self.e / det, -self.b / det, -self.d / det, self.a / det
+        return Affine2D(a, b, -(a * self.c + b * self.f), d, e, -(d * self.c + e * self.f))
+
+    def apply_point(self, x: float, y: float) -> Tuple[float, float]:
+        return (self.a * x + self.b * y + self.c, self.d * x + self.e * y + self.f)
+
+    def apply(self, points: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Transformasi array titik (N, 2) melalui `transform_points`."""
+        return transform_points(points, self.to_matrix(), out=out)
+
+    def __iter__(self):
+        return iter((self.a, self.b, self.c, self.d, self.e, self.f))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Affine2D):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return "Affine2D(a={:g}, b={:g}, c={:g}, d={:g}, e={:g}, f={:g})".format(*self)
+
+
+def _as_affine(matrix: Union[np.ndarray, Affine2D]) -> Optional[Affine2D]:
+    """Affine2D dari matriks 3x3 affine, atau None jika bukan affine."""
+    if isinstance(matrix, Affine2D):
+        return matrix
+    rows = np.asarray(matrix, dtype=float)
+    if rows.shape != (3, 3):
+        return None
+    (a, b, c), (d, e, f), last = rows.tolist()
+    if last != [0.0, 0.0, 1.0]:
+        return None
+    return Affine2D(a, b, c, d, e, f)
+
+
+# Jenis langkah untuk `compose_chain` -> konstruktor Affine2D
+CHAIN_STEPS = {
+    "translate": Affine2D.translation,
+    "rotate": Affine2D.rotation,
+    "scale": Affine2D.scale,
+    "shear": Affine2D.shear,
+    "reflect": Affine2D.reflection,
+}
+
+
+@lru_cache(maxsize=512)
+def compose_chain(steps: Tuple[Tuple, ...]) -> Affine2D:
+    """
+    Menggabungkan rantai transformasi yang dideskripsikan dengan parameter.
+
+    Hasil di-cache berdasarkan tuple parameter, sehingga rantai yang sama
+    (misal slider yang tidak berubah antar rerun) tidak dihitung ulang.
+    Langkah diterapkan berurutan dari kiri ke kanan, seperti
+    `combine_transformations`.
+
+    Args:
+        steps: Tuple langkah (jenis, *parameter), misal
+            (("rotate", 30), ("scale", 1.5, 1.5), ("translate", 100, 50))
+
+    Returns:
+        Affine2D hasil komposisi
+
+    Raises:
+        ValueError: Jika jenis langkah tidak dikenal
+    """
+    result = Affine2D()
+    for kind, *params in steps:
+        if kind not in CHAIN_STEPS:
+            raise ValueError(f"Jenis transformasi tidak dikenal: {kind}")
+        result = CHAIN_STEPS[kind](*params) @ result
+    return result
+
+
+# ============================================================================
+# TRANSFORMASI BATCH (ARRAY)
+# ============================================================================
+
+def transform_points(points: np.ndarray, matrix: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Menerapkan matriks affine 3x3 ke array titik (N, 2) tanpa koordinat homogen.
+
+    P' = P @ A^T + t, dengan A = matrix[:2, :2] dan t = matrix[:2, 2]. Titik
+    diproses per potongan _TRANSFORM_CHUNK agar hasil antara tetap di cache.
+
+    Complexity:
+        Time: O(N)
+        Space: O(N) untuk hasil (O(1) tambahan jika `out` diberikan)
+
+    Args:
+        points: Array titik (N, 2) atau list of (x, y)
+        matrix: Matriks transformasi 3x3 (baris terakhir [0, 0, 1])
+        out: Array (N, 2) float64 tujuan (boleh sama dengan `points`)
+
+    Returns:
+        Array (N, 2) titik hasil transformasi
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    matrix = np.asarray(matrix, dtype=float)
+    if out is None:
+        out = np.empty_like(points)
+    linear = np.ascontiguousarray(matrix[:2, :2].T)
+    translation = matrix[:2, 2]
+
+    for start in range(0, len(points), _TRANSFORM_CHUNK):
+        chunk = out[start:start + _TRANSFORM_CHUNK]
+        np.matmul(points[start:start + _TRANSFORM_CHUNK], linear, out=chunk)
+        chunk += translation
+    return out
+
+
+class ShapeBatch:
+    """
+    Kumpulan banyak bentuk 2D dalam satu array titik kontigu.
+
+    Titik semua bentuk disimpan berurutan dalam satu array float64 (N, 2);
+    bentuk ke-k adalah points[offsets[k]:offsets[k + 1]]. Transformasi
+    seluruh bentuk (satu matriks, atau satu matriks per bentuk) dijalankan
+    sebagai operasi array, dan bentuk diambil sebagai view tanpa salinan.
+
+    Attributes:
+        points: Array titik (N, 2) float64
+        offsets: Array int64 (K + 1,) batas titik setiap bentuk
+    """
+    __slots__ = ("points", "offsets")
+
+    def __init__(self, points: np.ndarray, offsets: np.ndarray):
+        self.points = np.ascontiguousarray(points, dtype=float).reshape(-1, 2)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        if self.offsets.ndim != 1 or len(self.offsets) == 0 or self.offsets[0] != 0 \
+                or self.offsets[-1] != len(self.points) or np.any(np.diff(self.offsets) < 0):
+            raise ValueError("offsets harus naik dari 0 hingga jumlah titik")
+
+    @classmethod
+    def from_shapes(cls, shapes: Sequence[np.ndarray]) -> "ShapeBatch":
+        """Menggabungkan daftar bentuk (masing-masing (n_k, 2)) menjadi satu batch."""
+        arrays = [np.asarray(shape, dtype=float).reshape(-1, 2) for shape in shapes]
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(a) for a in arrays])
+        points = np.concatenate(arrays) if arrays else np.empty((0, 2))
+        return cls(points, offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        index = range(len(self))[index]
+        return self.points[self.offsets[index]:self.offsets[index + 1]]
+
+    def __iter__(self):
+        return (self[k] for k in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"ShapeBatch(shapes={len(self)}, points={len(self.points)})"
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Jumlah titik setiap bentuk, (K,)."""
+        return np.diff(self.offsets)
+
+    def shape_ids(self) -> np.ndarray:
+        """Indeks bentuk untuk setiap titik, (N,)."""
+        return np.repeat(np.arange(len(self)), self.counts)
+
+    def centroids(self) -> np.ndarray:
+        """Rata-rata titik setiap bentuk, (K, 2); bentuk kosong bernilai (0, 0)."""
+        counts = self.counts
+        sums = np.zeros((len(self), 2))
+        non_empty = counts > 0
+        if non_empty.any():
+            sums[non_empty] = np.add.reduceat(self.points, self.offsets[:-1][non_empty], axis=0)
+        return sums / np.maximum(counts, 1)[:, None]
+
+    def transform(self, matrices: np.ndarray, out: Optional["ShapeBatch"] = None) -> "ShapeBatch":
+        """
+        Mentransformasi semua bentuk sekaligus.
+
+        Args:
+            matrices: Satu matriks 3x3 untuk semua bentuk, atau stack (K, 3, 3)
+                dengan satu matriks per bentuk
+            out: ShapeBatch tujuan dengan offsets yang sama (boleh `self`)
+
+        Returns:
+            ShapeBatch hasil transformasi (berbagi array offsets)
+        """
+        matrices = np.asarray(matrices, dtype=float)
+        result = out if out is not None else ShapeBatch(np.empty_like(self.points), self.offsets)
+
+        if matrices.shape == (3, 3):
+            transform_points(self.points, matrices, out=result.points)
+            return result
+        if matrices.shape != (len(self), 3, 3):
+            raise ValueError("matrices harus berbentuk (3, 3) atau (K, 3, 3)")
+
+        linear = np.ascontiguousarray(matrices[:, :2, :2].transpose(0, 2, 1))
+        translation = np.ascontiguousarray(matrices[:, :2, 2])
+        counts = self.counts
+        if len(self) and np.all(counts == counts[0]):
+            # Semua bentuk sama panjang: view (K, n, 2) dan satu batched matmul
+            shaped = (len(self), int(counts[0]), 2)
+            target = result.points.reshape(shaped)
+            np.matmul(self.points.reshape(shaped), linear, out=target)
+            target += translation[:, None]
+            return result
+
+        if len(self.points) >= _MIN_POINTS_PER_SLICE * len(self):
+            # Bentuk besar: setiap bentuk adalah slice kontigu, satu matmul per bentuk
+            for k, (start, end) in enumerate(zip(self.offsets[:-1].tolist(), self.offsets[1:].tolist())):
+                chunk = result.points[start:end]
+                np.matmul(self.points[start:end], linear[k], out=chunk)
+                chunk += translation[k]
+            return result
+
+        # Banyak bentuk kecil: dikelompokkan per jumlah titik, satu batched matmul per kelompok
+        order = np.argsort(counts, kind="stable")
+        sizes, group_starts = np.unique(counts[order], return_index=True)
+        for size, members in zip(sizes.tolist(), np.split(order, group_starts[1:])):
+            if size == 0:
+                continue
+            index = self.offsets[members][:, None] + np.arange(size)
+            block = np.matmul(self.points[index], linear[members])
+            block += translation[members][:, None]
+            result.points[index] = block
+        return result
+
+
 # ============================================================================
 # HELPER FUNCTIONS UNTUK TRANSFORMASI KHUSUS
 # ============================================================================
@@ -0,0 +1,11 @@
+"""
+Benchmark Headless untuk Modul `algorithms/`.
+
+Paket ini mengukur performa algoritma grafika tanpa Streamlit sehingga bisa
+dijalankan dari terminal atau CI untuk melacak performa antar rilis.
+
+Penggunaan:
+    python -m benchmarks run --output hasil.json
+    python -m benchmarks run --filter line --quick --output hasil.csv
+    python -m benchmarks compare lama.json baru.json --threshold 0.10
+"""
@@ -0,0 +1,121 @@
+"""
+Entry Point CLI Benchmark.
+
+Jalankan dari root proyek:
+    python -m benchmarks list
+    python -m benchmarks run [--filter NAMA ...] [--quick] [--output FILE.json|FILE.csv]
+    python -m benchmarks compare LAMA BARU [--threshold 0.10]
+    python -m benchmarks import-time [--module NAMA] [--budget-ms 300]
+
+Perintah `compare` keluar dengan kode 1 jika ada regresi, dan `import-time`
+keluar dengan kode 1 jika waktu import melewati anggaran atau memuat Streamlit.
+"""
+
+import argparse
+import sys
+
+from benchmarks.workloads import WORKLOADS, select_workloads
+from benchmarks.runner import run_workloads, save_results, load_results, environment_info
+from benchmarks.compare import compare_results, format_comparison
+from benchmarks.import_time import IMPORT_BUDGET_MS, check_import_budget
+
+def _print_record(record):
+    rates = "".join(
+        f"  {key[:-len('_per_s')]}/s {value:>12,.0f}"
+        for key, value in record.items() if key.endswith("_per_s") and value is not None
+    )
+    print(
+        f"{record['benchmark']:<24} {str(record['params']):<36} "
+        f"median {record['median_ms']:>10.4f} ms  p95 {record['p95_ms']:>10.4f} ms  "
+        f"runs {record['runs']:>3}{rates}"
+    )
+
+def build_parser() -> argparse.ArgumentParser:
+    """Membuat parser argumen CLI."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark headless untuk algoritma grafika di algorithms/."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("list", help="Tampilkan daftar workload")
+
+    run = sub.add_parser("run", help="Jalankan benchmark")
+    run.add_argument("--filter", nargs="*", default=None,
+                     help="Hanya jalankan workload yang namanya mengandung pola ini")
+    run.add_argument("--quick", action="store_true", help="Gunakan grid parameter kecil")
+    run.add_argument("--repeat", type=int, default=5, help="Pengulangan maksimum per kasus")
+    run.add_argument("--budget-ms", type=float, default=1000.0,
+                     help="Anggaran waktu pengulangan per kasus (ms)")
+    run.add_argument("--no-memory", action="store_true", help="Lewati pengukuran tracemalloc")
+    run.add_argument("--output", "-o", default=None, help="File hasil (.json atau .csv)")
+
+    compare = sub.add_parser("compare", help="Bandingkan dua file hasil")
+    compare.add_argument("baseline", help="File hasil lama")
+    compare.add_argument("current", help="File hasil baru")
+    compare.add_argument("--threshold", type=float, default=0.10,
+                         help="Perubahan relatif yang dianggap regresi (default 0.10 = 10%%)")
+    compare.add_argument("--metric", default="median_ms", help="Kolom waktu yang dibandingkan")
+
+    import_time = sub.add_parser("import-time", help="Ukur waktu import modul algoritma")
+    import_time.add_argument("--module", default="algorithms.line_algorithms", help="Modul yang diukur")
+    import_time.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS,
+                             help="Anggaran waktu import (ms)")
+    import_time.add_argument("--repeat", type=int, default=5, help="Jumlah proses baru")
+
+    return parser
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.command == "list":
+        for workload in WORKLOADS:
+            print(f"{workload.name:<24} {workload.params}")
+        return 0
+
+    if args.command == "run":
+        workloads = select_workloads(args.filter)
+        if not workloads:
+            print("Tidak ada workload yang cocok dengan filter.", file=sys.stderr)
+            return 2
+        records = run_workloads(
+            workloads,
+            quick=args.quick,
+            repeat=args.repeat,
+            time_budget_ms=args.budget_ms,
+            track_memory=not args.no_memory,
+            progress=_print_record
+        )
+        if args.output:
+            save_results(records, args.output, meta=environment_info())
+            print(f"\nHasil disimpan ke {args.output}")
+        return 0
+
+    if args.command == "import-time":
+        result = check_import_budget(args.module, args.budget_ms, args.repeat)
+        print(
+            f"import {result['module']}: min {result['min_ms']:.1f} ms, "
+            f"max {result['max_ms']:.1f} ms (anggaran {result['budget_ms']:.0f} ms, "
+            f"{result['runs']} proses)"
+        )
+        if result["streamlit_loaded"]:
+            print("GAGAL: Streamlit ikut ter-import oleh modul algoritma.")
+        elif not result["passed"]:
+            print("GAGAL: waktu import melewati anggaran.")
+        return 0 if result["passed"] else 1
+
+    rows = compare_results(
+        load_results(args.baseline),
+        load_results(args.current),
+        threshold=args.threshold,
+        metric=args.metric
+    )
+    print(format_comparison(rows))
+    regressions = [r for r in rows if r["status"] == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} regresi terdeteksi (ambang {args.threshold:.0%}).")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Perbandingan Dua Hasil Benchmark.
+
+Mencocokkan record berdasarkan (benchmark, params) lalu menghitung rasio waktu
+median baru terhadap lama untuk menandai regresi dan peningkatan.
+"""
+
+from typing import Any, Dict, List
+
+from benchmarks.runner import Record, params_key
+
+def compare_results(
+    baseline: List[Record],
+    current: List[Record],
+    threshold: float = 0.10,
+    metric: str = "median_ms"
+) -> List[Dict[str, Any]]:
+    """
+    Membandingkan dua daftar hasil benchmark.
+
+    Args:
+        baseline (List[Record]): Hasil lama (acuan).
+        current (List[Record]): Hasil baru.
+        threshold (float): Perubahan relatif minimum yang dianggap signifikan
+            (0.10 = 10%).
+        metric (str): Kolom waktu yang dibandingkan.
+
+    Returns:
+        List[Dict[str, Any]]: Satu baris per kasus dengan kunci 'status' bernilai
+        'regression', 'improvement', 'unchanged', 'new', atau 'removed'.
+    """
+    def index(records):
+        return {(r["benchmark"], params_key(r["params"])): r for r in records}
+
+    old, new = index(baseline), index(current)
+    rows = []
+    for key in sorted(set(old) | set(new)):
+        before = old.get(key, {}).get(metric)
+        after = new.get(key, {}).get(metric)
+        row = {"benchmark": key[0], "params": key[1], "before": before, "after": after, "ratio": None}
+
+        if before is None:
+            row["status"] = "new"
+        elif after is None:
+            row["status"] = "removed"
+        else:
+            ratio = after / before if before > 0 else float("inf")
+            row["ratio"] = ratio
+            if ratio > 1 + threshold:
+                row["status"] = "regression"
+            elif ratio < 1 - threshold:
+                row["status"] = "improvement"
+            else:
+                row["status"] = "unchanged"
+        rows.append(row)
+    return rows
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    """
+    Memformat hasil perbandingan menjadi tabel teks.
+    """
+    def fmt(value):
+        return "-" if value is None else f"{value:.4f}"
+
+    lines = [f"{'benchmark':<24} {'params':<36} {'lama (ms)':>12} {'baru (ms)':>12} {'rasio':>8}  status"]
+    for row in rows:
+        ratio = "-" if row["ratio"] is None else f"{row['ratio']:.2f}x"
+        lines.append(
+            f"{row['benchmark']:<24} {row['params']:<36} {fmt(row['before']):>12} "
+            f"{fmt(row['after']):>12} {ratio:>8}  {row['status']}"
+        )
+    return "\n".join(lines)
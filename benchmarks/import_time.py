@@ -0,0 +1,76 @@
+"""
+Benchmark Waktu Import Modul Algoritma.
+
+Mengukur waktu `import algorithms.line_algorithms` (atau modul lain) di proses
+Python baru, sehingga cache import proses saat ini tidak mempengaruhi hasil.
+Juga memastikan Streamlit tidak ikut ter-import oleh modul algoritma.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict
+
+# Anggaran waktu import (ms); didominasi oleh import NumPy (~100 ms)
+IMPORT_BUDGET_MS = 300.0
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+__import__(sys.argv[1])
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({"ms": elapsed_ms, "streamlit": "streamlit" in sys.modules}))
+"""
+
+def measure_import_time(module: str = "algorithms.line_algorithms", repeat: int = 5) -> Dict[str, Any]:
+    """
+    Mengukur waktu import sebuah modul di proses baru, diulang beberapa kali.
+
+    Args:
+        module (str): Nama modul yang diimpor.
+        repeat (int): Jumlah proses baru yang dijalankan.
+
+    Returns:
+        Dict[str, Any]: Waktu minimum/maksimum (ms) dan apakah Streamlit ikut ter-import.
+    """
+    samples = []
+    streamlit_loaded = False
+    for _ in range(max(int(repeat), 1)):
+        output = subprocess.run(
+            [sys.executable, "-c", _IMPORT_SCRIPT, module],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        measured = json.loads(output.strip().splitlines()[-1])
+        samples.append(measured["ms"])
+        streamlit_loaded = streamlit_loaded or measured["streamlit"]
+
+    return {
+        "module": module,
+        "runs": len(samples),
+        "min_ms": min(samples),
+        "max_ms": max(samples),
+        "streamlit_loaded": streamlit_loaded,
+    }
+
+def check_import_budget(
+    module: str = "algorithms.line_algorithms",
+    budget_ms: float = IMPORT_BUDGET_MS,
+    repeat: int = 5
+) -> Dict[str, Any]:
+    """
+    Memeriksa apakah waktu import (minimum dari beberapa proses) di bawah anggaran
+    dan tidak memuat Streamlit.
+
+    Returns:
+        Dict[str, Any]: Hasil `measure_import_time` ditambah 'budget_ms' dan 'passed'.
+    """
+    result = measure_import_time(module, repeat)
+    result["budget_ms"] = budget_ms
+    result["passed"] = result["min_ms"] <= budget_ms and not result["streamlit_loaded"]
+    return result
@@ -0,0 +1,111 @@
+"""
+Runner Benchmark dan Penyimpanan Hasil.
+
+Menjalankan workload dengan `measure_performance`, lalu menyimpan atau memuat
+hasilnya dalam format JSON maupun CSV.
+"""
+
+import csv
+import json
+import platform
+import sys
+import time
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.performance import measure_performance
+from benchmarks.workloads import Workload
+
+Record = Dict[str, Any]
+
+STAT_FIELDS = ["runs", "min_ms", "median_ms", "mean_ms", "p95_ms", "stddev_ms", "peak_memory_kb"]
+
+def run_workloads(
+    workloads: List[Workload],
+    quick: bool = False,
+    repeat: int = 5,
+    time_budget_ms: float = 1000.0,
+    track_memory: bool = True,
+    progress: Optional[Callable[[Record], None]] = None
+) -> List[Record]:
+    """
+    Menjalankan semua kombinasi parameter dari daftar workload.
+
+    Args:
+        workloads (List[Workload]): Workload yang akan dijalankan.
+        quick (bool): Gunakan grid parameter kecil (quick_params).
+        repeat (int): Jumlah maksimum pengulangan per kasus.
+        time_budget_ms (float): Anggaran waktu pengulangan per kasus.
+        track_memory (bool): Ukur puncak alokasi dengan tracemalloc.
+        progress (Callable, optional): Dipanggil dengan setiap record yang selesai.
+
+    Returns:
+        List[Record]: Satu record per (workload, parameter).
+    """
+    records = []
+    for workload in workloads:
+        for params in (workload.quick_params if quick else workload.params):
+            run = workload.setup(**params)
+            measured = measure_performance(
+                run,
+                repeat=repeat,
+                time_budget_ms=time_budget_ms,
+                track_memory=track_memory
+            )
+            record = {"benchmark": workload.name, "params": params}
+            record.update({k: measured["stats"].get(k) for k in STAT_FIELDS})
+            if workload.throughput is not None:
+                seconds = measured["stats"]["median_ms"] / 1000
+                for unit, count in workload.throughput(measured["result"]).items():
+                    record[f"{unit}_per_s"] = count / seconds if seconds > 0 else None
+            records.append(record)
+            if progress is not None:
+                progress(record)
+    return records
+
+def environment_info() -> Dict[str, str]:
+    """Informasi lingkungan yang disimpan bersama hasil benchmark."""
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+def params_key(params: Dict[str, Any]) -> str:
+    """Representasi parameter yang stabil (untuk kolom CSV dan pencocokan hasil)."""
+    return json.dumps(params, sort_keys=True)
+
+def save_results(records: List[Record], path: str, meta: Dict[str, Any] = None):
+    """
+    Menyimpan hasil benchmark ke file JSON atau CSV (berdasarkan ekstensi).
+    """
+    if path.lower().endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            rate_fields = sorted({k for record in records for k in record if k.endswith("_per_s")})
+            writer = csv.DictWriter(f, fieldnames=["benchmark", "params"] + STAT_FIELDS + rate_fields)
+            writer.writeheader()
+            for record in records:
+                writer.writerow({**record, "params": params_key(record["params"])})
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta or environment_info(), "results": records}, f, indent=2)
+
+def load_results(path: str) -> List[Record]:
+    """
+    Memuat hasil benchmark dari file JSON atau CSV.
+    """
+    if path.lower().endswith(".csv"):
+        records = []
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                record = {"benchmark": row["benchmark"], "params": json.loads(row["params"])}
+                for field in STAT_FIELDS + [k for k in row if k.endswith("_per_s")]:
+                    value = row.get(field)
+                    record[field] = float(value) if value not in (None, "") else None
+                records.append(record)
+        return records
+
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
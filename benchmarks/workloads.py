@@ -0,0 +1,425 @@
+"""
+Definisi Workload Benchmark.
+
+Setiap workload memiliki nama, grid parameter (versi lengkap dan versi cepat),
+dan fungsi `setup` yang menyiapkan data lalu mengembalikan callable tanpa
+argumen. Callable tersebut yang diukur berulang kali, sehingga harus
+idempoten: algoritma yang mengubah canvas (flood/boundary fill) menyalin
+canvas di dalam callable.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from algorithms.line_algorithms import dda_line, bresenham_line, dda_line_batch, bresenham_line_batch
+from algorithms.circle_algorithms import midpoint_circle
+from algorithms.polygon_fill import (
+    scanline_fill,
+    scanline_fill_spans,
+    flood_fill_4,
+    boundary_fill_4,
+    points_in_polygon,
+)
+from algorithms.transformations import (
+    create_rotation_matrix,
+    create_scale_matrix,
+    create_translation_matrix,
+    combine_transformations,
+    apply_transformation,
+    transform_points,
+    ShapeBatch,
+    Affine2D,
+)
+from algorithms.animation import precompute_frames, transition_keyframes
+from algorithms.color_models import calculate_phong_lighting, calculate_phong_lighting_batch
+from algorithms.lighting import calculate_lighting, point_light, directional_light, spot_light
+from algorithms.shading import (
+    flat_shading,
+    gouraud_shading,
+    flat_shading_mesh,
+    gouraud_shading_mesh,
+    phong_shading_image,
+)
+from algorithms.rasterizer import look_at, perspective, draw_triangles
+from algorithms.texturing import sample_texture, generate_mipmaps, MipmapPyramid
+from utils.texture_io import load_texture
+from utils.canvas_geometry import parse_canvas_geometry, transform_canvas_json
+
+Params = Dict[str, Any]
+
+# Parameter pencahayaan standar untuk workload Phong dan shading
+LIGHTING = {
+    "light_color": (255, 255, 255),
+    "light_position": np.array([5.0, 5.0, 5.0]),
+    "camera_position": np.array([0.0, 0.0, 5.0]),
+    "material": {"ka": 0.1, "kd": 0.7, "ks": 0.5, "shininess": 32},
+}
+
+@dataclass(frozen=True)
+class Workload:
+    """
+    Satu workload benchmark yang diparameterisasi.
+
+    Attributes:
+        name (str): Nama unik workload, misal 'line.bresenham'.
+        params (List[Params]): Grid parameter untuk mode lengkap.
+        quick_params (List[Params]): Grid parameter kecil untuk mode --quick.
+        setup (Callable[..., Callable[[], Any]]): Menerima parameter sebagai
+            keyword argument dan mengembalikan callable yang akan diukur.
+        throughput (Callable[[Any], Dict[str, int]], optional): Menerima hasil
+            callable dan mengembalikan jumlah unit kerja per nama (misal
+            {'triangles': T}); runner melaporkannya sebagai '<nama>_per_s'.
+    """
+    name: str
+    params: List[Params]
+    quick_params: List[Params]
+    setup: Callable[..., Callable[[], Any]]
+    throughput: Optional[Callable[[Any], Dict[str, int]]] = None
+
+# --- Data Sintetis --------------------------------------------------------------
+
+def regular_polygon(vertex_count: int, radius: int = 200, center: int = 256) -> List[tuple]:
+    """Membuat poligon beraturan dengan koordinat integer."""
+    angles = np.linspace(0, 2 * np.pi, vertex_count, endpoint=False)
+    return [
+        (int(round(center + radius * np.cos(a))), int(round(center + radius * np.sin(a))))
+        for a in angles
+    ]
+
+def boxed_canvas(size: int) -> np.ndarray:
+    """Membuat canvas RGB hitam dengan bingkai putih 1 piksel di tepinya."""
+    canvas = np.zeros((size, size, 3), dtype=np.uint8)
+    canvas[[0, -1], :] = 255
+    canvas[:, [0, -1]] = 255
+    return canvas
+
+def random_segments(count: int, length: int, seed: int = 0) -> np.ndarray:
+    """Membuat array segmen (count, 4) acak dengan panjang kira-kira `length`."""
+    rng = np.random.default_rng(seed)
+    start = rng.integers(0, 1024, size=(count, 2))
+    angle = rng.uniform(0, 2 * np.pi, size=count)
+    end = start + np.column_stack([np.cos(angle), np.sin(angle)]) * length
+    return np.hstack([start, np.rint(end).astype(np.int64)])
+
+def grid_mesh(n: int):
+    """
+    Membuat mesh grid n x n pada permukaan bola (list-of-dict vertex dan
+    poligon segitiga), format yang dipakai oleh `algorithms.shading`.
+    """
+    theta, phi = np.meshgrid(np.linspace(0.1, np.pi - 0.1, n), np.linspace(0, 2 * np.pi, n))
+    positions = np.stack([np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi), np.cos(theta)], axis=-1)
+    positions = positions.reshape(-1, 3)
+    vertices = [{"position": p, "normal": p / np.linalg.norm(p)} for p in positions]
+    polygons = []
+    for i in range(n - 1):
+        for j in range(n - 1):
+            a, b, c, d = i * n + j, i * n + j + 1, (i + 1) * n + j, (i + 1) * n + j + 1
+            polygons.append([a, b, d])
+            polygons.append([a, d, c])
+    return vertices, polygons
+
+# --- Setup Workload ------------------------------------------------------------
+
+def _raw(func: Callable) -> Callable:
+    """Mengambil fungsi asli tanpa wrapper @performance_tracker."""
+    return getattr(func, "__wrapped__", func)
+
+def _setup_line(func: Callable):
+    def setup(length: int):
+        raw = _raw(func)
+        return lambda: raw(0, 0, length, length // 3)
+    return setup
+
+def _setup_line_batch(func: Callable):
+    def setup(segments: int, length: int):
+        raw = _raw(func)
+        data = random_segments(segments, length)
+        return lambda: raw(data)
+    return setup
+
+def _setup_circle(radius: int):
+    raw = _raw(midpoint_circle)
+    return lambda: raw(0, 0, radius)
+
+def _setup_scanline(vertices: int):
+    raw = _raw(scanline_fill)
+    polygon = regular_polygon(vertices)
+    return lambda: raw(polygon, (255, 0, 0))
+
+def _setup_scanline_spans(vertices: int):
+    raw = _raw(scanline_fill_spans)
+    polygon = regular_polygon(vertices)
+    return lambda: raw(polygon)
+
+def _setup_point_in_polygon(points: int):
+    rng = np.random.default_rng(0)
+    polygon = regular_polygon(64)
+    data = rng.uniform(0, 512, size=(points, 2))
+    return lambda: points_in_polygon(data, polygon)
+
+def _setup_flood(size: int):
+    raw = _raw(flood_fill_4)
+    canvas = boxed_canvas(size)
+    return lambda: raw(canvas.copy(), (1, 1), (255, 0, 0), (0, 0, 0))
+
+def _setup_boundary(size: int):
+    raw = _raw(boundary_fill_4)
+    canvas = boxed_canvas(size)
+    return lambda: raw(canvas.copy(), (1, 1), (255, 0, 0), (255, 255, 255))
+
+def _setup_boundary_fragmented(size: int, boundary: float):
+    # Piksel batas acak memecah area menjadi banyak run pendek
+    raw = _raw(boundary_fill_4)
+    canvas = boxed_canvas(size)
+    canvas[np.random.default_rng(0).random((size, size)) < boundary] = 255
+    canvas[1, 1] = 0
+    return lambda: raw(canvas.copy(), (1, 1), (255, 0, 0), (255, 255, 255))
+
+def _setup_apply_transformation(points: int):
+    rng = np.random.default_rng(0)
+    data = [tuple(p) for p in rng.uniform(-100, 100, size=(points, 2))]
+    matrix = combine_transformations([
+        create_rotation_matrix(30),
+        create_scale_matrix(1.5, 0.5),
+        create_translation_matrix(10, -5),
+    ])
+    return lambda: apply_transformation(data, matrix)
+
+def _setup_transform_batch(points: int, shapes: int):
+    rng = np.random.default_rng(0)
+    offsets = np.linspace(0, points, shapes + 1).astype(np.int64)
+    batch = ShapeBatch(rng.uniform(-100, 100, size=(points, 2)), offsets)
+    out = ShapeBatch(np.empty_like(batch.points), batch.offsets)
+    if shapes == 1:
+        matrix = create_rotation_matrix(30, 5, 5)
+        return lambda: transform_points(batch.points, matrix, out=out.points)
+    matrices = np.stack([create_rotation_matrix(a, 5, 5) for a in np.linspace(0, 360, shapes)])
+    return lambda: batch.transform(matrices, out=out)
+
+def _setup_combine_transformations(chain: int):
+    matrices = [create_rotation_matrix(i) for i in range(chain)]
+    return lambda: combine_transformations(matrices)
+
+def _setup_combine_affine(chain: int):
+    transforms = [Affine2D.rotation(i, 5, 5) for i in range(chain)]
+    return lambda: combine_transformations(transforms)
+
+def _setup_animation_frames(points: int):
+    rng = np.random.default_rng(0)
+    shape = rng.uniform(-100, 100, size=(points, 2))
+    keyframes = transition_keyframes(combine_transformations([
+        create_rotation_matrix(120),
+        create_scale_matrix(1.5, 0.75),
+        create_translation_matrix(40, -20),
+    ]))
+    return lambda: precompute_frames(shape, keyframes)
+
+def freedraw_path(points: int, seed: int = 0) -> Dict[str, Any]:
+    """Objek path fabric.js seperti hasil PencilBrush: M, Q per titik, L terakhir."""
+    rng = np.random.default_rng(seed)
+    raw = 300 + np.cumsum(rng.normal(0, 2, size=(points, 2)), axis=0)
+    mids = (raw[1:] + raw[:-1]) / 2
+    path = [["M", *raw[0].tolist()]]
+    path += [["Q", *c, *m] for c, m in zip(raw[:-1].tolist(), mids.tolist())]
+    path.append(["L", *raw[-1].tolist()])
+    low, high = raw.min(axis=0), raw.max(axis=0)
+    return {"type": "Path", "originX": "left", "originY": "top", "left": low[0] - 1.5, "top": low[1] - 1.5,
+            "width": high[0] - low[0], "height": high[1] - low[1], "strokeWidth": 3, "path": path}
+
+def _setup_canvas_transform(points: int):
+    drawing = {"version": "6.0.0", "objects": [freedraw_path(points)]}
+    matrix = create_rotation_matrix(30, 300, 300)
+    return lambda: transform_canvas_json(drawing, matrix)
+
+def _setup_canvas_parse(points: int, shapes: int):
+    # Campuran hasil freedraw (kurva Q) dan lingkaran, seperti canvas yang ramai
+    objects = [freedraw_path(points // shapes, seed=i) for i in range(shapes)]
+    objects += [{"type": "Circle", "originX": "center", "originY": "center", "left": 100 + i, "top": 100,
+                 "radius": 40, "width": 80, "height": 80, "strokeWidth": 3} for i in range(shapes)]
+    drawing = {"version": "6.0.0", "objects": objects}
+    return lambda: parse_canvas_geometry(drawing)
+
+def _setup_phong(points: int):
+    rng = np.random.default_rng(0)
+    normals = rng.normal(size=(points, 3))
+    positions = normals / np.linalg.norm(normals, axis=1, keepdims=True)
+
+    def run():
+        return [
+            calculate_phong_lighting(point_position=p, point_normal=n, **LIGHTING)
+            for p, n in zip(positions, positions)
+        ]
+    return run
+
+def _setup_phong_batch(points: int):
+    rng = np.random.default_rng(0)
+    normals = rng.normal(size=(points, 3))
+    positions = normals / np.linalg.norm(normals, axis=1, keepdims=True)
+    return lambda: calculate_phong_lighting_batch(point_positions=positions, point_normals=positions, **LIGHTING)
+
+def _setup_multi_light(points: int, lights: int):
+    rng = np.random.default_rng(0)
+    normals = rng.normal(size=(points, 3))
+    positions = normals / np.linalg.norm(normals, axis=1, keepdims=True)
+    makers = [
+        lambda: point_light([5.0, 5.0, 5.0], attenuation=(1.0, 0.05, 0.01)),
+        lambda: directional_light([0.0, -1.0, -1.0], (200, 200, 255)),
+        lambda: spot_light([0.0, 0.0, 4.0], [0.0, 0.0, -1.0], (255, 220, 180)),
+    ]
+    scene = [makers[i % len(makers)]() for i in range(lights)]
+    materials = [LIGHTING["material"], {"ka": 0.2, "kd": 0.5, "ks": 0.9, "shininess": 64}]
+    indices = rng.integers(0, len(materials), size=points)
+    camera = LIGHTING["camera_position"]
+    return lambda: calculate_lighting(positions, positions, camera, scene, materials, indices)
+
+def _setup_shading(func: Callable):
+    def setup(mesh: int):
+        vertices, polygons = grid_mesh(mesh)
+        return lambda: [func(poly, vertices, **LIGHTING) for poly in polygons]
+    return setup
+
+def _setup_mesh_shading(func: Callable, with_faces: bool):
+    def setup(mesh: int):
+        vertices, polygons = grid_mesh(mesh)
+        positions = np.array([v["position"] for v in vertices])
+        normals = np.array([v["normal"] for v in vertices])
+        faces = np.array(polygons)
+        if with_faces:
+            return lambda: func(positions, normals, faces, **LIGHTING)
+        return lambda: func(positions, normals, **LIGHTING)
+    return setup
+
+def _setup_phong_render(mesh: int):
+    vertices, polygons = grid_mesh(mesh)
+    positions = np.array([v["position"] for v in vertices])
+    normals = np.array([v["normal"] for v in vertices])
+    faces = np.array(polygons)
+    return lambda: phong_shading_image(positions, normals, faces, 640, 480, **LIGHTING)
+
+def _setup_rasterize(mesh: int):
+    vertices, polygons = grid_mesh(mesh)
+    positions = np.array([v["position"] for v in vertices])
+    attributes = {"normal": np.array([v["normal"] for v in vertices]), "uv": positions[:, :2]}
+    faces = np.array(polygons)
+    mvp = perspective(30.0, 640 / 480, 3.0, 7.0) @ look_at(LIGHTING["camera_position"], np.zeros(3))
+    return lambda: draw_triangles(positions, faces, mvp, 640, 480, attributes, cull="back")
+
+def _setup_texture_sample(method: str):
+    def setup(points: int):
+        rng = np.random.default_rng(0)
+        texture = rng.integers(0, 256, (512, 512, 3), dtype=np.uint8)
+        mipmaps = generate_mipmaps(texture)
+        u, v, lod = rng.uniform(-1, 2, points), rng.uniform(-1, 2, points), rng.uniform(0, 9, points)
+        return lambda: sample_texture(texture, u, v, method, "repeat", lod, mipmaps)
+    return setup
+
+def _setup_anisotropic(points: int, taps: int):
+    rng = np.random.default_rng(0)
+    texture = rng.integers(0, 256, (512, 512, 3), dtype=np.uint8)
+    mipmaps = MipmapPyramid.from_texture(texture)
+    u, v = rng.uniform(-1, 2, points), rng.uniform(-1, 2, points)
+    # Footprint memanjang (rasio ~16:1) seperti lantai dilihat dari sudut landai
+    derivatives = (np.full(points, 1 / 512), np.zeros(points), np.zeros(points), np.full(points, 16 / 512))
+    return lambda: sample_texture(texture, u, v, "anisotropic", "repeat", None, mipmaps, derivatives, taps)
+
+def _setup_mipmaps(mip_filter: str):
+    def setup(size: int):
+        texture = np.random.default_rng(0).integers(0, 256, (size, size, 3), dtype=np.uint8)
+        return lambda: MipmapPyramid.from_texture(texture, mip_filter)
+    return setup
+
+def _setup_texture_ingest(width: int):
+    import io
+    from PIL import Image
+
+    height = width * 2 // 3
+    noise = np.random.default_rng(0).integers(0, 256, (height // 8, width // 8, 3), dtype=np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(noise).resize((width, height)).save(buffer, "JPEG", quality=90)
+    data = buffer.getvalue()
+    return lambda: load_texture(data)
+
+def _raster_throughput(raster) -> Dict[str, int]:
+    return {"triangles": raster["triangles_in"], "fragments": raster["fragments"]}
+
+# --- Registri Workload ---------------------------------------------------------
+
+WORKLOADS: List[Workload] = [
+    Workload("line.dda", [{"length": n} for n in (100, 1000, 10000, 100000)],
+             [{"length": n} for n in (100, 1000)], _setup_line(dda_line)),
+    Workload("line.bresenham", [{"length": n} for n in (100, 1000, 10000, 100000)],
+             [{"length": n} for n in (100, 1000)], _setup_line(bresenham_line)),
+    Workload("line.dda_batch", [{"segments": n, "length": 100} for n in (100, 1000, 10000)],
+             [{"segments": 100, "length": 100}], _setup_line_batch(dda_line_batch)),
+    Workload("line.bresenham_batch", [{"segments": n, "length": 100} for n in (100, 1000, 10000)],
+             [{"segments": 100, "length": 100}], _setup_line_batch(bresenham_line_batch)),
+    Workload("circle.midpoint", [{"radius": r} for r in (10, 100, 1000, 10000)],
+             [{"radius": r} for r in (10, 100)], _setup_circle),
+    Workload("fill.scanline", [{"vertices": v} for v in (4, 16, 64, 256, 1024, 4096)],
+             [{"vertices": v} for v in (4, 16)], _setup_scanline),
+    Workload("fill.scanline_spans", [{"vertices": v} for v in (4, 16, 64, 256, 1024, 4096)],
+             [{"vertices": v} for v in (4, 16)], _setup_scanline_spans),
+    Workload("fill.point_in_polygon", [{"points": n} for n in (1000, 100000, 1000000)],
+             [{"points": 1000}], _setup_point_in_polygon),
+    Workload("fill.flood4", [{"size": s} for s in (64, 128, 256, 512, 1024)],
+             [{"size": 64}], _setup_flood),
+    Workload("fill.boundary4", [{"size": s} for s in (64, 128, 256, 512, 1024)],
+             [{"size": 64}], _setup_boundary),
+    Workload("fill.boundary4_fragmented", [{"size": s, "boundary": 0.15} for s in (256, 1024)],
+             [{"size": 256, "boundary": 0.15}], _setup_boundary_fragmented),
+    Workload("transform.apply", [{"points": n} for n in (100, 10000, 1000000)],
+             [{"points": n} for n in (100, 10000)], _setup_apply_transformation),
+    Workload("transform.batch", [{"points": 1000000, "shapes": k} for k in (1, 100, 10000, 100000)],
+             [{"points": 100000, "shapes": k} for k in (1, 1000)], _setup_transform_batch),
+    Workload("transform.combine", [{"chain": n} for n in (2, 16, 256)],
+             [{"chain": n} for n in (2, 16)], _setup_combine_transformations),
+    Workload("transform.combine_affine", [{"chain": n} for n in (2, 16, 256)],
+             [{"chain": n} for n in (2, 16)], _setup_combine_affine),
+    Workload("transform.animation", [{"points": n} for n in (10, 1000, 10000, 100000)],
+             [{"points": n} for n in (10, 1000)], _setup_animation_frames),
+    Workload("canvas.transform_path", [{"points": n} for n in (1000, 10000, 50000)],
+             [{"points": 1000}], _setup_canvas_transform),
+    Workload("canvas.parse_geometry", [{"points": 50000, "shapes": k} for k in (1, 100)] + [{"points": 1000, "shapes": 1}],
+             [{"points": 1000, "shapes": 1}], _setup_canvas_parse),
+    Workload("lighting.phong", [{"points": n} for n in (100, 1000, 10000)],
+             [{"points": 100}], _setup_phong),
+    Workload("lighting.phong_batch", [{"points": n} for n in (100, 10000, 1000000)],
+             [{"points": n} for n in (100, 10000)], _setup_phong_batch),
+    Workload("lighting.multi", [{"points": n, "lights": l} for n in (10000, 100000) for l in (1, 4, 16)],
+             [{"points": 10000, "lights": 4}], _setup_multi_light),
+    Workload("shading.flat", [{"mesh": n} for n in (8, 16, 32)],
+             [{"mesh": 8}], _setup_shading(flat_shading)),
+    Workload("shading.gouraud", [{"mesh": n} for n in (8, 16, 32)],
+             [{"mesh": 8}], _setup_shading(gouraud_shading)),
+    Workload("shading.flat_mesh", [{"mesh": n} for n in (8, 32, 128, 512)],
+             [{"mesh": 8}], _setup_mesh_shading(flat_shading_mesh, with_faces=True)),
+    Workload("shading.gouraud_mesh", [{"mesh": n} for n in (8, 32, 128, 512)],
+             [{"mesh": 8}], _setup_mesh_shading(gouraud_shading_mesh, with_faces=False)),
+    Workload("render.phong", [{"mesh": n} for n in (8, 16, 40, 80)],
+             [{"mesh": 8}], _setup_phong_render),
+    Workload("render.rasterize", [{"mesh": n} for n in (8, 40, 80, 160, 320)],
+             [{"mesh": 8}, {"mesh": 40}], _setup_rasterize, _raster_throughput),
+    Workload("texture.nearest", [{"points": n} for n in (10000, 300000, 1000000)],
+             [{"points": 10000}], _setup_texture_sample("nearest")),
+    Workload("texture.bilinear", [{"points": n} for n in (10000, 300000, 1000000)],
+             [{"points": 10000}], _setup_texture_sample("bilinear")),
+    Workload("texture.trilinear", [{"points": n} for n in (10000, 300000, 1000000)],
+             [{"points": 10000}], _setup_texture_sample("trilinear")),
+    Workload("texture.anisotropic", [{"points": 300000, "taps": n} for n in (1, 2, 4, 8, 16)],
+             [{"points": 10000, "taps": 4}], _setup_anisotropic),
+    Workload("texture.ingest_jpeg", [{"width": n} for n in (1000, 3000, 6000)],
+             [{"width": 1000}], _setup_texture_ingest),
+    Workload("texture.mipmaps_box", [{"size": n} for n in (256, 1024, 2048)],
+             [{"size": 256}], _setup_mipmaps("box")),
+    Workload("texture.mipmaps_lanczos", [{"size": n} for n in (256, 1024, 2048)],
+             [{"size": 256}], _setup_mipmaps("lanczos")),
+]
+
+def select_workloads(patterns: List[str] = None) -> List[Workload]:
+    """
+    Memilih workload yang namanya mengandung salah satu pola (tanpa pola = semua).
+    """
+    if not patterns:
+        return list(WORKLOADS)
+    return [w for w in WORKLOADS if any(p in w.name for p in patterns)]
@@ -35,6 +35,8 @@ CANVAS_BACKGROUND_COLOR = "#0E1117"
 CANVAS_STROKE_COLOR = "#FF4B4B"
 CANVAS_FILL_COLOR = "rgba(255, 75, 75, 0.3)"
 CANVAS_STROKE_WIDTH = 3
+# Deviasi maksimum (piksel) saat kurva Bézier dan lingkaran diubah menjadi polyline
+CANVAS_FLATTEN_TOLERANCE = 0.25
 
 # ============================================================================
 # COLOR SCHEMES
@@ -85,6 +87,15 @@ ASSETS_PATH: Dict[str, str] = {
     "fonts": os.path.join(BASE_DIR, "assets", "fonts"),
 }
 
+# ============================================================================
+# TEXTURE SETTINGS
+# ============================================================================
+
+# Sisi terpanjang maksimum tekstur setelah ingest (upload lebih besar diperkecil)
+TEXTURE_MAX_SIZE: int = 2048
+# Sisi terpanjang thumbnail untuk preview di sidebar
+TEXTURE_THUMBNAIL_SIZE: int = 256
+
 # ============================================================================
 # ALGORITHM COMPLEXITIES
 # ============================================================================
@@ -124,23 +135,23 @@ ALGORITHM_COMPLEXITIES: Dict[str, Dict[str, str]] = {
     
     # Polygon Filling Algorithms
     "Scanline Fill": {
-        "time": "O(n × h)",  # n = edges, h = height
+        "time": "O(n log n + h × a log a)",  # n = edges, h = height, a = active edges
         "space": "O(n)",
-        "description": "Scanline Fill Algorithm",
-        "pros": "Efisien untuk poligon kompleks, konsisten",
+        "description": "Scanline Fill (Edge Table + Active Edge List)",
+        "pros": "Efisien untuk poligon kompleks, mendukung even-odd & non-zero",
         "cons": "Membutuhkan sorting"
     },
     "Flood Fill": {
         "time": "O(W × H)",
         "space": "O(W × H)",
-        "description": "Flood Fill (4-connected)",
-        "pros": "Sederhana, bisa fill area irregular",
-        "cons": "Rekursif (stack overflow risk), lambat"
+        "description": "Flood Fill berbasis span (4/8-connected)",
+        "pros": "Bisa fill area irregular, mengisi per run horizontal",
+        "cons": "Butuh mask seukuran canvas"
     },
     "Boundary Fill": {
         "time": "O(W × H)",
         "space": "O(W × H)",
-        "description": "Boundary Fill Algorithm",
+        "description": "Boundary Fill berbasis span (4/8-connected)",
         "pros": "Flexible boundary color",
         "cons": "Sama dengan Flood Fill"
     },
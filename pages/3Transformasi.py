@@ -11,11 +11,11 @@ import pandas as pd
 from PIL import Image, ImageDraw
 import plotly.graph_objects as go
 
-from config import PAGE_CONFIG, CANVAS_WIDTH, CANVAS_HEIGHT
+from config import PAGE_CONFIG, ANIMATION_FPS, ANIMATION_DURATION
 from utils.helpers import load_css
 
 try:
-    from streamlit_drawable_canvas import st_canvas
+    from utils.canvas_utils import setup_canvas
     CANVAS_AVAILABLE = True
 except ImportError:
     CANVAS_AVAILABLE = False
@@ -25,9 +25,28 @@ from algorithms.transformations import (
     create_rotation_matrix,
     create_scale_matrix,
     create_shear_matrix,
-    apply_transformation,
-    combine_transformations
+    create_reflection_matrix,
+    transform_points,
+    combine_transformations,
+    compose_chain
 )
+from algorithms.animation import precompute_frames, transition_keyframes
+from utils.canvas_geometry import parse_canvas_shapes
+
+DRAWING_TOOLS = {
+    "Bebas (Freedraw)": "freedraw",
+    "Garis": "line",
+    "Persegi Panjang": "rect",
+    "Lingkaran": "circle",
+    "Poligon": "polygon",
+}
+
+EASING_OPTIONS = {
+    "Ease In-Out": "ease_in_out",
+    "Linear": "linear",
+    "Ease In": "ease_in",
+    "Ease Out": "ease_out",
+}
 
 st.set_page_config(**PAGE_CONFIG)
 
@@ -557,6 +576,23 @@ def show_week2():
     """, unsafe_allow_html=True)
 
 
+def canvas_matrix(matrix: np.ndarray, pivot: np.ndarray) -> np.ndarray:
+    """
+    Mengubah matriks (koordinat matematika, y ke atas, terhadap origin) menjadi
+    matriks koordinat canvas (y ke bawah) yang bekerja terhadap `pivot`.
+
+    M_canvas = T(pivot) × F × M × F × T(-pivot), dengan F = refleksi sumbu X.
+    """
+    flip = create_reflection_matrix('x')
+    return combine_transformations([
+        create_translation_matrix(-pivot[0], -pivot[1]),
+        flip,
+        matrix,
+        flip,
+        create_translation_matrix(pivot[0], pivot[1]),
+    ])
+
+
 def show_canvas_mode():
     """Mode menggambar di canvas dengan drawable canvas."""
     
@@ -566,6 +602,12 @@ def show_canvas_mode():
     # Sidebar controls
     st.sidebar.markdown("### Kontrol Transformasi")
     
+    drawing_tool = st.sidebar.selectbox(
+        "Alat Gambar",
+        list(DRAWING_TOOLS),
+        help="Path bebas, garis, persegi panjang, lingkaran, dan poligon dapat ditransformasi"
+    )
+    
     transform_type = st.sidebar.selectbox(
         "Jenis Transformasi",
         ["Translasi", "Rotasi", "Skala", "Shear"],
@@ -619,15 +661,15 @@ def show_canvas_mode():
     with col1:
         st.markdown("##### Canvas Menggambar")
         
-        canvas_result = st_canvas(
-            fill_color="rgba(255, 75, 75, 0.3)",
+        # Hasil transformasi dimuat kembali ke canvas sebagai initial_drawing
+        canvas_result = setup_canvas(
+            drawing_mode=DRAWING_TOOLS[drawing_tool],
             stroke_width=3,
             stroke_color="#FF4B4B",
             background_color="#1E2128",
-            height=CANVAS_HEIGHT,
-            width=CANVAS_WIDTH,
-            drawing_mode="freedraw",
             key="transform_canvas",
+            initial_drawing=st.session_state.get('canvas_drawing'),
+            fill_color="rgba(255, 75, 75, 0.3)",
         )
     
     with col2:
@@ -656,6 +698,8 @@ def show_canvas_mode():
             st.success("Bentuk tersimpan")
         else:
             st.warning("Belum ada bentuk")
+        if 'canvas_transform_info' in st.session_state:
+            st.caption(st.session_state.canvas_transform_info)
     
     # Action buttons
     st.markdown("---")
@@ -673,8 +717,20 @@ def show_canvas_mode():
     with btn_col2:
         if st.button("Terapkan Transformasi", use_container_width=True):
             if 'original_drawing' in st.session_state:
-                st.success(f"{transform_type} berhasil diterapkan!")
-                st.info(f"Transformasi {transform_type} telah diaplikasikan pada objek")
+                original = st.session_state.original_drawing
+                shapes = parse_canvas_shapes(original)
+                if len(shapes) == 0:
+                    st.warning("Tidak ada objek yang dapat ditransformasi pada bentuk tersimpan")
+                else:
+                    # Selalu dihitung dari bentuk tersimpan agar transformasi tidak menumpuk
+                    pivot = shapes.batch.points.mean(axis=0)
+                    transformed = shapes.batch.transform(canvas_matrix(matrix, pivot))
+                    st.session_state.canvas_drawing = dict(original, objects=shapes.to_objects(transformed))
+                    info = f"{transform_type}: {len(shapes)} objek, {len(shapes.batch.points):,} titik"
+                    if shapes.unsupported_count:
+                        info += f" ({shapes.unsupported_count} objek tidak didukung, tidak diubah)"
+                    st.session_state.canvas_transform_info = info
+                    st.rerun()
             else:
                 st.warning("Simpan bentuk terlebih dahulu!")
 
@@ -684,11 +740,52 @@ def show_canvas_mode():
                 'tx': 0.0, 'ty': 0.0, 'angle': 0.0,
                 'sx': 1.0, 'sy': 1.0, 'shx': 0.0, 'shy': 0.0
             }
-            if 'original_drawing' in st.session_state:
-                del st.session_state.original_drawing
+            for state_key in ('original_drawing', 'canvas_drawing', 'canvas_transform_info'):
+                st.session_state.pop(state_key, None)
             st.rerun()
 
 
+def add_animation_frames(fig: go.Figure, frames: np.ndarray, trace_index: int, fps: int = ANIMATION_FPS):
+    """
+    Menambahkan frame animasi Plotly (tombol play dan slider timeline) ke figure.
+
+    Semua posisi sudah dihitung di `frames` (F, N, 2); play dan scrub dijalankan
+    di browser tanpa rerun Streamlit.
+    """
+    names = [str(i) for i in range(len(frames))]
+    fig.frames = [
+        go.Frame(data=[go.Scatter(x=frame[:, 0], y=frame[:, 1])], traces=[trace_index], name=name)
+        for frame, name in zip(frames, names)
+    ]
+
+    def animate_args(frame_duration):
+        return {
+            "frame": {"duration": frame_duration, "redraw": False},
+            "mode": "immediate",
+            "transition": {"duration": 0},
+        }
+
+    fig.update_layout(
+        updatemenus=[dict(
+            type="buttons",
+            direction="left",
+            x=0.0, y=-0.12, xanchor="left", yanchor="top",
+            pad=dict(t=0, r=10),
+            buttons=[
+                dict(label="▶ Play", method="animate",
+                     args=[None, dict(animate_args(1000 / fps), fromcurrent=True)]),
+                dict(label="⏸ Pause", method="animate", args=[[None], animate_args(0)]),
+            ],
+        )],
+        sliders=[dict(
+            active=len(frames) - 1,
+            x=0.18, y=-0.08, len=0.82, xanchor="left", yanchor="top",
+            currentvalue=dict(prefix="Frame: ", font=dict(size=11)),
+            steps=[dict(method="animate", label=name, args=[[name], animate_args(0)]) for name in names],
+        )],
+    )
+
+
 def show_visualization_mode():
     """Mode visualisasi dengan predefined shapes menggunakan Plotly."""
 
@@ -786,18 +883,28 @@ def show_visualization_mode():
         tx = st.sidebar.slider("tx", -150, 150, 100, key="comp_tx")
         ty = st.sidebar.slider("ty", -150, 150, 50, key="comp_ty")
         
-        m1 = create_rotation_matrix(angle, 0, 0)
-        m2 = create_scale_matrix(scale, scale, 0, 0)
-        m3 = create_translation_matrix(tx, ty)
-        matrix = combine_transformations([m1, m2, m3])
+        # Rantai di-cache per kombinasi nilai slider
+        matrix = compose_chain((
+            ("rotate", angle),
+            ("scale", scale, scale),
+            ("translate", tx, ty),
+        )).to_matrix()
         
         st.sidebar.markdown("---")
         st.sidebar.success("Urutan: Rotasi → Skala → Translasi")
     
     st.sidebar.markdown("---")
     
+    st.sidebar.markdown("#### Animasi")
+    animate = st.sidebar.checkbox(
+        "Animasikan Transformasi", value=True,
+        help="Interpolasi translasi, rotasi, dan skala dari bentuk asli ke hasil transformasi"
+    )
+    easing = st.sidebar.selectbox("Easing", list(EASING_OPTIONS), disabled=not animate)
+    st.sidebar.caption(f"{ANIMATION_FPS} fps, {ANIMATION_DURATION} ms")
+    
     # Apply transformation
-    transformed_points = apply_transformation(points.tolist(), matrix)
+    transformed_array = transform_points(points, matrix)
     
     # Visualization
     viz_col1, viz_col2 = st.columns([3, 1])
@@ -819,7 +926,6 @@ def show_visualization_mode():
         ))
         
         # Transformed shape
-        transformed_array = np.array(transformed_points)
         fig.add_trace(go.Scatter(
             x=transformed_array[:, 0], y=transformed_array[:, 1],
             mode='lines+markers',
@@ -838,6 +944,11 @@ def show_visualization_mode():
             marker=dict(size=15, color='#00C853', symbol='x')
         ))
         
+        if animate:
+            # Semua frame dihitung sekaligus; slider menampilkan frame terakhir (hasil akhir)
+            frames = precompute_frames(points, transition_keyframes(matrix), easing=EASING_OPTIONS[easing])
+            add_animation_frames(fig, frames, trace_index=1)
+        
         fig.update_layout(
             xaxis=dict(
                 range=[-200, 200], 
@@ -862,7 +973,7 @@ def show_visualization_mode():
                 bordercolor='#444',
                 borderwidth=1
             ),
-            height=500,
+            height=560 if animate else 500,
             hovermode='closest',
             title=dict(
                 text=f'{transform_type} pada {shape_type}',
@@ -888,7 +999,7 @@ def show_visualization_mode():
         st.markdown("**Sample Point:**")
         sample_idx = len(points) // 2
         orig_pt = points[sample_idx]
-        trans_pt = transformed_points[sample_idx]
+        trans_pt = transformed_array[sample_idx]
         
         st.code(f"Before:\n({orig_pt[0]:.1f}, {orig_pt[1]:.1f})")
         st.code(f"After:\n({trans_pt[0]:.1f}, {trans_pt[1]:.1f})")
@@ -8,13 +8,14 @@ Pengguna dapat memilih dua titik di canvas untuk menggambar garis.
 import streamlit as st
 import pandas as pd
 import numpy as np
-from PIL import Image, ImageDraw
+from PIL import Image
 
 from config import PAGE_CONFIG, CANVAS_WIDTH, CANVAS_HEIGHT
-from utils.canvas_utils import setup_canvas, get_canvas_data
+from utils.canvas_utils import setup_canvas, get_canvas_geometry
 from utils.code_viewer import show_code, compare_algorithms, show_performance_metrics
-from algorithms.line_algorithms import dda_line, bresenham_line
+from algorithms.line_algorithms import dda_line, bresenham_line, draw_line_into
 from utils.helpers import load_css
+from utils.performance import measure_performance
 
 st.set_page_config(**PAGE_CONFIG)
 
@@ -75,6 +76,12 @@ algo_choice = st.sidebar.selectbox(
     help="Pilih algoritma yang ingin Anda visualisasikan"
 )
 
+benchmark_repeat = st.sidebar.slider(
+    "Pengulangan Pengukuran",
+    1, 50, 10,
+    help="Algoritma dijalankan berulang kali (maks. ~250 ms) untuk statistik waktu yang stabil"
+)
+
 st.sidebar.markdown("---")
 st.sidebar.markdown("### Informasi Koordinat")
 
@@ -131,11 +138,10 @@ with col1:
 
 # --- Logika & Visualisasi --- #
 if canvas_result.json_data and len(canvas_result.json_data["objects"]) > 0:
-    # Ambil object terakhir yang digambar (garis)
-    last_object = canvas_result.json_data["objects"][-1]
-    if last_object["type"] == 'line':
-        x1, y1 = int(last_object['left']), int(last_object['top'])
-        x2, y2 = int(x1 + last_object['width']), int(y1 + last_object['height'])
+    # Ambil garis terakhir yang digambar (ujung dalam koordinat canvas)
+    line_segments = get_canvas_geometry(canvas_result).line_segments()
+    if len(line_segments) > 0:
+        x1, y1, x2, y2 = np.rint(line_segments[-1]).astype(int).tolist()
 
         st.sidebar.markdown(f"**Titik A:** `({x1}, {y1})`")
         st.sidebar.markdown(f"**Titik B:** `({x2}, {y2})`")
@@ -144,64 +150,97 @@ if canvas_result.json_data and len(canvas_result.json_data["objects"]) > 0:
         length = np.sqrt((x2 - x1)**2 + (y2 - y1)**2)
         st.sidebar.markdown(f"**Panjang Garis:** `{length:.2f} px`")
 
-        # Buat gambar kosong untuk visualisasi hasil
-        img = Image.new("RGB", (CANVAS_WIDTH // 2, CANVAS_HEIGHT), color="black")
-        draw = ImageDraw.Draw(img)
+        # Framebuffer kosong untuk visualisasi hasil; garis digambar langsung
+        # ke array (streaming per chunk) tanpa membuat list piksel
+        framebuffer = np.zeros((CANVAS_HEIGHT, CANVAS_WIDTH // 2, 3), dtype=np.uint8)
 
         # Menjalankan algoritma dan menampilkan hasil
         metrics_to_compare = []
 
+        line_functions = {"dda": dda_line, "bresenham": bresenham_line}
+
         def run_and_draw(algorithm, name, color):
-            """Helper untuk menjalankan algoritma, menggambar, dan menyimpan metrik."""
-            result = algorithm(x1, y1, x2, y2)
-            pixels = result.get("result", [])
-            if pixels:
-                draw.point(pixels, fill=color)
-            
-            metrics = {
+            """
+            Helper: mengukur algoritma klasik per piksel, lalu menggambar ke
+            framebuffer (jalur vektorisasi per chunk) dan mengukurnya terpisah.
+            """
+            result = measure_performance(
+                line_functions[algorithm], x1, y1, x2, y2,
+                repeat=benchmark_repeat,
+                time_budget_ms=250,
+                count_operations=True,
+                track_memory=True
+            )
+            pixel_count = len(result.get("result") or [])
+
+            framebuffer_result = measure_performance(
+                draw_line_into, framebuffer, x1, y1, x2, y2, color,
+                algorithm=algorithm,
+                repeat=benchmark_repeat,
+                time_budget_ms=250,
+                count_operations=True,
+                track_memory=True
+            )
+            result['framebuffer'] = framebuffer_result
+
+            metrics_to_compare.append({
                 'name': name,
                 'time': result.get('execution_time_ms', 0),
-                'ops': result.get('operations', 0)
-            }
-            metrics_to_compare.append(metrics)
-            return result, pixels
+                'ops': result.get('operations', 0),
+                'stats': result.get('stats')
+            })
+            metrics_to_compare.append({
+                'name': f"{name} (Framebuffer)",
+                'time': framebuffer_result.get('execution_time_ms', 0),
+                'ops': framebuffer_result.get('operations', 0),
+                'stats': framebuffer_result.get('stats')
+            })
+            return result, pixel_count
 
         if algo_choice == "Bresenham" or algo_choice == "Keduanya untuk Perbandingan":
-            bres_result, bres_pixels = run_and_draw(bresenham_line, "Bresenham", "#FF4B4B")
+            bres_result, bres_pixels = run_and_draw("bresenham", "Bresenham", (255, 75, 75))
             if algo_choice != "Keduanya untuk Perbandingan":
                 with col2:
                     st.markdown("#### Hasil Algoritma Bresenham")
-                    st.image(img, caption="Garis menggunakan Algoritma Bresenham")
+                    st.image(Image.fromarray(framebuffer), caption="Garis menggunakan Algoritma Bresenham")
 
                     st.markdown("##### Metrik Performa")
                     show_performance_metrics(
                         "Bresenham Line", 
                         bres_result['execution_time_ms'], 
-                        bres_result['operations']
+                        bres_result['operations'],
+                        extra_metrics={
+                            "Waktu Framebuffer (ms)": f"{bres_result['framebuffer']['execution_time_ms']:.4f}"
+                        },
+                        stats=bres_result['stats']
                     )
                     
-                    st.success(f"**{len(bres_pixels)} pixel** telah digambar")
+                    st.success(f"**{bres_pixels} pixel** telah digambar")
 
         if algo_choice == "DDA" or algo_choice == "Keduanya untuk Perbandingan":
-            dda_result, dda_pixels = run_and_draw(dda_line, "DDA", "#00C853")
+            dda_result, dda_pixels = run_and_draw("dda", "DDA", (0, 200, 83))
             if algo_choice != "Keduanya untuk Perbandingan":
                 with col2:
                     st.markdown("#### Hasil Algoritma DDA")
-                    st.image(img, caption="Garis menggunakan Algoritma DDA")
+                    st.image(Image.fromarray(framebuffer), caption="Garis menggunakan Algoritma DDA")
 
                     st.markdown("##### Metrik Performa")
                     show_performance_metrics(
                         "DDA",
                         dda_result['execution_time_ms'],
-                        dda_result['operations']
+                        dda_result['operations'],
+                        extra_metrics={
+                            "Waktu Framebuffer (ms)": f"{dda_result['framebuffer']['execution_time_ms']:.4f}"
+                        },
+                        stats=dda_result['stats']
                     )
                     
-                    st.success(f"**{len(dda_pixels)} pixel** telah digambar")
+                    st.success(f"**{dda_pixels} pixel** telah digambar")
         
         if algo_choice == "Keduanya untuk Perbandingan":
             with col2:
                 st.markdown("#### Hasil Perbandingan")
-                st.image(img, caption="🔴 Merah: Bresenham | 🟢 Hijau: DDA")
+                st.image(Image.fromarray(framebuffer), caption="🔴 Merah: Bresenham | 🟢 Hijau: DDA")
                 
                 st.markdown("##### Perbandingan Metrik")
                 compare_algorithms(metrics_to_compare)
@@ -11,9 +11,12 @@ import numpy as np
 import pandas as pd
 from PIL import Image, ImageDraw
 import plotly.graph_objects as go
-from math import sqrt
 import math
 
+from utils.performance import measure_performance
+from utils.code_viewer import show_performance_metrics
+from algorithms.polygon_fill import scanline_fill_into, sample_polygon_grid
+
 # -------------------------
 # Page configuration
 # -------------------------
@@ -26,6 +29,7 @@ PAGE_CONFIG = {
 # Optional canvas import (streamlit-drawable-canvas)
 try:
     from streamlit_drawable_canvas import st_canvas
+    from utils.canvas_utils import get_canvas_geometry
     CANVAS_AVAILABLE = True
 except ImportError:
     CANVAS_AVAILABLE = False
@@ -50,68 +54,15 @@ load_css()
 # -------------------------
 # Geometry helpers
 # -------------------------
-def is_left(p0, p1, p2):
-    """Cross product to determine if p2 is left of p0->p1"""
-    return (p1[0]-p0[0])*(p2[1]-p0[1]) - (p2[0]-p0[0])*(p1[1]-p0[1])
-
-def point_in_polygon_evenodd(x, y, poly):
-    """Ray casting algorithm — Even-Odd rule."""
-    inside = False
-    n = len(poly)
-    for i in range(n):
-        x1, y1 = poly[i]
-        x2, y2 = poly[(i+1) % n]
-        # check if edge intersects horizontal ray to the right of (x,y)
-        if ((y1 > y) != (y2 > y)):
-            # compute intersection x coordinate
-            xint = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
-            if x < xint:
-                inside = not inside
-    return inside
-
-def point_in_polygon_winding(x, y, poly):
-    """Winding number algorithm (non-zero rule)."""
-    wn = 0
-    n = len(poly)
-    for i in range(n):
-        x1, y1 = poly[i]
-        x2, y2 = poly[(i+1) % n]
-        if y1 <= y:
-            if y2 > y:  # upward crossing
-                if is_left((x1, y1), (x2, y2), (x, y)) > 0:
-                    wn += 1
-        else:
-            if y2 <= y:  # downward crossing
-                if is_left((x1, y1), (x2, y2), (x, y)) < 0:
-                    wn -= 1
-    return wn != 0
-
 def raster_fill_samples(poly, method="Even-Odd", sample=2):
     """
     Sample points inside polygon bounding box with grid spacing = sample.
-    Returns list of sample centers considered inside.
+    Returns (K, 2) array of sample centers considered inside; the whole grid
+    is classified at once by the vectorized point-in-polygon test.
     """
-    xs = [p[0] for p in poly]
-    ys = [p[1] for p in poly]
-    if len(xs) == 0 or len(ys) == 0:
-        return []
-    minx, maxx = int(np.floor(min(xs))), int(np.ceil(max(xs)))
-    miny, maxy = int(np.floor(min(ys))), int(np.ceil(max(ys)))
-    pts = []
-    for yy in range(miny, maxy + 1, sample):
-        for xx in range(minx, maxx + 1, sample):
-            cx = xx + 0.5
-            cy = yy + 0.5
-            if method == "Even-Odd":
-                inside = point_in_polygon_evenodd(cx, cy, poly)
-            elif method == "Winding (Non-zero)":
-                inside = point_in_polygon_winding(cx, cy, poly)
-            else:
-                # default to even-odd for sampling
-                inside = point_in_polygon_evenodd(cx, cy, poly)
-            if inside:
-                pts.append((cx, cy))
-    return pts
+    # "Scanline Sampling" defaults to even-odd
+    fill_rule = "nonzero" if method == "Winding (Non-zero)" else "evenodd"
+    return sample_polygon_grid(poly, sample=sample, fill_rule=fill_rule)
 
 def closed_np(poly):
     """Return numpy array with closed polygon (last == first)."""
@@ -125,10 +76,22 @@ def closed_np(poly):
 # -------------------------
 # Visualization helpers
 # -------------------------
-def pil_fill_image(poly_points, fill_color_hex, border_color_hex, width=700, height=500):
-    """Create PIL image showing filled polygon (pixel-perfect using PIL)."""
-    img = Image.new("RGBA", (width, height), (15, 23, 32, 255))
-    draw = ImageDraw.Draw(img, "RGBA")
+# Aturan fill scanline untuk setiap pilihan algoritma di sidebar
+FILL_RULE_BY_ALGORITHM = {
+    "Even-Odd": "evenodd",
+    "Winding (Non-zero)": "nonzero",
+    "Scanline Sampling": "evenodd",
+}
+
+def pil_fill_image(poly_points, fill_color_hex, border_color_hex, width=700, height=500, fill_rule="evenodd"):
+    """
+    Create PIL image showing filled polygon.
+
+    Fill is rasterized with the edge-table scanline algorithm directly into a
+    NumPy canvas (honouring the even-odd / non-zero rule); PIL only draws the border.
+    Returns (image, filled pixel count).
+    """
+    background = (15, 23, 32)
     # convert colors
     def hex_to_rgba(h, a=255):
         h = h.lstrip('#')
@@ -136,14 +99,19 @@ def pil_fill_image(poly_points, fill_color_hex, border_color_hex, width=700, hei
 
     fill_rgba = hex_to_rgba(fill_color_hex, 200)
     border_rgba = hex_to_rgba(border_color_hex, 255)
-    # draw polygon
-    try:
-        draw.polygon(poly_points, fill=fill_rgba, outline=border_rgba)
-    except Exception:
-        # fallback: if points not in right format
-        pts = [(float(x), float(y)) for x, y in poly_points]
-        draw.polygon(pts, fill=fill_rgba, outline=border_rgba)
-    return img
+    # pre-blend the translucent fill over the background
+    alpha = fill_rgba[3] / 255
+    fill_blended = tuple(int(round(c * alpha + bg * (1 - alpha))) for c, bg in zip(fill_rgba[:3], background)) + (255,)
+
+    canvas = np.empty((height, width, 4), dtype=np.uint8)
+    canvas[:] = background + (255,)
+    pts = [(float(x), float(y)) for x, y in poly_points]
+    filled = scanline_fill_into(canvas, pts, fill_blended, fill_rule=fill_rule)["result"]
+
+    img = Image.fromarray(canvas, "RGBA")
+    draw = ImageDraw.Draw(img, "RGBA")
+    draw.polygon(pts, outline=border_rgba)
+    return img, filled
 
 def show_fill_visualization(poly_points, algorithm, sample, fill_color, border_color, title="Hasil Fill"):
     """
@@ -153,10 +121,12 @@ def show_fill_visualization(poly_points, algorithm, sample, fill_color, border_c
         st.warning("Polygon belum lengkap atau tidak valid untuk divisualisasikan.")
         return
 
-    # PIL image (pixel-perfect fill)
-    img = pil_fill_image(poly_points, fill_color, border_color, width=700, height=500)
+    # PIL image (pixel-perfect scanline fill)
+    fill_rule = FILL_RULE_BY_ALGORITHM.get(algorithm, "evenodd")
+    img, filled = pil_fill_image(poly_points, fill_color, border_color, width=700, height=500, fill_rule=fill_rule)
     st.markdown(f"##### {title}")
     st.image(img, width=350)
+    st.caption(f"Scanline (edge table, aturan {fill_rule}): {filled:,} piksel diisi")
     # small gap
     st.markdown("---")
     st.markdown("##### Perbandingan dengan Sampling Grid (visualisasi titik sample)")
@@ -210,38 +180,9 @@ def show_canvas_mode():
                 st.warning("Canvas tidak tersedia.")
             else:
                 if canvas_result and canvas_result.json_data:
-                    json_data = canvas_result.json_data
-                    objects = json_data.get("objects", [])
-                    found = None
-                    for obj in objects:
-                        obj_type = obj.get("type", "")
-                        if obj_type in ("polygon", "path", "polyline", "line"):
-                            pts = []
-                            # prefer points
-                            if "points" in obj and isinstance(obj["points"], list):
-                                try:
-                                    pts = [(float(p.get("x")), float(p.get("y"))) for p in obj["points"] if "x" in p and "y" in p]
-                                except Exception:
-                                    pts = []
-                            # fallback to path (SVG-like)
-                            elif "path" in obj and isinstance(obj["path"], list):
-                                for cmd in obj["path"]:
-                                    if isinstance(cmd, (list, tuple)) and len(cmd) >= 3:
-                                        # cmd format: ["M", x, y] or ["L", x, y]
-                                        try:
-                                            x = float(cmd[1]); y = float(cmd[2])
-                                            pts.append((x, y))
-                                        except Exception:
-                                            continue
-                            # fallback line coords
-                            elif all(k in obj for k in ("x1", "y1", "x2", "y2")):
-                                try:
-                                    pts = [(float(obj["x1"]), float(obj["y1"])), (float(obj["x2"]), float(obj["y2"]))]
-                                except Exception:
-                                    pts = []
-                            if len(pts) >= 3:
-                                found = pts
-                                break
+                    # Parser bersama: polygon, path (kurva di-flatten), rect, circle
+                    polygons = get_canvas_geometry(canvas_result).polygons(min_points=3)
+                    found = list(map(tuple, polygons[0].tolist())) if polygons else None
                     if found:
                         st.session_state.polygon_canvas = found
                         st.success("✅ Bentuk berhasil disimpan ke session state.")
@@ -331,8 +272,12 @@ def show_fill_plotly(poly_points, algorithm, sample, fill_color, border_color, t
         return
 
     closed = closed_np(poly_points)
-    filled_pts = raster_fill_samples(poly_points, method=algorithm, sample=sample)
-    filled_arr = np.array(filled_pts) if len(filled_pts) > 0 else np.empty((0, 2))
+    fill_perf = measure_performance(
+        raster_fill_samples, poly_points,
+        method=algorithm, sample=sample,
+        repeat=5, time_budget_ms=250, track_memory=True
+    )
+    filled_arr = fill_perf["result"]
     poly_arr = np.array(poly_points)
 
     fig = go.Figure()
@@ -382,7 +327,7 @@ def show_fill_plotly(poly_points, algorithm, sample, fill_color, border_color, t
     xs = poly_arr[:, 0]; ys = poly_arr[:, 1]
     bbox = (float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max()))
     orig_area_bb = (xs.max() - xs.min()) * (ys.max() - ys.min())
-    fill_count = len(filled_pts)
+    fill_count = len(filled_arr)
     est_area = fill_count * (sample ** 2)
 
     stat_col1, stat_col2, stat_col3, stat_col4 = st.columns(4)
@@ -391,13 +336,20 @@ def show_fill_plotly(poly_points, algorithm, sample, fill_color, border_color, t
     stat_col3.metric("Est. area (approx)", f"{est_area:.0f} px²")
     stat_col4.metric("BB area", f"{orig_area_bb:.0f} px²")
 
+    show_performance_metrics(
+        f"Sampling ({algorithm})",
+        fill_perf["execution_time_ms"],
+        fill_count,
+        stats=fill_perf["stats"]
+    )
+
     # show sample before/after
     sample_idx = len(poly_points) // 2
     orig_pt = poly_points[sample_idx]
     nearest = None
     if fill_count > 0:
-        dists = [sqrt((fp[0] - orig_pt[0]) ** 2 + (fp[1] - orig_pt[1]) ** 2) for fp in filled_pts]
-        nearest = filled_pts[int(np.argmin(dists))]
+        dists = np.hypot(filled_arr[:, 0] - orig_pt[0], filled_arr[:, 1] - orig_pt[1])
+        nearest = filled_arr[int(np.argmin(dists))]
     st.markdown("---")
     st.markdown("**Sample point**")
     st.code(f"Before: {orig_pt}")
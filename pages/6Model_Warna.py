@@ -12,7 +12,7 @@ from config import PAGE_CONFIG
 from algorithms.color_models import (
     rgb_to_hsv, hsv_to_rgb,
     rgb_to_cmyk, cmyk_to_rgb,
-    calculate_phong_lighting
+    calculate_phong_lighting_batch
 )
 from utils.helpers import load_css
 
@@ -233,47 +233,23 @@ if section_choice in ["Model Pencahayaan Phong", "Keduanya"]:
         camera_pos = np.array([0, 0, 2]) # Kamera di depan bola
         material = {'ka': ka, 'kd': kd, 'ks': ks, 'shininess': shininess}
 
-        # Progress bar untuk rendering
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        # Loop melalui setiap piksel di gambar
-        total_pixels = size * size
-        processed = 0
-        
-        for i in range(size):
-            for j in range(size):
-                # Konversi koordinat piksel ke ruang 3D di permukaan bola
-                x = (j - size / 2) / (size / 2)
-                y = (size / 2 - i) / (size / 2)
-                
-                z2 = 1.0 - x*x - y*y
-                if z2 > 0: # Jika piksel ada di dalam lingkaran bola
-                    z = np.sqrt(z2)
-                    point_pos = np.array([x, y, z])
-                    point_normal = point_pos # Untuk bola, normal sama dengan posisi relatif ke pusat
-                    
-                    # Hitung warna menggunakan Phong
-                    color = calculate_phong_lighting(
-                        light_color=light_color,
-                        light_position=light_pos,
-                        camera_position=camera_pos,
-                        point_position=point_pos,
-                        point_normal=point_normal,
-                        material=material
-                    )
-                    sphere_img[i, j] = color
-                
-                processed += 1
-            
-            # Update progress setiap baris
-            if i % 10 == 0:
-                progress = int((i / size) * 100)
-                progress_bar.progress(progress)
-                status_text.text(f"⏳ Rendering... {progress}%")
-        
-        progress_bar.progress(100)
-        status_text.text("Rendering selesai!")
+        # Konversi semua koordinat piksel ke ruang 3D di permukaan bola sekaligus
+        i, j = np.mgrid[0:size, 0:size]
+        x = (j - size / 2) / (size / 2)
+        y = (size / 2 - i) / (size / 2)
+        z2 = 1.0 - x*x - y*y
+        inside = z2 > 0 # Piksel yang berada di dalam lingkaran bola
+
+        point_pos = np.column_stack([x[inside], y[inside], np.sqrt(z2[inside])])
+        # Untuk bola, normal sama dengan posisi relatif ke pusat
+        sphere_img[inside] = calculate_phong_lighting_batch(
+            light_color=light_color,
+            light_position=light_pos,
+            camera_position=camera_pos,
+            point_positions=point_pos,
+            point_normals=point_pos,
+            material=material
+        )
         
         st.image(sphere_img, caption="Bola 3D dengan Model Pencahayaan Phong", use_column_width=True)
         
@@ -11,8 +11,9 @@ import plotly.graph_objects as go
 import json
 
 from config import PAGE_CONFIG
-from algorithms.shading import flat_shading, gouraud_shading
-from algorithms.color_models import calculate_phong_lighting
+from algorithms.shading import flat_shading_mesh, gouraud_shading_mesh, phong_shading_image
+from algorithms.mesh import Mesh
+from utils.performance import measure_performance
 from utils.helpers import load_css
 
 st.set_page_config(**PAGE_CONFIG)
@@ -70,19 +71,17 @@ st.markdown("---")
 @st.cache_data
 def load_object_data(file_path: str):
     """
-    Memuat data vertex dan poligon dari file JSON.
+    Memuat data vertex dan poligon dari file JSON menjadi Mesh.
     """
     try:
         with open(file_path, 'r') as f:
             data = json.load(f)
         
-        # Konversi ke numpy array untuk kemudahan kalkulasi
-        vertices = [{"position": np.array(v["position"]), "normal": np.array(v["normal"])} for v in data["vertices"]]
-        polygons = data["polygons"]
-        return vertices, polygons
+        # Buffer vertex kontigu (struct-of-arrays) untuk kalkulasi seluruh mesh
+        return Mesh.from_vertex_dicts(data["vertices"], data["polygons"])
     except Exception as e:
         st.error(f"Gagal memuat data objek: {e}")
-        return [], []
+        return None
 
 # --- Sidebar Kontrol --- #
 st.sidebar.markdown("### Pengaturan Shading")
@@ -184,19 +183,14 @@ st.markdown("###  Visualisasi Objek 3D")
 st.info(f" Menampilkan objek dengan **{shading_type} Shading** - Klik dan drag untuk merotasi")
 
 # Memuat data objek (misal: kubus atau teapot)
-vertices, polygons = load_object_data("assets/data/sample_objects.json")
+mesh = load_object_data("assets/data/sample_objects.json")
 
-if vertices and polygons:
+if mesh is not None and mesh.face_count > 0:
     col1, col2 = st.columns([2, 1])
     
     with col1:
         st.markdown("####  Hasil Rendering 3D")
         
-        # Ekstrak posisi vertex untuk plotting
-        x_coords = [v['position'][0] for v in vertices]
-        y_coords = [v['position'][1] for v in vertices]
-        z_coords = [v['position'][2] for v in vertices]
-
         # Argumen pencahayaan
         lighting_args = {
             'light_color': light_color,
@@ -211,21 +205,14 @@ if vertices and polygons:
         lighting_model = None
 
         if shading_type == "Flat":
-            for poly in polygons:
-                color = flat_shading(poly, vertices, **lighting_args)
-                face_colors.append(f'rgb({color[0]},{color[1]},{color[2]})')
+            # Satu warna per face, semua face dihitung dalam satu pass
+            colors = flat_shading_mesh(mesh.positions, mesh.normals, mesh.triangles, **lighting_args)
+            face_colors = [f'rgb({r},{g},{b})' for r, g, b in colors.tolist()]
         
         elif shading_type == "Gouraud":
-            # Hitung warna di setiap vertex unik
-            unique_vertex_colors = []
-            for i in range(len(vertices)):
-                color = calculate_phong_lighting(
-                    point_position=vertices[i]['position'],
-                    point_normal=vertices[i]['normal'],
-                    **lighting_args
-                )
-                unique_vertex_colors.append(f'rgb({color[0]},{color[1]},{color[2]})')
-            vertex_colors = unique_vertex_colors
+            # Hitung warna di setiap vertex unik tepat satu kali
+            colors = gouraud_shading_mesh(mesh.positions, mesh.normals, **lighting_args)
+            vertex_colors = [f'rgb({r},{g},{b})' for r, g, b in colors.tolist()]
 
         elif shading_type == "Phong (Simulasi)":
             # Plotly mendukung Phong shading secara native
@@ -239,12 +226,7 @@ if vertices and polygons:
 
         # Buat mesh 3D dengan Plotly
         fig = go.Figure(data=[go.Mesh3d(
-            x=x_coords,
-            y=y_coords,
-            z=z_coords,
-            i=[p[0] for p in polygons],
-            j=[p[1] for p in polygons],
-            k=[p[2] for p in polygons],
+            **mesh.plotly_mesh3d_arrays(),
             facecolor=face_colors if shading_type == "Flat" else None,
             vertexcolor=vertex_colors if shading_type == "Gouraud" else None,
             # Untuk Phong, kita serahkan ke Plotly
@@ -268,14 +250,28 @@ if vertices and polygons:
         )
 
         st.plotly_chart(fig, use_container_width=True)
+
+        if shading_type == "Phong (Simulasi)":
+            # Phong per piksel yang sebenarnya: rasterizer software + z-buffer
+            st.markdown("####  Phong per Piksel (Software Rasterizer)")
+            phong_perf = measure_performance(
+                phong_shading_image,
+                mesh.positions, mesh.normals, mesh.triangles,
+                width=640, height=480, fov_y=25.0, background=(14, 17, 23),
+                repeat=1,
+                **lighting_args
+            )
+            st.image(phong_perf["result"], caption="Normal diinterpolasi per piksel, Phong dievaluasi per fragmen", use_column_width=True)
+            st.caption(f"Render 640x480: {phong_perf['execution_time_ms']:.1f} ms")
+
         st.success(f" Rendering dengan **{shading_type}** berhasil!")
     
     with col2:
         st.markdown("####  Statistik Objek")
         
-        st.metric("Total Vertices", len(vertices))
-        st.metric("Total Poligon", len(polygons))
-        st.metric("Total Edges", len(polygons) * 3)
+        st.metric("Total Vertices", mesh.vertex_count)
+        st.metric("Total Poligon", mesh.face_count)
+        st.metric("Total Edges", len(mesh.edges))
         
         st.markdown("---")
         st.markdown("####  Kontrol Interaktif")
@@ -295,15 +291,15 @@ if vertices and polygons:
         
         # Estimasi kompleksitas
         if shading_type == "Flat":
-            complexity = len(polygons)
+            complexity = mesh.face_count
             complexity_text = "Rendah"
             color = "green"
         elif shading_type == "Gouraud":
-            complexity = len(vertices)
+            complexity = mesh.vertex_count
             complexity_text = "Sedang"
             color = "orange"
         else:
-            complexity = len(polygons) * 1000  # Estimasi pixel
+            complexity = mesh.face_count * 1000  # Estimasi pixel
             complexity_text = "Tinggi"
             color = "red"
         
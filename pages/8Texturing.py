@@ -8,11 +8,16 @@ termasuk visualisasi koordinat UV dan efek filtering.
 import streamlit as st
 import numpy as np
 from PIL import Image, ImageDraw
-import plotly.graph_objects as go
 import json
 
 from config import PAGE_CONFIG
 from utils.helpers import load_css
+from algorithms.line_algorithms import bresenham_line_batch
+from algorithms.mesh import Mesh
+from algorithms.rasterizer import look_at, perspective
+from algorithms.texturing import render_textured, MipmapPyramid
+from utils.performance import measure_performance
+from utils.texture_io import TextureAsset, content_key, load_texture, texture_from_array
 
 st.set_page_config(**PAGE_CONFIG)
 
@@ -71,7 +76,7 @@ st.markdown("---")
 @st.cache_data
 def load_textured_object(file_path: str):
     """
-    Memuat data objek yang sudah memiliki koordinat UV.
+    Memuat data objek yang sudah memiliki koordinat UV sebagai Mesh.
     Menangani JSON dengan komentar (// ...).
     """
     try:
@@ -93,32 +98,48 @@ def load_textured_object(file_path: str):
             # Parse JSON
             data = json.loads(cleaned_content)
         
-        vertices = np.array([v['position'] for v in data["vertices"]])
-        uvs = np.array([v['uv'] for v in data["vertices"]])
-        polygons = data["polygons"]
-        return vertices, uvs, polygons
+        return Mesh.from_vertex_dicts(data["vertices"], data["polygons"])
     except FileNotFoundError:
         st.error(f"❌ File tidak ditemukan: {file_path}")
-        return None, None, None
+        return None
     except json.JSONDecodeError as e:
         st.error(f"❌ Error parsing JSON: {e}")
         st.error(f"Pastikan file JSON valid (tanpa komentar atau gunakan format yang benar)")
-        return None, None, None
+        return None
     except Exception as e:
         st.error(f"❌ Gagal memuat data objek: {e}")
-        return None, None, None
+        return None
+
+@st.cache_resource(max_entries=8)
+def get_mipmap_pyramid(texture_key: str, _texture: np.ndarray, mip_filter: str) -> MipmapPyramid:
+    """
+    Membangun piramida mipmap sekali per isi tekstur dan filter.
+    Kunci cache adalah hash isi tekstur, sehingga rerun dan sesi lain
+    dengan tekstur yang sama memakai piramida yang sama.
+    """
+    return MipmapPyramid.from_texture(_texture, mip_filter)
+
+@st.cache_resource(max_entries=16)
+def ingest_texture(texture_key: str, _data: bytes) -> TextureAsset:
+    """
+    Mendekode file tekstur sekali per isi file. Kunci cache adalah hash isi,
+    sehingga upload identik (juga dari sesi lain) berbagi satu salinan.
+    """
+    return load_texture(_data, key=texture_key)
+
+def load_texture_file(data: bytes) -> TextureAsset:
+    return ingest_texture(content_key(data), data)
+
+def load_default_texture() -> TextureAsset:
+    with open("assets/images/IU.jpeg", "rb") as f:
+        return load_texture_file(f.read())
 
 def create_checkerboard_texture(size=64, checker_size=8):
     """Membuat tekstur checkerboard sebagai fallback"""
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
-    for i in range(size):
-        for j in range(size):
-            if (i // checker_size % 2) == (j // checker_size % 2):
-                pixels[i, j] = (255, 0, 255)  # Magenta
-            else:
-                pixels[i, j] = (0, 0, 0)  # Hitam
-    return img
+    rows, cols = np.indices((size, size)) // checker_size
+    texture = np.zeros((size, size, 3), dtype=np.uint8)
+    texture[(rows % 2) == (cols % 2)] = (255, 0, 255)  # Magenta, sisanya hitam
+    return texture_from_array(texture)
 
 def create_default_cube():
     """Membuat data cube default jika file tidak ditemukan"""
@@ -149,17 +170,17 @@ def create_default_cube():
         [20, 21, 22], [20, 22, 23]
     ]
     
-    return vertices, uvs, polygons
+    return Mesh(vertices, polygons, uvs=uvs)
 
 # Initialize texture state
-if 'texture_image' not in st.session_state:
+if 'texture_asset' not in st.session_state:
     # Load default texture
     try:
-        st.session_state.texture_image = Image.open("assets/images/IU.jpeg")
+        st.session_state.texture_asset = load_default_texture()
         st.session_state.texture_source = "Default (IU.jpeg)"
     except FileNotFoundError:
         st.warning("⚠️ File tekstur default tidak ditemukan. Menggunakan checkerboard.")
-        st.session_state.texture_image = create_checkerboard_texture()
+        st.session_state.texture_asset = create_checkerboard_texture()
         st.session_state.texture_source = "Checkerboard (Fallback)"
 
 # --- Sidebar Kontrol --- #
@@ -172,17 +193,20 @@ uploaded_file = st.sidebar.file_uploader(
     help="Upload gambar PNG/JPG untuk digunakan sebagai tekstur"
 )
 if uploaded_file is not None:
-    st.session_state.texture_image = Image.open(uploaded_file)
-    st.session_state.texture_source = f"Custom ({uploaded_file.name})"
-    st.sidebar.success(" Tekstur kustom berhasil dimuat!")
+    try:
+        st.session_state.texture_asset = load_texture_file(uploaded_file.getvalue())
+        st.session_state.texture_source = f"Custom ({uploaded_file.name})"
+        st.sidebar.success(" Tekstur kustom berhasil dimuat!")
+    except Exception as e:
+        st.sidebar.error(f"❌ Gagal memuat tekstur: {e}")
 
 # Reset to default
 if st.sidebar.button(" Reset ke Default"):
     try:
-        st.session_state.texture_image = Image.open("assets/images/IU.jpeg")
+        st.session_state.texture_asset = load_default_texture()
         st.session_state.texture_source = "Default (IU.jpeg)"
     except FileNotFoundError:
-        st.session_state.texture_image = create_checkerboard_texture()
+        st.session_state.texture_asset = create_checkerboard_texture()
         st.session_state.texture_source = "Checkerboard (Fallback)"
     st.sidebar.success(" Tekstur direset!")
 
@@ -190,25 +214,52 @@ st.sidebar.markdown("---")
 st.sidebar.markdown("###  Filter Tekstur")
 
 # Opsi filtering
+FILTER_METHODS = {
+    "Nearest Neighbor": "nearest",
+    "Bilinear": "bilinear",
+    "Trilinear": "trilinear",
+    "Anisotropic": "anisotropic",
+}
 texture_filtering = st.sidebar.selectbox(
     "Metode Filtering",
-    ["Nearest Neighbor", "Bilinear", "Trilinear (Simulasi)"],
+    list(FILTER_METHODS),
     help="Pilih metode filtering untuk sampling tekstur"
 )
+texture_wrap = st.sidebar.selectbox(
+    "Mode Wrap",
+    ["repeat", "clamp", "mirror"],
+    help="Perlakuan koordinat UV di luar rentang [0, 1]"
+)
+MIPMAP_FILTER_OPTIONS = {"Box 2x2 (cepat)": "box", "Lanczos": "lanczos"}
+mipmap_filter = st.sidebar.selectbox(
+    "Filter Mipmap",
+    list(MIPMAP_FILTER_OPTIONS),
+    help="Filter downsampling untuk membangun level mipmap (dipakai Trilinear dan Anisotropic)"
+)
+anisotropy_level = st.sidebar.select_slider(
+    "Level Anisotropic",
+    options=[2, 4, 8, 16],
+    value=8,
+    help="Jumlah tap trilinear maksimum di sepanjang sumbu mayor footprint piksel"
+)
 
 # Texture info
 st.sidebar.markdown("---")
 st.sidebar.markdown("###  Informasi Tekstur")
-texture_width, texture_height = st.session_state.texture_image.size
+texture_asset = st.session_state.texture_asset
+texture_width, texture_height = texture_asset.size
 st.sidebar.markdown(f"**Sumber:** `{st.session_state.texture_source}`")
 st.sidebar.markdown(f"**Resolusi:** `{texture_width} × {texture_height}px`")
-st.sidebar.markdown(f"**Format:** `{st.session_state.texture_image.mode}`")
+if texture_asset.source_size != texture_asset.size:
+    source_width, source_height = texture_asset.source_size
+    st.sidebar.markdown(f"**Resolusi Asli:** `{source_width} × {source_height}px` (diperkecil)")
+st.sidebar.markdown(f"**Format:** `{texture_asset.mode}` (asli `{texture_asset.source_mode}`)")
 st.sidebar.markdown(f"**Filter:** `{texture_filtering}`")
 
 # Preview tekstur
 st.sidebar.markdown("---")
 st.sidebar.markdown("###  Preview Tekstur")
-st.sidebar.image(st.session_state.texture_image, caption="Tekstur Saat Ini", use_column_width=True)
+st.sidebar.image(texture_asset.thumbnail, caption="Tekstur Saat Ini", use_column_width=True)
 
 # --- Konsep Section --- #
 with st.expander("**Konsep: Texture Mapping**", expanded=False):
@@ -284,14 +335,17 @@ st.markdown("###  Visualisasi Texture Mapping")
 st.info(" Lihat bagaimana tekstur 2D dipetakan ke objek 3D menggunakan koordinat UV")
 
 # Load object data
-vertices, uvs, polygons = load_textured_object("assets/data/sample_objects.json")
+mesh = load_textured_object("assets/data/sample_objects.json")
 
-# Fallback ke default cube jika gagal load
-if vertices is None or uvs is None or polygons is None:
+# Fallback ke default cube jika gagal load (atau objek tanpa UV)
+if mesh is None or mesh.uvs is None:
     st.warning(" File tidak ditemukan. Menggunakan cube default.")
-    vertices, uvs, polygons = create_default_cube()
+    mesh = create_default_cube()
 
-if uvs is not None and vertices is not None:
+texture_array = texture_asset.texture
+
+if mesh.uvs is not None:
+    uvs = mesh.uvs
     col1, col2 = st.columns(2)
 
     with col1:
@@ -299,34 +353,40 @@ if uvs is not None and vertices is not None:
         st.markdown("Garis cyan menunjukkan bagaimana poligon 3D 'dibuka' pada tekstur 2D")
         
         # Gambar UV map di atas tekstur
-        uv_map_img = st.session_state.texture_image.copy().convert("RGBA")
-        draw = ImageDraw.Draw(uv_map_img)
+        uv_map_img = Image.fromarray(texture_array).convert("RGBA")
         img_width, img_height = uv_map_img.size
 
-        # Draw UV wireframe
-        for poly in polygons:
-            # Ambil koordinat UV untuk setiap vertex di poligon
-            poly_uvs = [
-                (uvs[i][0] * img_width, (1 - uvs[i][1]) * img_height) 
-                for i in poly
-            ]
-            # Gambar garis yang menghubungkan UVs
-            draw.line(poly_uvs + [poly_uvs[0]], fill="cyan", width=2)
-            
-            # Draw vertex points
-            for uv in poly_uvs:
-                draw.ellipse(
-                    [uv[0]-3, uv[1]-3, uv[0]+3, uv[1]+3],
-                    fill="yellow",
-                    outline="cyan"
-                )
+        # Draw UV wireframe: semua edge unik mesh dirasterisasi sekaligus (batch)
+        uv_pixels = np.column_stack([
+            uvs[:, 0] * img_width,
+            (1 - uvs[:, 1]) * img_height
+        ]).astype(int)
+        edges = mesh.edges
+        segments = np.hstack([uv_pixels[edges[:, 0]], uv_pixels[edges[:, 1]]])
+        wire_pixels, _ = bresenham_line_batch(segments)["result"]
+
+        uv_map_array = np.array(uv_map_img)
+        for ox, oy in ((0, 0), (1, 0), (0, 1)):  # tebal garis ~2 px
+            wx = np.clip(wire_pixels[:, 0] + ox, 0, img_width - 1)
+            wy = np.clip(wire_pixels[:, 1] + oy, 0, img_height - 1)
+            uv_map_array[wy, wx] = (0, 255, 255, 255)
+        uv_map_img = Image.fromarray(uv_map_array)
+        draw = ImageDraw.Draw(uv_map_img)
+
+        # Draw vertex points (setiap vertex yang dipakai face sekali saja)
+        for uv in uv_pixels[np.unique(mesh.faces)].tolist():
+            draw.ellipse(
+                [uv[0]-3, uv[1]-3, uv[0]+3, uv[1]+3],
+                fill="yellow",
+                outline="cyan"
+            )
 
         st.image(uv_map_img, caption="UV Wireframe pada Tekstur", use_column_width=True)
         
         st.markdown("---")
         st.markdown("** Informasi UV:**")
-        st.markdown(f"- **Jumlah Vertices:** `{len(uvs)}`")
-        st.markdown(f"- **Jumlah Polygons:** `{len(polygons)}`")
+        st.markdown(f"- **Jumlah Vertices:** `{mesh.vertex_count}`")
+        st.markdown(f"- **Jumlah Polygons:** `{mesh.face_count}`")
         st.markdown(f"- **UV Range:** U ∈ [0,1], V ∈ [0,1]")
         
         # UV statistics
@@ -339,52 +399,51 @@ if uvs is not None and vertices is not None:
         st.markdown("####  Hasil Objek 3D dengan Tekstur")
         st.markdown(f"Rendering dengan **{texture_filtering}** filtering")
         
-        # Buat mesh 3D dengan Plotly
-        fig = go.Figure(data=[go.Mesh3d(
-            x=vertices[:, 0],
-            y=vertices[:, 1],
-            z=vertices[:, 2],
-            i=[p[0] for p in polygons],
-            j=[p[1] for p in polygons],
-            k=[p[2] for p in polygons],
-            # Plotly tidak support langsung texture mapping dengan UV
-            # Ini adalah limitasi dari Plotly, biasanya butuh WebGL custom
-            facecolor=['rgb(200,200,200)'] * len(polygons),  # Placeholder
-            name='Textured Object',
-            showscale=False,
-            lighting=dict(
-                ambient=0.5,
-                diffuse=0.8,
-                specular=0.3,
-                roughness=0.5
+        view_col1, view_col2 = st.columns(2)
+        with view_col1:
+            yaw = st.slider("Rotasi (derajat)", 0, 360, 35)
+        with view_col2:
+            distance = st.slider("Jarak Kamera", 1.5, 12.0, 2.8, 0.1)
+
+        # Kamera mengorbit pusat objek; jarak jauh memperlihatkan efek minifikasi
+        angle = np.radians(yaw)
+        center = (mesh.positions.min(axis=0) + mesh.positions.max(axis=0)) / 2
+        eye = center + distance * np.array([np.sin(angle), 0.6, np.cos(angle)])
+        mvp = perspective(45.0, 4 / 3, 0.05, distance + 10.0) @ look_at(eye, center)
+
+        method = FILTER_METHODS[texture_filtering]
+        mipmaps = None
+        if method in ("trilinear", "anisotropic"):
+            mipmaps = get_mipmap_pyramid(
+                texture_asset.key, texture_array, MIPMAP_FILTER_OPTIONS[mipmap_filter]
             )
-        )])
-
-        fig.update_layout(
-            margin=dict(l=0, r=0, b=0, t=0),
-            scene=dict(
-                xaxis=dict(title='X', backgroundcolor="rgb(20, 24, 30)"),
-                yaxis=dict(title='Y', backgroundcolor="rgb(20, 24, 30)"),
-                zaxis=dict(title='Z', backgroundcolor="rgb(20, 24, 30)"),
-                camera_eye=dict(x=1.8, y=1.8, z=1.8)
-            ),
-            paper_bgcolor="#0E1117",
-            font_color="white",
-            height=500
+
+        render_perf = measure_performance(
+            render_textured,
+            mesh.positions, mesh.triangles, mesh.uvs, texture_array, mvp, 640, 480,
+            method=method, wrap=texture_wrap, mipmaps=mipmaps, background=(14, 17, 23),
+            max_anisotropy=anisotropy_level, repeat=1
         )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        
+        st.image(render_perf["result"], caption="Rasterizer software, UV perspective-correct per piksel", use_column_width=True)
+        st.caption(f"Waktu render ({texture_filtering}, 640×480): {render_perf['execution_time_ms']:.1f} ms")
+        if mipmaps is not None:
+            st.caption(
+                f"Mipmap: {len(mipmaps)} level ({mipmaps.filter}), "
+                f"{mipmaps.nbytes / 1024:.0f} KB; tambahan memori {mipmaps.overhead:.1%} dari tekstur"
+            )
+
         st.info("""
-        ℹ**Catatan:** Plotly memiliki keterbatasan dalam texture mapping. 
-        Untuk hasil yang lebih akurat, gunakan WebGL atau game engine seperti Unity/Unreal.
+        ℹ**Catatan:** Gambar dirender dengan rasterizer software NumPy (z-buffer +
+        interpolasi UV per piksel), sehingga metode filtering benar-benar
+        memengaruhi hasil. Perbesar jarak kamera untuk melihat aliasing
+        yang diredam oleh filtering trilinear (mipmap).
         """)
-        
+
         st.markdown("---")
         st.markdown("** Kontrol:**")
-        st.markdown("-  **Drag:** Rotasi objek")
-        st.markdown("-  **Scroll:** Zoom in/out")
-        st.markdown("-  **Right-drag:** Pan view")
+        st.markdown("-  **Rotasi:** Putar kamera mengelilingi objek")
+        st.markdown("-  **Jarak Kamera:** Zoom in/out")
+        st.markdown("-  **Mode Wrap:** Lihat sidebar")
 
 else:
     st.error("""
@@ -396,6 +455,54 @@ else:
     - Definisi polygons
     """)
 
+# --- Kualitas vs Biaya Anisotropic --- #
+with st.expander(" **Kualitas vs Biaya Filtering Anisotropic**", expanded=False):
+    st.markdown("""
+    Lantai bertekstur dilihat dari sudut landai (kasus terberat untuk trilinear).
+    Setiap level dirender dengan tekstur saat ini, lalu dibandingkan dengan
+    referensi anisotropic 64 tap menggunakan PSNR (semakin tinggi semakin mirip).
+    Level 1× setara dengan trilinear.
+    """)
+
+    if st.button("Jalankan Perbandingan"):
+        floor_positions = np.array([[-1.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 0.0, -40.0], [-1.0, 0.0, -40.0]])
+        floor_triangles = np.array([[0, 1, 2], [0, 2, 3]])
+        floor_uvs = np.array([[0.0, 0.0], [2.0, 0.0], [2.0, 40.0], [0.0, 40.0]])
+        floor_mvp = perspective(60.0, 4 / 3, 0.1, 100.0) @ look_at(np.array([0.0, 0.4, 1.0]), np.array([0.0, 0.0, -5.0]))
+        floor_mipmaps = get_mipmap_pyramid(
+            texture_asset.key, texture_array, MIPMAP_FILTER_OPTIONS[mipmap_filter]
+        )
+        floor_args = (floor_positions, floor_triangles, floor_uvs, texture_array, floor_mvp, 640, 480)
+
+        reference = render_textured(
+            *floor_args, method="anisotropic", wrap="repeat", mipmaps=floor_mipmaps, max_anisotropy=64
+        ).astype(float)
+
+        rows, previews = [], []
+        for level in (1, 2, 4, 8, 16):
+            perf = measure_performance(
+                render_textured, *floor_args,
+                method="anisotropic", wrap="repeat", mipmaps=floor_mipmaps, max_anisotropy=level,
+                repeat=3
+            )
+            mse = np.mean((perf["result"].astype(float) - reference) ** 2)
+            psnr = 10 * np.log10(255 ** 2 / mse) if mse > 0 else float("inf")
+            rows.append({
+                "Level": f"{level}×",
+                "Waktu (ms)": round(perf["execution_time_ms"], 1),
+                "PSNR vs referensi (dB)": round(psnr, 2),
+            })
+            previews.append(perf["result"])
+
+        st.table(rows)
+        preview_cols = st.columns(len(previews))
+        for col, row, image in zip(preview_cols, rows, previews):
+            col.image(image[200:], caption=row["Level"], use_column_width=True)
+        st.caption(
+            "Tambahan tap hanya terjadi pada piksel dengan footprint memanjang, sehingga "
+            "biaya naik jauh lebih lambat daripada jumlah tap maksimum."
+        )
+
 st.markdown("---")
 
 # --- Perbandingan Filtering --- #
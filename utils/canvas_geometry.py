@@ -0,0 +1,597 @@
+"""
+Geometri Objek Canvas (fabric.js).
+
+Mengubah objek JSON hasil `st_canvas` (path freedraw, line, rect, circle,
+ellipse, polygon, polyline) menjadi titik kontrol dalam koordinat canvas,
+dikemas dalam satu `ShapeBatch`, lalu menuliskannya kembali sebagai objek
+fabric.js setelah ditransformasi. Transformasi milik objek (origin, angle,
+scale, skew, flip) "dipanggang" ke koordinat, sehingga hasilnya dapat dimuat
+ulang sebagai `initial_drawing` tanpa bergantung pada atribut transformasi.
+
+`parse_canvas_geometry` adalah parser bersama untuk semua halaman canvas:
+seluruh objek diubah menjadi polyline bertipe dalam satu ShapeBatch (kurva
+Bézier dan lingkaran di-flatten adaptif sesuai toleransi piksel), diberi kunci
+hash JSON agar dapat di-cache antar rerun.
+
+Modul ini tidak bergantung pada Streamlit; caching dilakukan di
+`utils.canvas_utils`.
+"""
+
+import hashlib
+import math
+import pickle
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
+
+from algorithms.transformations import Affine2D, ShapeBatch
+from config import CANVAS_FLATTEN_TOLERANCE
+
+SUPPORTED_TYPES = ("path", "line", "rect", "circle", "ellipse", "polygon", "polyline")
+
+# Perintah path absolut (bentuk yang diserialisasi fabric.js) -> jumlah pasangan koordinat
+PATH_COMMANDS = {"M": 1, "L": 1, "Q": 2, "C": 3, "Z": 0, "z": 0}
+
+# Posisi origin fabric.js relatif terhadap pusat objek (dalam satuan dimensi objek)
+_ORIGIN_OFFSETS = {"left": -0.5, "top": -0.5, "center": 0.0, "right": 0.5, "bottom": 0.5}
+
+# Toleransi relatif untuk mempertahankan rect/circle (tanpa shear) saat ditulis kembali
+_SHAPE_TOLERANCE = 1e-9
+
+# --- Transformasi Objek fabric.js ----------------------------------------------
+
+def _origin_offset(value) -> float:
+    if isinstance(value, str):
+        return _ORIGIN_OFFSETS.get(value, -0.5)
+    return float(value) - 0.5
+
+def _scale_skew(obj: Dict[str, Any]) -> Affine2D:
+    """Bagian S × SkewX × SkewY dari matriks objek (tanpa rotasi)."""
+    sx = obj.get("scaleX", 1.0) * (-1.0 if obj.get("flipX") else 1.0)
+    sy = obj.get("scaleY", 1.0) * (-1.0 if obj.get("flipY") else 1.0)
+    linear = Affine2D.scale(sx, sy)
+    if obj.get("skewX"):
+        linear = linear @ Affine2D.shear(math.tan(math.radians(obj["skewX"])), 0.0)
+    if obj.get("skewY"):
+        linear = linear @ Affine2D.shear(0.0, math.tan(math.radians(obj["skewY"])))
+    return linear
+
+def _transformed_dimensions(obj: Dict[str, Any], width: float, height: float) -> Tuple[float, float]:
+    """Dimensi objek setelah scale/skew termasuk stroke (`_getTransformedDimensions`)."""
+    stroke = obj.get("strokeWidth", 1.0)
+    uniform = bool(obj.get("strokeUniform"))
+    dim_x, dim_y = width + (0.0 if uniform else stroke), height + (0.0 if uniform else stroke)
+    if not obj.get("skewX") and not obj.get("skewY"):
+        dim_x, dim_y = dim_x * obj.get("scaleX", 1.0), dim_y * obj.get("scaleY", 1.0)
+    else:
+        linear = _scale_skew(dict(obj, flipX=False, flipY=False))
+        corners = [linear.apply_point(x, y) for x, y in ((-dim_x, -dim_y), (dim_x, -dim_y), (dim_x, dim_y), (-dim_x, dim_y))]
+        dim_x = (max(c[0] for c in corners) - min(c[0] for c in corners)) / 2
+        dim_y = (max(c[1] for c in corners) - min(c[1] for c in corners)) / 2
+    post = stroke if uniform else 0.0
+    return dim_x + post, dim_y + post
+
+def object_matrix(obj: Dict[str, Any]) -> Affine2D:
+    """
+    Matriks objek fabric.js: koordinat lokal (relatif pusat objek) -> koordinat canvas.
+
+    Pusat dihitung dari (left, top) dan originX/originY seperti
+    `translateToCenterPoint`, lalu M = T(pusat) × R(angle) × S × SkewX × SkewY.
+    """
+    dim_x, dim_y = _transformed_dimensions(obj, obj.get("width", 0.0), obj.get("height", 0.0))
+    rotation = Affine2D.rotation(obj.get("angle", 0.0))
+    offset = rotation.apply_point(-_origin_offset(obj.get("originX", "left")) * dim_x,
+                                  -_origin_offset(obj.get("originY", "top")) * dim_y)
+    center = Affine2D.translation(obj.get("left", 0.0) + offset[0], obj.get("top", 0.0) + offset[1])
+    return center @ rotation @ _scale_skew(obj)
+
+# --- Path -----------------------------------------------------------------------
+
+def _path_layout(path: List[list]) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """(huruf perintah, jumlah pasangan per perintah, koordinat (n, 2)) atau None jika tidak didukung."""
+    if not path:
+        return None
+    letters = np.array([command[0] for command in path])
+    counts = np.full(len(path), -1, dtype=np.int64)
+    for letter, count in PATH_COMMANDS.items():
+        counts[letters == letter] = count
+    lengths = np.fromiter(map(len, path), dtype=np.int64, count=len(path)) - 1
+    if np.any(counts < 0) or np.any(lengths != 2 * counts):
+        return None
+    coords = np.array([value for command in path for value in command[1:]], dtype=float).reshape(-1, 2)
+    return letters, counts, coords
+
+def _bezier(p0: np.ndarray, controls: List[np.ndarray], p1: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Evaluasi Bézier kuadratik (1 kontrol) atau kubik (2 kontrol) dalam bentuk Bernstein."""
+    s = 1 - t
+    if len(controls) == 1:
+        return s * s * p0 + 2 * s * t * controls[0] + t * t * p1
+    return s * s * s * p0 + 3 * s * s * t * controls[0] + 3 * s * t * t * controls[1] + t * t * t * p1
+
+def _curve_extrema(p0: np.ndarray, controls: List[np.ndarray], p1: np.ndarray) -> np.ndarray:
+    """Titik ekstrem per sumbu pada kurva Bézier kuadratik/kubik (vektorisasi per segmen)."""
+    if len(controls) == 1:
+        c = controls[0]
+        # B'(t) = 0  ->  t = (p0 - c) / (p0 - 2c + p1)
+        denom = p0 - 2 * c + p1
+        roots = [np.divide(p0 - c, denom, out=np.full_like(p0, -1.0), where=denom != 0)]
+    else:
+        c1, c2 = controls
+        # B'(t)/3 = a t^2 + b t + k
+        a = -p0 + 3 * c1 - 3 * c2 + p1
+        b = 2 * (p0 - 2 * c1 + c2)
+        k = c1 - p0
+        disc = b * b - 4 * a * k
+        sqrt_disc = np.sqrt(np.maximum(disc, 0.0))
+        quadratic = (np.abs(a) > 1e-12) & (disc >= 0)
+        safe_a = np.where(quadratic, 2 * a, 1.0)
+        linear_t = np.divide(-k, b, out=np.full_like(b, -1.0), where=b != 0)
+        roots = [
+            np.where(quadratic, (-b + sqrt_disc) / safe_a, linear_t),
+            np.where(quadratic, (-b - sqrt_disc) / safe_a, -1.0),
+        ]
+
+    # Sumbu yang tidak memiliki ekstrem dijepit ke t = 0 (titik awal, sudah termasuk anchor)
+    return np.concatenate([
+        _bezier(p0, controls, p1, np.where((t > 0) & (t < 1), t, 0.0)) for t in roots
+    ])
+
+def path_bounds(letters: np.ndarray, counts: np.ndarray, coords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bounding box eksak path (anchor + ekstrem kurva), seperti `_calcDimensions` fabric.js.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (min (2,), max (2,))
+    """
+    ends = np.cumsum(counts) - 1
+    has_points = counts > 0
+    pieces = [coords[ends[has_points]]]
+    for letter, order in (("Q", 2), ("C", 3)):
+        segment_ends = ends[letters == letter]
+        segment_ends = segment_ends[segment_ends - order >= 0]
+        if len(segment_ends):
+            start = coords[segment_ends - order]
+            controls = [coords[segment_ends - order + i] for i in range(1, order)]
+            pieces.append(_curve_extrema(start, controls, coords[segment_ends]))
+    points = np.concatenate(pieces)
+    return points.min(axis=0), points.max(axis=0)
+
+# --- Parsing --------------------------------------------------------------------
+
+def _bounds_center(points: np.ndarray) -> np.ndarray:
+    return (points.min(axis=0) + points.max(axis=0)) / 2 if len(points) else np.zeros(2)
+
+def _local_geometry(obj: Dict[str, Any]) -> Optional[Tuple[np.ndarray, np.ndarray, Any]]:
+    """
+    Titik kontrol objek dalam koordinat objek, titik pusatnya (pathOffset), dan layout path.
+
+    Returns:
+        (points (n, 2), offset (2,), layout) atau None untuk objek yang tidak didukung.
+    """
+    kind = str(obj.get("type", "")).lower()
+    if kind == "path":
+        layout = _path_layout(obj.get("path") or [])
+        if layout is None:
+            return None
+        low, high = path_bounds(*layout)
+        return layout[2], (low + high) / 2, layout[:2]
+    if kind in ("polygon", "polyline"):
+        points = np.array([(p["x"], p["y"]) for p in obj.get("points") or []], dtype=float).reshape(-1, 2)
+        return points, _bounds_center(points), None
+    if kind == "line":
+        points = np.array([[obj.get("x1", 0.0), obj.get("y1", 0.0)],
+                           [obj.get("x2", 0.0), obj.get("y2", 0.0)]], dtype=float)
+        return points, _bounds_center(points), None
+    if kind == "rect":
+        w, h = obj.get("width", 0.0) / 2, obj.get("height", 0.0) / 2
+        return np.array([[-w, -h], [w, -h], [w, h], [-w, h]], dtype=float), np.zeros(2), None
+    if kind in ("circle", "ellipse"):
+        rx = obj.get("radius", 0.0) if kind == "circle" else obj.get("rx", 0.0)
+        ry = obj.get("radius", 0.0) if kind == "circle" else obj.get("ry", 0.0)
+        # Pusat dan ujung kedua sumbu; bayangan affine-nya menentukan elips hasil
+        return np.array([[0.0, 0.0], [rx, 0.0], [0.0, ry]]), np.zeros(2), None
+    return None
+
+
+class CanvasShapes:
+    """
+    Objek canvas yang didukung sebagai satu batch titik kontrol (koordinat canvas).
+
+    Attributes:
+        objects (List[Dict]): Semua objek JSON asli (termasuk yang tidak didukung).
+        object_ids (np.ndarray): Indeks objek untuk setiap bentuk di `batch`, (K,).
+        batch (ShapeBatch): Titik kontrol semua bentuk dalam koordinat canvas.
+        layouts (List): Layout perintah path per bentuk (None untuk non-path).
+    """
+    __slots__ = ("objects", "object_ids", "batch", "layouts")
+
+    def __init__(self, objects: List[Dict[str, Any]], object_ids: np.ndarray, batch: ShapeBatch, layouts: List[Any]):
+        self.objects = objects
+        self.object_ids = object_ids
+        self.batch = batch
+        self.layouts = layouts
+
+    def __len__(self) -> int:
+        return len(self.batch)
+
+    def __repr__(self) -> str:
+        return (f"CanvasShapes(shapes={len(self)}, points={len(self.batch.points)}, "
+                f"unsupported={self.unsupported_count})")
+
+    @property
+    def unsupported_count(self) -> int:
+        return len(self.objects) - len(self.object_ids)
+
+    def kind(self, index: int) -> str:
+        return str(self.objects[self.object_ids[index]].get("type", "")).lower()
+
+    def to_objects(self, batch: Optional[ShapeBatch] = None) -> List[Dict[str, Any]]:
+        """
+        Menulis titik (misal hasil `batch.transform`) kembali sebagai objek fabric.js.
+
+        Objek yang tidak didukung disalin apa adanya pada posisi semula.
+        """
+        batch = batch if batch is not None else self.batch
+        objects = list(self.objects)
+        for index, object_id in enumerate(self.object_ids.tolist()):
+            objects[object_id] = _write_object(self.objects[object_id], batch[index], self.layouts[index])
+        return objects
+
+
+def parse_canvas_shapes(json_data: Optional[Dict[str, Any]]) -> CanvasShapes:
+    """
+    Mengurai `json_data["objects"]` dari st_canvas menjadi CanvasShapes.
+
+    Matriks setiap objek (termasuk pathOffset) disusun menjadi stack (K, 3, 3)
+    dan diterapkan ke seluruh titik dalam satu operasi batch.
+
+    Complexity:
+        Time: O(N) untuk N total titik kontrol
+        Space: O(N)
+
+    Args:
+        json_data: Dict JSON canvas (boleh None)
+
+    Returns:
+        CanvasShapes dalam koordinat canvas
+    """
+    objects = list((json_data or {}).get("objects") or [])
+    local_points, matrices, object_ids, layouts = [], [], [], []
+    for object_id, obj in enumerate(objects):
+        geometry = _local_geometry(obj) if isinstance(obj, dict) else None
+        if geometry is None:
+            continue
+        points, offset, layout = geometry
+        local_points.append(points)
+        matrices.append(tuple(object_matrix(obj) @ Affine2D.translation(-offset[0], -offset[1])))
+        object_ids.append(object_id)
+        layouts.append(layout)
+
+    local = ShapeBatch.from_shapes(local_points)
+    stack = np.zeros((len(matrices), 3, 3))
+    if matrices:
+        stack[:, :2] = np.array(matrices).reshape(-1, 2, 3)
+        stack[:, 2, 2] = 1.0
+    return CanvasShapes(objects, np.array(object_ids, dtype=np.int64), local.transform(stack), layouts)
+
+# --- Penulisan Kembali ---------------------------------------------------------
+
+def _retyped(obj: Dict[str, Any], kind: str) -> str:
+    """Nama tipe dengan gaya huruf yang sama dengan input ('Polygon' atau 'polygon')."""
+    original = str(obj.get("type", ""))
+    return kind.capitalize() if original[:1].isupper() else kind
+
+def _placed(obj: Dict[str, Any], center: np.ndarray, width: float, height: float,
+            angle: float = 0.0, flip_y: bool = False, **geometry) -> Dict[str, Any]:
+    """Salinan objek dengan geometri baru, transformasi identitas, dan left/top sesuai origin."""
+    placed = dict(obj)
+    placed.update(geometry)
+    placed.update(width=float(width), height=float(height), angle=float(angle),
+                  scaleX=1.0, scaleY=1.0, skewX=0.0, skewY=0.0, flipX=False, flipY=bool(flip_y))
+    dim_x, dim_y = _transformed_dimensions(placed, placed["width"], placed["height"])
+    offset = Affine2D.rotation(angle).apply_point(_origin_offset(placed.get("originX", "left")) * dim_x,
+                                                  _origin_offset(placed.get("originY", "top")) * dim_y)
+    placed["left"] = float(center[0] + offset[0])
+    placed["top"] = float(center[1] + offset[1])
+    return placed
+
+def _write_polygon(obj: Dict[str, Any], points: np.ndarray, kind: str) -> Dict[str, Any]:
+    low, high = points.min(axis=0), points.max(axis=0)
+    geometry = {"type": _retyped(obj, kind), "points": [{"x": x, "y": y} for x, y in points.tolist()]}
+    placed = _placed(obj, (low + high) / 2, *(high - low), **geometry)
+    for key in ("rx", "ry", "radius", "startAngle", "endAngle"):
+        placed.pop(key, None)
+    return placed
+
+def _write_object(obj: Dict[str, Any], points: np.ndarray, layout) -> Dict[str, Any]:
+    """Objek fabric.js baru dari titik kontrol (koordinat canvas) hasil transformasi."""
+    kind = str(obj.get("type", "")).lower()
+
+    if kind == "path":
+        letters, counts = layout
+        low, high = path_bounds(letters, counts, points)
+        coords = points.ravel().tolist()
+        ends = np.cumsum(2 * counts)
+        path = [[letter, *coords[start:end]]
+                for letter, start, end in zip(letters.tolist(), (ends - 2 * counts).tolist(), ends.tolist())]
+        return _placed(obj, (low + high) / 2, *(high - low), path=path)
+
+    if kind in ("polygon", "polyline"):
+        return _write_polygon(obj, points, kind)
+
+    if kind == "line":
+        center = points.mean(axis=0)
+        (x1, y1), (x2, y2) = (points - center).tolist()
+        return _placed(obj, center, abs(x2 - x1), abs(y2 - y1), x1=x1, y1=y1, x2=x2, y2=y2)
+
+    if kind == "rect":
+        u, v = points[1] - points[0], points[3] - points[0]
+        width, height = np.hypot(*u), np.hypot(*v)
+        if abs(u @ v) > _SHAPE_TOLERANCE * max(width * height, 1.0):
+            # Rect ter-shear menjadi jajaran genjang
+            return _write_polygon(obj, points, "polygon")
+        geometry = {}
+        for key, length, old in (("rx", width, obj.get("width")), ("ry", height, obj.get("height"))):
+            if obj.get(key) and old:
+                geometry[key] = obj[key] * length / old
+        return _placed(obj, points.mean(axis=0), width, height,
+                       angle=math.degrees(math.atan2(u[1], u[0])), flip_y=(u[0] * v[1] - u[1] * v[0]) < 0,
+                       **geometry)
+
+    # circle / ellipse: bayangan affine lingkaran adalah elips dengan sumbu dari SVD [u v]
+    center, u, v = points[0], points[1] - points[0], points[2] - points[0]
+    if kind == "circle":
+        radius = float(np.hypot(*u))
+        if abs(u @ v) <= _SHAPE_TOLERANCE * max(radius * radius, 1.0) \
+                and abs(np.hypot(*v) - radius) <= 1e-9 * max(radius, 1.0):
+            return _placed(obj, center, 2 * radius, 2 * radius, angle=math.degrees(math.atan2(u[1], u[0])),
+                           flip_y=(u[0] * v[1] - u[1] * v[0]) < 0, radius=radius)
+    axes, sigma, _ = np.linalg.svd(np.column_stack([u, v]))
+    placed = _placed(obj, center, 2 * sigma[0], 2 * sigma[1], angle=math.degrees(math.atan2(axes[1, 0], axes[0, 0])),
+                     type=_retyped(obj, "ellipse"), rx=float(sigma[0]), ry=float(sigma[1]))
+    placed.pop("radius", None)
+    return placed
+
+
+# --- Flattening dan Geometri Bertipe -------------------------------------------
+
+def _segment_counts(deviation: np.ndarray, tolerance: float, factor: float) -> np.ndarray:
+    """
+    Jumlah sub-segmen seragam per kurva (rumus Wang): n = ceil(sqrt(factor * |B''| / tol)).
+
+    factor = 1/4 untuk kuadratik (|p0 - 2c + p1|) dan 3/4 untuk kubik
+    (maksimum dua beda kedua titik kontrol).
+    """
+    return np.maximum(1, np.ceil(np.sqrt(factor * deviation / tolerance))).astype(np.int64)
+
+def flatten_path(
+    letters: np.ndarray,
+    counts: np.ndarray,
+    coords: np.ndarray,
+    tolerance: float = CANVAS_FLATTEN_TOLERANCE
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Mengubah perintah path (M, L, Q, C, Z) menjadi polyline per subpath.
+
+    Setiap kurva dibagi adaptif sesuai kelengkungannya sehingga deviasi dari
+    kurva asli <= tolerance piksel; seluruh kurva dievaluasi sekaligus.
+
+    Complexity:
+        Time: O(P) untuk P titik hasil
+        Space: O(P)
+
+    Args:
+        letters: Huruf perintah (C,)
+        counts: Jumlah pasangan koordinat per perintah (C,)
+        coords: Koordinat perintah (n, 2), sudah dalam koordinat canvas
+        tolerance: Deviasi maksimum dalam piksel
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (titik (P, 2), offsets
+        subpath (S + 1,), closed (S,) bool)
+    """
+    if tolerance <= 0:
+        raise ValueError("tolerance harus positif")
+    ends = np.cumsum(counts) - 1
+    outputs = (counts > 0).astype(np.int64)
+    curves = {"Q": (letters == "Q", 0.25), "C": (letters == "C", 0.75)}
+    for letter, (mask, factor) in curves.items():
+        if mask.any():
+            end = ends[mask]
+            if letter == "Q":
+                deviation = np.linalg.norm(coords[end - 2] - 2 * coords[end - 1] + coords[end], axis=1)
+            else:
+                deviation = np.maximum(
+                    np.linalg.norm(coords[end - 3] - 2 * coords[end - 2] + coords[end - 1], axis=1),
+                    np.linalg.norm(coords[end - 2] - 2 * coords[end - 1] + coords[end], axis=1),
+                )
+            outputs[mask] = _segment_counts(deviation, tolerance, factor)
+
+    # Satu baris per titik hasil: perintah asal dan parameter t = k / n (k = 1..n)
+    command = np.repeat(np.arange(len(letters)), outputs)
+    first = np.cumsum(outputs) - outputs
+    steps = np.arange(len(command)) - first[command] + 1
+    t = (steps / outputs[command])[:, None]
+    points = coords[ends[command]]
+    for letter, (mask, _) in curves.items():
+        rows = mask[command]
+        if rows.any():
+            end = ends[command[rows]]
+            order = 2 if letter == "Q" else 3
+            controls = [coords[end - order + i] for i in range(1, order)]
+            points[rows] = _bezier(coords[end - order], controls, coords[end], t[rows])
+
+    # Subpath baru dimulai di setiap M; subpath berisi Z/z dianggap tertutup
+    subpath = np.cumsum(letters == "M")
+    point_subpath = subpath[command]
+    starts = np.flatnonzero(np.diff(point_subpath, prepend=-1))
+    offsets = np.append(starts, len(points))
+    closed = np.isin(point_subpath[starts], subpath[(letters == "Z") | (letters == "z")])
+    return points, offsets, closed
+
+def flatten_ellipse(center: np.ndarray, u: np.ndarray, v: np.ndarray,
+                    tolerance: float = CANVAS_FLATTEN_TOLERANCE) -> np.ndarray:
+    """
+    Polyline tertutup untuk elips center + u cos θ + v sin θ.
+
+    Jumlah titik dipilih agar sagitta tiap segmen <= tolerance:
+    Δθ = 2 acos(1 - tol / r), dengan r batas atas jari-jari elips.
+    """
+    radius = math.sqrt(u @ u + v @ v)
+    if radius <= tolerance:
+        return center[None, :].copy()
+    step = 2 * math.acos(max(1.0 - tolerance / radius, -1.0))
+    count = max(8, int(math.ceil(2 * math.pi / step)))
+    theta = np.linspace(0.0, 2 * math.pi, count, endpoint=False)[:, None]
+    return center + np.cos(theta) * u + np.sin(theta) * v
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+class CanvasGeometry:
+    """
+    Geometri canvas bertipe: semua objek sebagai polyline dalam satu ShapeBatch.
+
+    Dibuat oleh `parse_canvas_geometry`. Semua array read-only agar aman
+    dibagikan lewat cache.
+
+    Attributes:
+        key (str): Hash JSON canvas + toleransi (kunci cache).
+        outlines (ShapeBatch): Polyline setiap bentuk dalam koordinat canvas.
+            Bentuk tertutup tidak mengulang titik pertama di akhir.
+        kinds (np.ndarray): Tipe objek asal per bentuk ('path', 'line', ...), (K,).
+        closed (np.ndarray): Apakah bentuk tertutup (polygon, rect, circle, path dengan Z), (K,).
+        object_ids (np.ndarray): Indeks objek JSON asal per bentuk, (K,); satu path
+            dengan beberapa subpath menghasilkan beberapa bentuk.
+        unsupported_count (int): Jumlah objek yang tidak didukung (diabaikan).
+    """
+    __slots__ = ("key", "outlines", "kinds", "closed", "object_ids", "unsupported_count")
+
+    def __init__(self, key: str, outlines: ShapeBatch, kinds: np.ndarray, closed: np.ndarray,
+                 object_ids: np.ndarray, unsupported_count: int = 0):
+        self.key = key
+        self.outlines = outlines
+        self.kinds = kinds
+        self.closed = closed
+        self.object_ids = object_ids
+        self.unsupported_count = unsupported_count
+        for array in (outlines.points, outlines.offsets, kinds, closed, object_ids):
+            _frozen(array)
+
+    def __len__(self) -> int:
+        return len(self.outlines)
+
+    def __repr__(self) -> str:
+        return f"CanvasGeometry(shapes={len(self)}, points={len(self.outlines.points)})"
+
+    def polygons(self, min_points: int = 3) -> List[np.ndarray]:
+        """Bentuk dengan minimal `min_points` titik (view (n, 2)), urut sesuai objek."""
+        counts = self.outlines.counts
+        return [self.outlines[k] for k in np.flatnonzero(counts >= min_points).tolist()]
+
+    def line_segments(self) -> np.ndarray:
+        """Ujung setiap objek garis sebagai array (L, 4) berisi x1, y1, x2, y2."""
+        starts = self.outlines.offsets[:-1][self.kinds == "line"]
+        points = self.outlines.points
+        return np.hstack([points[starts], points[starts + 1]]) if len(starts) else np.empty((0, 4))
+
+    def segments(self) -> np.ndarray:
+        """Semua sisi polyline (termasuk sisi penutup bentuk tertutup), (S, 2, 2)."""
+        offsets, points = self.outlines.offsets, self.outlines.points
+        shape_of = self.outlines.shape_ids()
+        following = np.arange(1, len(points) + 1)
+        last = following == offsets[1:][shape_of]
+        following[last] = offsets[:-1][shape_of[last]]
+        keep = ~last | (self.closed[shape_of] & (self.outlines.counts[shape_of] > 2))
+        return np.stack([points[keep], points[following[keep]]], axis=1)
+
+    def bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Bounding box (min, max) semua titik; (0, 0) untuk canvas kosong."""
+        points = self.outlines.points
+        if not len(points):
+            return np.zeros(2), np.zeros(2)
+        return points.min(axis=0), points.max(axis=0)
+
+
+def geometry_key(json_data: Optional[Dict[str, Any]], *params) -> str:
+    """
+    Hash isi JSON canvas beserta parameter parsing (toleransi berbeda = kunci berbeda).
+
+    Yang di-hash adalah serialisasi pickle (>10x lebih cepat dari json.dumps
+    untuk path freedraw besar); urutan key dict dari canvas selalu sama.
+    """
+    digest = hashlib.blake2b(pickle.dumps(json_data, protocol=pickle.HIGHEST_PROTOCOL), digest_size=16)
+    digest.update(repr(params).encode())
+    return digest.hexdigest()
+
+
+def parse_canvas_geometry(
+    json_data: Optional[Dict[str, Any]],
+    tolerance: float = CANVAS_FLATTEN_TOLERANCE,
+    key: Optional[str] = None
+) -> CanvasGeometry:
+    """
+    Mengurai seluruh `json_data["objects"]` menjadi CanvasGeometry.
+
+    Titik kontrol semua objek diubah ke koordinat canvas dalam satu batch
+    (`parse_canvas_shapes`), lalu path di-flatten per subpath, lingkaran/elips
+    menjadi poligon, rect menjadi empat sudut, dan line menjadi dua titik.
+
+    Complexity:
+        Time: O(N + P) untuk N titik kontrol dan P titik hasil
+        Space: O(P)
+
+    Args:
+        json_data: Dict JSON canvas dari st_canvas (boleh None)
+        tolerance: Deviasi flattening maksimum dalam piksel
+        key: Kunci yang sudah dihitung dengan `geometry_key`
+
+    Returns:
+        CanvasGeometry
+    """
+    shapes = parse_canvas_shapes(json_data)
+    outlines, kinds, closed, object_ids = [], [], [], []
+
+    def add(points: np.ndarray, kind: str, is_closed: bool, object_id: int):
+        outlines.append(points)
+        kinds.append(kind)
+        closed.append(is_closed)
+        object_ids.append(object_id)
+
+    for index, object_id in enumerate(shapes.object_ids.tolist()):
+        kind, points = shapes.kind(index), shapes.batch[index]
+        if kind == "path":
+            flat, offsets, subpath_closed = flatten_path(*shapes.layouts[index], points, tolerance)
+            for start, end, is_closed in zip(offsets[:-1].tolist(), offsets[1:].tolist(), subpath_closed.tolist()):
+                add(flat[start:end], kind, is_closed, object_id)
+        elif kind in ("circle", "ellipse"):
+            add(flatten_ellipse(points[0], points[1] - points[0], points[2] - points[0], tolerance),
+                kind, True, object_id)
+        else:
+            add(points, kind, kind in ("polygon", "rect"), object_id)
+
+    return CanvasGeometry(
+        key=key or geometry_key(json_data, tolerance),
+        outlines=ShapeBatch.from_shapes(outlines),
+        kinds=np.array(kinds, dtype="<U8"),
+        closed=np.array(closed, dtype=bool),
+        object_ids=np.array(object_ids, dtype=np.int64),
+        unsupported_count=shapes.unsupported_count,
+    )
+
+
+def transform_canvas_json(json_data: Dict[str, Any], matrix: np.ndarray) -> Dict[str, Any]:
+    """
+    Menerapkan satu matriks 3x3 (koordinat canvas) ke semua objek canvas.
+
+    Args:
+        json_data: Dict JSON canvas dari st_canvas
+        matrix: Matriks transformasi affine 3x3
+
+    Returns:
+        Dict JSON baru (input tidak diubah) untuk `initial_drawing`
+    """
+    shapes = parse_canvas_shapes(json_data)
+    return dict(json_data, objects=shapes.to_objects(shapes.batch.transform(matrix)))
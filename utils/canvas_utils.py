@@ -2,14 +2,16 @@
 Utilitas untuk Streamlit Drawable Canvas.
 
 Berisi fungsi-fungsi untuk setup, konfigurasi, dan interaksi dengan
-komponen streamlit-drawable-canvas.
+komponen streamlit-drawable-canvas. Geometri canvas diurai oleh parser bersama
+`utils.canvas_geometry.parse_canvas_geometry` dan di-cache per hash JSON.
 """
 
 import streamlit as st
 from streamlit_drawable_canvas import st_canvas
 from typing import Dict, Any, Optional
 
-from config import CANVAS_WIDTH, CANVAS_HEIGHT, DEFAULT_COLORS
+from config import CANVAS_WIDTH, CANVAS_HEIGHT, CANVAS_FLATTEN_TOLERANCE, DEFAULT_COLORS
+from utils.canvas_geometry import CanvasGeometry, geometry_key, parse_canvas_geometry
 
 def setup_canvas(
     drawing_mode: str,
@@ -20,6 +22,7 @@ def setup_canvas(
     height: int = CANVAS_HEIGHT,
     width: int = CANVAS_WIDTH,
     initial_drawing: Optional[Dict[str, Any]] = None,
+    fill_color: str = "rgba(255, 165, 0, 0.3)",
 ) -> Any:
     """
     Mengkonfigurasi dan menampilkan komponen streamlit-drawable-canvas.
@@ -33,6 +36,7 @@ def setup_canvas(
         height (int): Tinggi canvas.
         width (int): Lebar canvas.
         initial_drawing (Optional[Dict]): Data gambar awal untuk dimuat ke canvas.
+        fill_color (str): Warna isian (untuk rect, circle, poligon).
 
     Returns:
         Any: Objek hasil dari st_canvas yang berisi data gambar.
@@ -44,7 +48,7 @@ def setup_canvas(
 
     # Menampilkan canvas
     canvas_result = st_canvas(
-        fill_color="rgba(255, 165, 0, 0.3)",  # Warna isian default (untuk poligon, dll)
+        fill_color=fill_color,
         stroke_width=stroke_width,
         stroke_color=stroke_color,
         background_color=background_color,
@@ -72,6 +76,31 @@ def get_canvas_data(canvas_result: Any) -> Optional[Dict[str, Any]]:
         return canvas_result.json_data
     return None
 
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _cached_geometry(key: str, _json_data: Optional[Dict[str, Any]], tolerance: float) -> CanvasGeometry:
+    # _json_data tidak di-hash oleh Streamlit; isinya sudah terwakili oleh key
+    return parse_canvas_geometry(_json_data, tolerance, key=key)
+
+def get_canvas_geometry(
+    canvas_result: Any,
+    tolerance: float = CANVAS_FLATTEN_TOLERANCE
+) -> CanvasGeometry:
+    """
+    Mengurai seluruh objek canvas menjadi geometri bertipe (polyline NumPy).
+
+    Hasil di-cache berdasarkan hash JSON, sehingga rerun tanpa perubahan
+    gambar tidak mengurai ulang. Canvas kosong menghasilkan geometri kosong.
+
+    Args:
+        canvas_result (Any): Objek hasil dari st_canvas.
+        tolerance (float): Deviasi flattening kurva maksimum dalam piksel.
+
+    Returns:
+        CanvasGeometry: Lihat `utils.canvas_geometry.CanvasGeometry`.
+    """
+    json_data = get_canvas_data(canvas_result)
+    return _cached_geometry(geometry_key(json_data, tolerance), json_data, tolerance)
+
 def export_canvas_to_image(canvas_result: Any):
     """
     Menyediakan tombol untuk mengunduh isi canvas sebagai gambar PNG.
@@ -23,11 +23,37 @@ def show_code(function_name: str, code_string: str):
         st.code(code_string, language='python')
         # st.code() secara internal sudah cukup baik, tombol copy ada by default.
 
+def _format_operations(operations: Any) -> str:
+    """Format jumlah operasi; None berarti diukur dalam mode timing-only."""
+    return "N/A" if operations is None else f"{int(operations):,}"
+
+def _stats_rows(stats: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Mengubah statistik dari `measure_performance` menjadi baris tabel.
+
+    Args:
+        stats (Dict[str, Any]): Statistik waktu (dan memori) hasil pengukuran.
+
+    Returns:
+        Dict[str, str]: Pasangan label metrik dan nilai terformat.
+    """
+    rows = {
+        "Waktu Min (ms)": f"{stats['min_ms']:.4f}",
+        "Waktu Median (ms)": f"{stats['median_ms']:.4f}",
+        "Waktu p95 (ms)": f"{stats['p95_ms']:.4f}",
+        "Std. Deviasi (ms)": f"{stats['stddev_ms']:.4f}",
+        "Jumlah Pengulangan": f"{stats['runs']}",
+    }
+    if "peak_memory_kb" in stats:
+        rows["Puncak Alokasi (KB)"] = f"{stats['peak_memory_kb']:.1f}"
+    return rows
+
 def show_performance_metrics(
     algorithm_name: str,
     execution_time_ms: float,
     operations: int,
-    extra_metrics: Dict[str, Any] = None
+    extra_metrics: Dict[str, Any] = None,
+    stats: Dict[str, Any] = None
 ):
     """
     Menampilkan tabel metrik performa untuk sebuah algoritma.
@@ -37,6 +63,8 @@ def show_performance_metrics(
         execution_time_ms (float): Waktu eksekusi dalam milidetik.
         operations (int): Jumlah operasi dasar atau piksel yang digambar.
         extra_metrics (Dict[str, Any], optional): Metrik tambahan (misal: memori).
+        stats (Dict[str, Any], optional): Statistik pengulangan dari
+            `measure_performance` (min/median/p95/stddev/memori).
     """
     st.subheader(f"Metrik Performa: {algorithm_name}")
 
@@ -54,10 +82,15 @@ def show_performance_metrics(
             f"{execution_time_ms:.4f}",
             complexity['time'],
             complexity['space'],
-            f"{operations:,}"
+            _format_operations(operations)
         ]
     }
 
+    if stats:
+        for key, value in _stats_rows(stats).items():
+            data["Metrik"].append(key)
+            data["Nilai"].append(value)
+
     if extra_metrics:
         for key, value in extra_metrics.items():
             data["Metrik"].append(key)
@@ -74,6 +107,7 @@ def compare_algorithms(algo_metrics: List[Dict[str, Any]]):
         algo_metrics (List[Dict[str, Any]]): List dari dictionary, di mana setiap
             dictionary berisi metrik untuk satu algoritma.
             Contoh: [{'name': 'DDA', 'time': 0.1, 'ops': 100}, ...]
+            Kunci opsional 'stats' berisi statistik dari `measure_performance`.
     """
     if not algo_metrics or len(algo_metrics) < 2:
         st.info("Membutuhkan setidaknya dua algoritma untuk dibandingkan.")
@@ -93,15 +127,24 @@ def compare_algorithms(algo_metrics: List[Dict[str, Any]]):
         "Kompleksitas Ruang"
     ]
 
+    # Baris statistik hanya ditampilkan jika tersedia
+    stats_labels = []
+    for metric in algo_metrics:
+        for label in _stats_rows(metric['stats']) if metric.get('stats') else []:
+            if label not in stats_labels:
+                stats_labels.append(label)
+    data_for_df["Metrik"] += stats_labels
+
     for metric in algo_metrics:
         name = metric['name']
         complexity = ALGORITHM_COMPLEXITIES.get(name, {"time": "N/A", "space": "N/A"})
+        stats_values = _stats_rows(metric['stats']) if metric.get('stats') else {}
         data_for_df[name] = [
             f"{metric.get('time', 0):.4f}",
-            f"{metric.get('ops', 0):,}",
+            _format_operations(metric.get('ops', 0)),
             complexity['time'],
             complexity['space']
-        ]
+        ] + [stats_values.get(label, "N/A") for label in stats_labels]
 
     df = pd.DataFrame(data_for_df)
     st.table(df.set_index("Metrik"))
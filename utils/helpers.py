@@ -1,53 +1,17 @@
 """
 File Helper untuk Fungsi-Fungsi Umum.
 
-Berisi fungsi-fungsi bantuan yang digunakan di berbagai bagian aplikasi,
-termasuk decorator untuk melacak performa, fungsi untuk memuat CSS, dll.
+Berisi fungsi-fungsi bantuan khusus Streamlit yang digunakan di berbagai
+bagian aplikasi, seperti fungsi untuk memuat CSS dan mengelola session state.
+Decorator pelacak performa berada di `utils.performance`.
 """
 
-import time
 import streamlit as st
-from functools import wraps
-from typing import Callable, Any, Dict
+from typing import Any
 
-def performance_tracker(func: Callable) -> Callable:
-    """
-    Decorator untuk mengukur waktu eksekusi dan menghitung operasi dasar.
-
-    Args:
-        func (Callable): Fungsi yang akan diukur performanya.
-
-    Returns:
-        Callable: Wrapper yang mengembalikan hasil fungsi beserta metrik performa.
-    """
-    @wraps(func)
-    def wrapper(*args, **kwargs) -> Dict[str, Any]:
-        """
-        Wrapper internal.
-        """
-        # Inisialisasi penghitung operasi (jika ada)
-        operation_count = 0
-        kwargs['operation_counter'] = {'count': 0}
-
-        # Mengukur waktu eksekusi
-        start_time = time.perf_counter()
-        result = func(*args, **kwargs)
-        end_time = time.perf_counter()
-
-        execution_time_ms = (end_time - start_time) * 1000
-        operation_count = kwargs['operation_counter']['count']
-
-        # Menghapus counter dari kwargs sebelum dikembalikan
-        del kwargs['operation_counter']
-
-        # Mengembalikan dictionary yang berisi hasil dan metrik
-        return {
-            "result": result,
-            "execution_time_ms": execution_time_ms,
-            "operations": operation_count,
-        }
-
-    return wrapper
+# Decorator & pengukuran performa ada di modul core tanpa dependensi Streamlit;
+# diekspor ulang di sini agar import lama tetap berfungsi.
+from utils.performance import performance_tracker, measure_performance
 
 def load_css(file_path: str):
     """
@@ -0,0 +1,169 @@
+"""
+Instrumentasi Performa (Core).
+
+Berisi decorator `performance_tracker` dan fungsi `measure_performance` untuk
+mengukur waktu eksekusi, jumlah operasi, dan alokasi memori. Modul ini sengaja
+hanya bergantung pada pustaka standar agar modul di `algorithms/` dapat
+diimpor dengan cepat, tanpa Streamlit, misalnya di proses worker atau benchmark.
+"""
+
+import gc
+import math
+import statistics
+import time
+import tracemalloc
+from functools import wraps
+from typing import Callable, Any, Dict, List, Optional
+
+def _summarize_timings(samples_ms: List[float]) -> Dict[str, float]:
+    """
+    Meringkas sampel waktu eksekusi menjadi statistik (min/median/p95/stddev).
+
+    Args:
+        samples_ms (List[float]): Waktu setiap pengulangan dalam milidetik.
+
+    Returns:
+        Dict[str, float]: Statistik waktu eksekusi.
+    """
+    ordered = sorted(samples_ms)
+    p95_index = max(math.ceil(0.95 * len(ordered)) - 1, 0)  # nearest-rank
+    return {
+        "runs": len(ordered),
+        "min_ms": ordered[0],
+        "median_ms": statistics.median(ordered),
+        "mean_ms": statistics.fmean(ordered),
+        "p95_ms": ordered[p95_index],
+        "stddev_ms": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+    }
+
+def measure_performance(
+    func: Callable,
+    *args,
+    repeat: int = 5,
+    time_budget_ms: Optional[float] = None,
+    count_operations: bool = False,
+    track_memory: bool = False,
+    **kwargs
+) -> Dict[str, Any]:
+    """
+    Mengukur performa sebuah fungsi dengan pengulangan dan statistik.
+
+    Jika `func` sudah dihiasi @performance_tracker, fungsi aslinya yang diukur.
+    Pengukuran waktu berjalan tanpa penghitung operasi (mode timing-only) dan
+    dengan garbage collector dimatikan. Penghitungan operasi dan pelacakan
+    alokasi (tracemalloc) masing-masing dijalankan pada pemanggilan terpisah
+    agar tidak mengganggu waktu yang diukur. Karena fungsi dipanggil berulang
+    kali, fungsi harus idempoten (tidak bergantung pada efek samping sebelumnya).
+
+    Args:
+        func (Callable): Fungsi yang akan diukur.
+        *args: Argumen posisi untuk fungsi.
+        repeat (int): Jumlah maksimum pengulangan pengukuran waktu.
+        time_budget_ms (Optional[float]): Hentikan pengulangan lebih awal setelah
+            total waktu melewati anggaran ini (minimal satu pengulangan).
+        count_operations (bool): Jalankan sekali dengan 'operation_counter'.
+        track_memory (bool): Jalankan sekali di bawah tracemalloc untuk mengukur
+            puncak alokasi memori.
+        **kwargs: Argumen keyword untuk fungsi.
+
+    Returns:
+        Dict[str, Any]: Hasil fungsi, waktu median, jumlah operasi, dan statistik.
+    """
+    target = getattr(func, "__wrapped__", func)
+    repeat = max(int(repeat), 1)
+    samples_ms: List[float] = []
+    spent_ms = 0.0
+    operations = None
+    result = None
+
+    if count_operations:
+        counter = {'count': 0}
+        start_time = time.perf_counter()
+        result = target(*args, operation_counter=counter, **kwargs)
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        operations = counter['count']
+        spent_ms += elapsed_ms
+        if repeat == 1:
+            # Hanya satu pemanggilan: gunakan pengukuran ini (perilaku klasik)
+            samples_ms.append(elapsed_ms)
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while len(samples_ms) < repeat:
+            if samples_ms and time_budget_ms is not None and spent_ms >= time_budget_ms:
+                break
+            start_time = time.perf_counter()
+            result = target(*args, **kwargs)
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            samples_ms.append(elapsed_ms)
+            spent_ms += elapsed_ms
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    stats: Dict[str, Any] = _summarize_timings(samples_ms)
+
+    if track_memory:
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        target(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+        if not was_tracing:
+            tracemalloc.stop()
+        stats["peak_memory_kb"] = (peak - baseline) / 1024
+
+    return {
+        "result": result,
+        "execution_time_ms": stats["median_ms"],
+        "operations": operations,
+        "stats": stats,
+    }
+
+def performance_tracker(
+    func: Optional[Callable] = None,
+    *,
+    repeat: int = 1,
+    time_budget_ms: Optional[float] = None,
+    count_operations: bool = True,
+    track_memory: bool = False
+) -> Callable:
+    """
+    Decorator untuk mengukur waktu eksekusi dan menghitung operasi dasar.
+
+    Dapat dipakai langsung (`@performance_tracker`) atau dengan opsi
+    (`@performance_tracker(repeat=10, count_operations=False)`). Tanpa opsi,
+    fungsi dipanggil sekali dengan penghitung operasi seperti sebelumnya.
+
+    Args:
+        func (Callable): Fungsi yang akan diukur performanya.
+        repeat (int): Jumlah maksimum pengulangan pengukuran waktu.
+        time_budget_ms (Optional[float]): Anggaran total waktu pengulangan.
+        count_operations (bool): False untuk mode timing-only tanpa penghitung.
+        track_memory (bool): Ukur puncak alokasi dengan tracemalloc.
+
+    Returns:
+        Callable: Wrapper yang mengembalikan hasil fungsi beserta metrik performa.
+    """
+    def decorator(target: Callable) -> Callable:
+        @wraps(target)
+        def wrapper(*args, **kwargs) -> Dict[str, Any]:
+            """
+            Wrapper internal.
+            """
+            return measure_performance(
+                target, *args,
+                repeat=repeat,
+                time_budget_ms=time_budget_ms,
+                count_operations=count_operations,
+                track_memory=track_memory,
+                **kwargs
+            )
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
@@ -0,0 +1,151 @@
+"""
+Pipeline Ingest Tekstur.
+
+Mendekode gambar (upload atau file) satu kali menjadi array NumPy uint8
+RGB/RGBA dengan resolusi maksimum tertentu, ditambah thumbnail untuk preview.
+JPEG besar didekode langsung pada skala kecil dengan `Image.draft()` (DCT
+scaling), sehingga 6000x4000 piksel tidak pernah didekode penuh. Setiap hasil
+diberi kunci hash isi file agar dapat di-cache bersama antar rerun dan sesi.
+
+Modul ini tidak bergantung pada Streamlit; caching dilakukan di halaman.
+"""
+
+import hashlib
+import io
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Tuple
+
+from config import TEXTURE_MAX_SIZE, TEXTURE_THUMBNAIL_SIZE
+
+@dataclass(frozen=True)
+class TextureAsset:
+    """
+    Tekstur yang sudah dinormalisasi dan siap dipakai sampler.
+
+    Attributes:
+        key (str): Hash isi sumber + parameter ingest (kunci cache).
+        texture (np.ndarray): Piksel uint8 read-only (H, W, 3) atau (H, W, 4).
+        thumbnail (np.ndarray): Preview uint8 read-only, sisi terpanjang <= ukuran thumbnail.
+        source_size (Tuple[int, int]): (width, height) gambar asli sebelum diperkecil.
+        source_mode (str): Mode PIL gambar asli (misal 'RGB', 'P', 'CMYK').
+    """
+    key: str
+    texture: np.ndarray = field(repr=False)
+    thumbnail: np.ndarray = field(repr=False)
+    source_size: Tuple[int, int]
+    source_mode: str
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """(width, height) tekstur setelah ingest."""
+        return self.texture.shape[1], self.texture.shape[0]
+
+    @property
+    def mode(self) -> str:
+        return "RGBA" if self.texture.shape[2] == 4 else "RGB"
+
+    @property
+    def nbytes(self) -> int:
+        return self.texture.nbytes + self.thumbnail.nbytes
+
+def content_key(data: bytes, *params) -> str:
+    """Hash isi file beserta parameter ingest (ukuran berbeda = kunci berbeda)."""
+    digest = hashlib.blake2b(data, digest_size=16)
+    digest.update(repr(params).encode())
+    return digest.hexdigest()
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    array = np.ascontiguousarray(array, dtype=np.uint8)
+    array.setflags(write=False)
+    return array
+
+def _fit_within(image, max_size: int):
+    """Memperkecil gambar (rasio tetap) agar sisi terpanjang <= max_size."""
+    from PIL import Image
+
+    if max(image.size) <= max_size:
+        return image
+    image = image.copy()
+    # reducing_gap: reduksi integer cepat (Image.reduce) sebelum resampling akhir
+    image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS, reducing_gap=2.0)
+    return image
+
+def _normalize_mode(image, keep_alpha: bool):
+    """Mengubah mode apa pun (P, L, LA, CMYK, I;16, ...) menjadi RGB atau RGBA."""
+    has_alpha = image.mode in ("RGBA", "LA", "PA") or (image.mode == "P" and "transparency" in image.info)
+    target = "RGBA" if keep_alpha and has_alpha else "RGB"
+    if image.mode == "P" or image.mode == target:
+        return image.convert(target)
+    if image.mode.startswith("I") or image.mode == "F":
+        # Gambar 16/32-bit: skalakan ke 0-255 sebelum dikonversi
+        array = np.asarray(image, dtype=np.float64)
+        peak = array.max() if array.size and array.max() > 0 else 1.0
+        from PIL import Image
+        image = Image.fromarray(np.clip(array * (255.0 / peak), 0, 255).astype(np.uint8), "L")
+    return image.convert(target)
+
+def load_texture(
+    data: bytes,
+    max_size: int = TEXTURE_MAX_SIZE,
+    thumbnail_size: int = TEXTURE_THUMBNAIL_SIZE,
+    keep_alpha: bool = False,
+    key: str = None
+) -> TextureAsset:
+    """
+    Mendekode file gambar menjadi TextureAsset.
+
+    Complexity:
+        Time: O(W * H) piksel hasil draft (untuk JPEG sekitar max_size^2, bukan ukuran asli).
+        Space: O(max_size^2)
+
+    Args:
+        data (bytes): Isi file gambar (PNG, JPEG, ...).
+        max_size (int): Sisi terpanjang maksimum tekstur.
+        thumbnail_size (int): Sisi terpanjang maksimum thumbnail.
+        keep_alpha (bool): Pertahankan kanal alpha (RGBA) jika gambar memilikinya.
+        key (str, optional): Kunci yang sudah dihitung dengan `content_key`.
+
+    Returns:
+        TextureAsset: Tekstur uint8 dan thumbnail-nya.
+    """
+    from PIL import Image, ImageOps
+
+    if max_size < 1 or thumbnail_size < 1:
+        raise ValueError("max_size dan thumbnail_size harus positif")
+
+    image = Image.open(io.BytesIO(data))
+    source_size, source_mode = image.size, image.mode
+    if image.format == "JPEG":
+        # Dekode langsung pada skala 1/2, 1/4, atau 1/8 yang masih >= max_size
+        scale = max_size / max(source_size)
+        if scale < 1:
+            image.draft("RGB", (max(1, int(source_size[0] * scale)), max(1, int(source_size[1] * scale))))
+    image = ImageOps.exif_transpose(image)
+    image = _fit_within(_normalize_mode(image, keep_alpha), max_size)
+    thumbnail = _fit_within(image, thumbnail_size)
+
+    return TextureAsset(
+        key=key or content_key(data, max_size, thumbnail_size, keep_alpha),
+        texture=_frozen(np.asarray(image)),
+        thumbnail=_frozen(np.asarray(thumbnail)),
+        source_size=source_size,
+        source_mode=source_mode,
+    )
+
+def texture_from_array(texture: np.ndarray, thumbnail_size: int = TEXTURE_THUMBNAIL_SIZE) -> TextureAsset:
+    """Membungkus array uint8 (H, W, 3|4) yang dibuat program sebagai TextureAsset."""
+    from PIL import Image
+
+    texture = _frozen(texture)
+    if texture.ndim != 3 or texture.shape[2] not in (3, 4):
+        raise ValueError("Tekstur harus berbentuk (H, W, 3) atau (H, W, 4)")
+    image = Image.fromarray(texture)
+    thumbnail = _fit_within(image, thumbnail_size)
+    return TextureAsset(
+        key=content_key(texture.tobytes(), texture.shape, thumbnail_size),
+        texture=texture,
+        thumbnail=_frozen(np.asarray(thumbnail)),
+        source_size=image.size,
+        source_mode=image.mode,
+    )